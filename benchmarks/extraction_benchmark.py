@@ -0,0 +1,86 @@
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.fixture_pages import FixturePages
+from enums.extraction_modes import ExtractionModes
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.extraction_handler import ExtractionHandler
+from providers.source_handler import SourceHandler
+
+CARDS = 10
+
+
+def count_commands(driver, function) -> Counter:
+    """
+    Counts the WebDriver commands issued while invoking a function.
+
+    :param driver: Specify the web driver to observe
+    :param function: Specify the function to invoke
+    :returns: The number of issued commands, keyed by the command name
+    :rtype: Counter
+    """
+    commands = Counter()
+    execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        commands[driver_command] += 1
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+    try:
+        function()
+    finally:
+        del driver.execute
+
+    return commands
+
+
+def benchmark(driver, name: str, html: str, list_class: str, fields: dict[str, dict]):
+    """
+    Prints the number of WebDriver commands per profile for every extraction mode.
+
+    :param driver: Specify the web driver to use
+    :param str name: Specify the fixture name
+    :param str html: Specify the fixture page's HTML
+    :param str list_class: Specify the class of the list element which contains the cards
+    :param dict[str, dict] fields: Specify the fields to extract
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f'{name}.html'
+        path.write_text(html, encoding='utf-8')
+        driver.get(path.as_uri())
+
+        for mode in ExtractionModes:
+            commands = count_commands(
+                driver,
+                lambda: ExtractionHandler.extract_cards(driver.find_element(By.CLASS_NAME, list_class), fields,
+                                                        mode=mode.value)
+            )
+            print(f'{name:<16}{mode.value:<8}{sum(commands.values()) / CARDS:>8.1f} commands/profile')
+
+
+if __name__ == '__main__':
+    endpoints = ConfigurationHandler.get_configuration()['endpoints']
+    web_driver = DriverHandler.get_driver()
+
+    benchmark(
+        web_driver,
+        'peopleSearch',
+        FixturePages.people_search(CARDS),
+        endpoints['peopleSearch']['listClass'],
+        SourceHandler.get_fields('peopleSearch', connect=True)
+    )
+
+    benchmark(
+        web_driver,
+        'companyPeople',
+        FixturePages.company_people(CARDS),
+        endpoints['companyPeople']['listClass'],
+        SourceHandler.get_fields('companyPeople', connect=True)
+    )
+
+    web_driver.quit()
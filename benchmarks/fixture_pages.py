@@ -0,0 +1,357 @@
+import json
+from html import escape
+
+from providers.configuration_handler import ConfigurationHandler
+
+LINKEDIN_URL = 'https://www.linkedin.com'
+
+# Placeholder of the card index in the card templates rendered by the infinite scroll script
+INDEX = '__INDEX__'
+
+# Connect, accept, ignore and withdraw buttons either open a confirmation dialog or change their own text, the dialog
+# is appended to the body like LinkedIn's modals, and resolving it removes the card of a button marked data-remove
+ACTIONS_SCRIPT = '''
+let pending = null;
+
+document.addEventListener('click', (event) => {
+    const button = event.target.closest('button');
+    if (!button) {
+        return;
+    }
+
+    const {action, confirm, result} = button.dataset;
+
+    if (action === 'toggle') {
+        button.querySelector('span').innerText = result;
+    } else if (action === 'dialog') {
+        pending = button;
+        const dialog = document.createElement('div');
+        dialog.id = 'dialog';
+        dialog.innerHTML = '<button data-action="resolve"><span></span></button>';
+        dialog.querySelector('span').innerText = confirm;
+        document.body.append(dialog);
+    } else if (action === 'resolve') {
+        document.getElementById('dialog').remove();
+        if (pending.dataset.remove !== undefined) {
+            pending.closest('li').remove();
+        } else {
+            const span = document.createElement('span');
+            span.innerText = pending.dataset.result;
+            pending.replaceWith(span);
+        }
+        pending = null;
+    }
+});
+'''
+
+# Appends a batch of cards after the render delay whenever the page is scrolled to the bottom, until the total is met
+SCROLL_SCRIPT = '''
+const loadMore = (selector, template, count, total, delay) => {
+    let loaded = count;
+    let loading = false;
+
+    window.addEventListener('scroll', () => {
+        if (loading || loaded >= total ||
+            window.innerHeight + window.scrollY < document.body.scrollHeight - 10) {
+            return;
+        }
+
+        loading = true;
+        setTimeout(() => {
+            const list = document.querySelector(selector);
+            const batch = Math.min(count, total - loaded);
+            for (let i = loaded; i < loaded + batch; i++) {
+                list.insertAdjacentHTML('beforeend', template.split('__INDEX__').join(i));
+            }
+            loaded += batch;
+            loading = false;
+        }, delay);
+    });
+};
+'''
+
+
+class FixturePages:
+    """
+    Static methods which renders local stand-in pages matching the selectors in config.json, the pages of a source
+    endpoint link to stand-in profile pages under the base URL.
+
+    Methods
+    -------
+        __classes(value: str) -> str:
+            Converts a compound class name from config.json into an HTML class attribute value.
+        __document(body: str, script: str = '', render_delay: float = 0) -> str:
+            Wraps the body of a page into a document.
+        __button(endpoint: str, text: str) -> str:
+            Renders a card's connect button, which confirms if the endpoint declares confirmInnerHTML.
+        __infinite_scroll(selector: str, card, count: int, total: int, render_delay: float) -> tuple[str, str]:
+            Renders the first batch of cards, and the script which appends the remaining ones.
+        people_search(count: int = 10, page: int = 1, pages: int = 1, base: str = LINKEDIN_URL,
+        prefix: str = 'person', render_delay: float = 0) -> str:
+            Renders a people search results page.
+        company_people(count: int = 10, total: int = 0, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+            Renders a company people page.
+        suggestions(count: int = 10, total: int = 0, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+            Renders the my network page, including the suggestions section.
+        profile(slug: str, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+            Renders a profile page.
+        invitations(endpoint: str, count: int = 10, total: int = 0, base: str = LINKEDIN_URL,
+        render_delay: float = 0) -> str:
+            Renders a received or sent invitations page.
+    """
+
+    @staticmethod
+    def __classes(value: str) -> str:
+        """
+        Converts a compound class name from config.json into an HTML class attribute value.
+
+        :param str value: Specify the compound class name, e.g. 'first.second'
+        :returns: The space separated class names
+        :rtype: str
+        """
+        return escape(value.replace('.', ' '))
+
+    @staticmethod
+    def __document(body: str, script: str = '', render_delay: float = 0) -> str:
+        """
+        Wraps the body of a page into a document, the cards are tall enough for the page to scroll.
+
+        :param str body: Specify the page's content
+        :param str script: Specify the page's script, evaluated after the action buttons' script
+        :param float render_delay: Specify the seconds until the content is rendered, zero renders it with the page
+        :returns: The page's HTML
+        :rtype: str
+        """
+        if render_delay:
+            body = f'<template id="content">{body}</template>'
+            script = f'setTimeout(() => document.body.append(document.getElementById("content").content), ' \
+                     f'{render_delay * 1000:.0f});\n{script}'
+
+        return f'<html><head><style>li {{ min-height: 160px; }}</style></head><body>{body}' \
+               f'<script>{ACTIONS_SCRIPT}{script}</script></body></html>'
+
+    @staticmethod
+    def __button(endpoint: str, text: str) -> str:
+        """
+        Renders a card's connect button, which confirms if the endpoint declares confirmInnerHTML, otherwise it
+        changes its text once clicked.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str text: Specify the button's text, e.g. the connectInnerHTML value of the endpoint
+        :returns: The button's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+
+        if text == configuration['connectInnerHTML'] and 'confirmInnerHTML' in configuration:
+            action = f'data-action="dialog" data-confirm="{escape(configuration["confirmInnerHTML"])}"'
+        elif text == configuration['connectInnerHTML']:
+            action = 'data-action="toggle"'
+        else:
+            action = ''
+
+        button_class = configuration.get('buttonClass', '')
+
+        return f'<button class="{FixturePages.__classes(button_class)}" {action} data-result="Pending">' \
+               f'<span>{escape(text)}</span></button>'
+
+    @staticmethod
+    def __infinite_scroll(selector: str, card, count: int, total: int, render_delay: float) -> tuple[str, str]:
+        """
+        Renders the first batch of cards, and the script which appends the remaining ones once scrolled.
+
+        :param str selector: Specify the CSS selector of the list element
+        :param card: Specify the card renderer, receives the card index as a string
+        :param int count: Specify the number of cards in a batch
+        :param int total: Specify the total number of cards, zero renders a single batch
+        :param float render_delay: Specify the seconds until a batch is appended
+        :returns: The first batch's HTML and the script
+        :rtype: tuple[str, str]
+        """
+        cards = ''.join(card(str(i)) for i in range(count))
+        script = f'{SCROLL_SCRIPT}loadMore({json.dumps(selector)}, {json.dumps(card(INDEX))}, {count}, ' \
+                 f'{max(total, count)}, {render_delay * 1000:.0f});'
+
+        return cards, script
+
+    @staticmethod
+    def people_search(count: int = 10, page: int = 1, pages: int = 1, base: str = LINKEDIN_URL,
+                      prefix: str = 'person', render_delay: float = 0) -> str:
+        """
+        Renders a people search results page, every fifth card shows the message button instead.
+
+        :param int count: Specify the number of cards in the page
+        :param int page: Specify the page number, used to generate unique profiles
+        :param int pages: Specify the total number of pages shown in the pagination control
+        :param str base: Specify the URL which the profile links are relative to
+        :param str prefix: Specify the prefix of the generated profile names
+        :param float render_delay: Specify the seconds until the results are rendered
+        :returns: The page's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints']['peopleSearch']
+        classes = FixturePages.__classes
+
+        cards = ''.join(
+            '<li>'
+            f'<div class="{classes(configuration["nameClass"])}">'
+            f'<span><a href="{base}/in/{prefix}-{page}-{i}?miniProfile=1">'
+            f'<span><span>{escape(prefix.title())} {page}-{i}</span></span></a></span>'
+            '</div>'
+            f'<div class="{classes(configuration["headlineClass"])}">Headline {page}-{i}</div>'
+            + FixturePages.__button('peopleSearch', configuration['messageInnerHTML' if i % 5 == 4 else
+                                                                  'connectInnerHTML']) +
+            '</li>'
+            for i in range(count)
+        )
+        pagination = ''.join(f'<li><button><span>{i}</span></button></li>' for i in range(1, pages + 1))
+
+        return FixturePages.__document(
+            f'<ul class="{classes(configuration["listClass"])}">{cards}</ul>'
+            f'<ul class="{classes(configuration["paginationInnerHTML"])}">{pagination}</ul>',
+            render_delay=render_delay
+        )
+
+    @staticmethod
+    def company_people(count: int = 10, total: int = 0, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+        """
+        Renders a company people page, every seventh card of the first batch is a first degree connection.
+
+        :param int count: Specify the number of cards in the page, and in every batch loaded once scrolled
+        :param int total: Specify the total number of cards loaded by scrolling, zero renders a single batch
+        :param str base: Specify the URL which the profile links are relative to
+        :param float render_delay: Specify the seconds until the page and every further batch are rendered
+        :returns: The page's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints']['companyPeople']
+        classes = FixturePages.__classes
+
+        def card(i: str) -> str:
+            degree = configuration['firstDegreeInnerHTML'] if i.isdigit() and int(i) % 7 == 6 else '2nd'
+            return '<li>' \
+                   f'<a class="{classes(configuration["linkClass"])}" href="{base}/in/employee-{i}">' \
+                   f'<div class="{classes(configuration["nameClass"])}">Employee {i}</div></a>' \
+                   f'<div class="{classes(configuration["headlineClass"])}">Headline {i}</div>' \
+                   f'<span class="{classes(configuration["degreeClass"])}">{escape(degree)}</span>' \
+                   + FixturePages.__button('companyPeople', configuration['connectInnerHTML']) + \
+                   '</li>'
+
+        cards, script = FixturePages.__infinite_scroll('.' + configuration['listClass'], card, count, total,
+                                                       render_delay)
+
+        return FixturePages.__document(f'<ul class="{classes(configuration["listClass"])}">{cards}</ul>', script,
+                                       render_delay)
+
+    @staticmethod
+    def suggestions(count: int = 10, total: int = 0, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+        """
+        Renders the my network page, a section of unrelated cards precedes the suggestions section.
+
+        :param int count: Specify the number of suggestions in the page, and in every batch loaded once scrolled
+        :param int total: Specify the total number of suggestions loaded by scrolling, zero renders a single batch
+        :param str base: Specify the URL which the profile links are relative to
+        :param float render_delay: Specify the seconds until the page and every further batch are rendered
+        :returns: The page's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints']['suggestions']
+        classes = FixturePages.__classes
+
+        def card(i: str, prefix: str = 'suggestion') -> str:
+            return '<li>' \
+                   f'<a class="{classes(configuration["linkClass"])}" href="{base}/in/{prefix}-{i}">' \
+                   f'<span class="{classes(configuration["nameClass"])}">{prefix.title()} {i}</span>' \
+                   f'<span class="{classes(configuration["headlineClass"])}">Headline {i}</span></a>' \
+                   '<button><span>Dismiss</span></button>' \
+                   + FixturePages.__button('suggestions', configuration['connectInnerHTML']) + \
+                   '</li>'
+
+        cards, script = FixturePages.__infinite_scroll(
+            '#suggestions .' + configuration['listClass'], card, count, total, render_delay
+        )
+        unrelated = ''.join(card(str(i), 'colleague') for i in range(2))
+
+        return FixturePages.__document(
+            '<section><div><h2>People you may know from your company</h2></div>'
+            f'<ul class="{classes(configuration["listClass"])}">{unrelated}</ul></section>'
+            f'<section id="suggestions"><div><h2>{escape(configuration["headerInnerHTML"])}</h2></div>'
+            f'<ul class="{classes(configuration["listClass"])}">{cards}</ul></section>',
+            script,
+            render_delay
+        )
+
+    @staticmethod
+    def profile(slug: str, base: str = LINKEDIN_URL, render_delay: float = 0) -> str:
+        """
+        Renders a profile page, its connections link leads to a people search filtered by the profile.
+
+        :param str slug: Specify the profile name
+        :param str base: Specify the URL which the connections link is relative to
+        :param float render_delay: Specify the seconds until the page is rendered
+        :returns: The page's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints']
+        profile_configuration = configuration['profile']
+        classes = FixturePages.__classes
+
+        connect = f'<button data-action="dialog" data-confirm="{escape(profile_configuration["confirmInnerHTML"])}" ' \
+                  f'data-result="Pending"><span>{escape(profile_configuration["connectInnerHTML"])}</span></button>'
+
+        return FixturePages.__document(
+            f'<h1>{escape(slug)}</h1>'
+            f'<ul class="{classes(configuration["profileConnections"]["connectionsIndicatorClass"])}">'
+            f'<li><a href="{base}/search/results/people/?connectionOf={escape(slug)}'
+            f'{escape(configuration["profileConnections"]["degreeQueryString"])}F">500+ connections</a></li></ul>'
+            # The first connect button is part of the top card, the second one of the actions menu
+            f'<div>{connect}</div><div>{connect}</div>',
+            render_delay=render_delay
+        )
+
+    @staticmethod
+    def invitations(endpoint: str, count: int = 10, total: int = 0, base: str = LINKEDIN_URL,
+                    render_delay: float = 0) -> str:
+        """
+        Renders a received or sent invitations page, an invitation is removed from the list once actioned, and the
+        n-th sent invitation was sent n weeks ago.
+
+        :param str endpoint: Specify the endpoint name, either receivedInvitations or sentInvitations
+        :param int count: Specify the number of invitations in the first batch, and in every further batch
+        :param int total: Specify the total number of invitations, zero renders a single batch
+        :param str base: Specify the URL which the profile links are relative to
+        :param float render_delay: Specify the seconds until the page, or a further batch, is rendered
+        :returns: The page's HTML
+        :rtype: str
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+        classes = FixturePages.__classes
+
+        if endpoint == 'receivedInvitations':
+            actions = [('ignoreInnerHTML', 'ignoreConfirmationInnerHTML', 'Ignored'),
+                       ('acceptInnerHTML', 'acceptConfirmationInnerHTML', 'Accepted')]
+        else:
+            actions = [('withdrawInnerHTML', 'withdrawConfirmationInnerHTML', 'Withdrawn')]
+
+        buttons = ''.join(
+            f'<button data-action="dialog" data-confirm="{escape(configuration[confirm])}" data-result="{result}" '
+            f'data-remove><span>{escape(configuration[text])}</span></button>'
+            for text, confirm, result in actions
+        )
+
+        def card(i: str) -> str:
+            age = f'<span class="{classes(configuration["ageClass"])}">Sent {i} weeks ago</span>' \
+                if 'ageClass' in configuration else ''
+
+            return '<li>' \
+                   f'<a class="{classes(configuration["linkClass"])}" href="{base}/in/{endpoint.lower()}-{i}">' \
+                   f'<span class="{classes(configuration["nameClass"])}">Invitation {i}</span></a>' \
+                   f'<span class="{classes(configuration["headlineClass"])}">Headline {i}</span>' \
+                   f'{age}{buttons}' \
+                   '</li>'
+
+        selector = '.' + configuration['listClass']
+        cards, script = FixturePages.__infinite_scroll(selector, card, count, total, render_delay)
+
+        return FixturePages.__document(f'<ul class="{classes(configuration["listClass"])}">{cards}</ul>', script,
+                                       render_delay)
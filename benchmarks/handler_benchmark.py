@@ -0,0 +1,197 @@
+import argparse
+import atexit
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.fixture_pages import LINKEDIN_URL
+from benchmarks.stand_in_server import StandInServer
+from components.connection_handler import ConnectionHandler
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.metrics_handler import MetricsHandler
+
+# Benchmark name => (ConnectionHandler method, arguments), every handler takes action on the stand-in pages
+HANDLERS = {
+    'suggestions': ('handle_suggestions', {'connect': True}),
+    'people-search': ('handle_people_search', {'connect': True}),
+    'profile-connections': ('handle_profile_connections', {'connect': True}),
+    'company-people': ('handle_company_people', {'connect': True}),
+    'received-invitations': ('handle_received_invitations', {'accept': True}),
+    'sent-invitations': ('handle_sent_invitations', {'withdraw': True}),
+}
+
+RESULTS_FILE = './benchmarks/results.jsonl'
+
+
+def configure(url: str, directory: str):
+    """
+    Points every endpoint to the stand-in server, writes every generated file to a scratch directory, and lifts the
+    action scheduler's rate limits, without modifying config.json.
+
+    :param str url: Specify the base URL of the stand-in server
+    :param str directory: Specify the scratch directory
+    """
+    configuration = ConfigurationHandler.get_configuration()
+
+    overrides = {
+        'metrics.enabled': True,
+        'metrics.summaryFile': os.path.join(directory, 'metrics.json'),
+        'metrics.prometheusFile': os.path.join(directory, 'metrics.prom'),
+        'outputDirectory': directory,
+        'checkpointDirectory': os.path.join(directory, 'checkpoints'),
+        'profileStore': os.path.join(directory, 'profiles.db'),
+        'skipKnownProfiles': False,
+        'actionScheduler.quotaFile': os.path.join(directory, 'action_quota.json'),
+        'actionScheduler.jitter': 0,
+        'endpoints.longin.cookieJar': '',
+        'sessionPool.cookieDomainURL': f'{url}/',
+        'companyNames': ['stand-in'],
+        'profileNames': ['stand-in'],
+    }
+
+    for action in configuration['actionScheduler']['actions']:
+        overrides[f'actionScheduler.actions.{action}.perHour'] = -1
+        overrides[f'actionScheduler.actions.{action}.weeklyLimit'] = -1
+
+    for endpoint, endpoint_configuration in configuration['endpoints'].items():
+        if 'url' in endpoint_configuration:
+            overrides[f'endpoints.{endpoint}.url'] = endpoint_configuration['url'].replace(LINKEDIN_URL, url)
+
+    for key, value in overrides.items():
+        ConfigurationHandler.set_value(key, value)
+
+
+def get_commit():
+    """
+    Provides the current commit of the repository.
+
+    :returns: The abbreviated commit hash, None if it cannot be determined
+    :rtype: Optional[str]
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(server: StandInServer, name: str) -> dict:
+    """
+    Runs a handler end to end against the stand-in server.
+
+    :param StandInServer server: Specify the running stand-in server
+    :param str name: Specify the benchmark name, e.g. people-search
+    :returns: The wall time, the number of profiles, WebDriver commands and requests, and the peak memory allocated
+              by the handler
+    :rtype: dict
+    """
+    method, arguments = HANDLERS[name]
+
+    before = MetricsHandler.get_summary()
+    requests = server.requests
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+
+    error = None
+    try:
+        getattr(ConnectionHandler, method)(**arguments)
+    except Exception as exception:
+        error = repr(exception)
+
+    wall_time = time.perf_counter() - started
+    after = MetricsHandler.get_summary()
+    profiles = after['profiles'] - before['profiles']
+    commands = after['commands'] - before['commands']
+
+    return {
+        'wallSeconds': wall_time,
+        'profiles': profiles,
+        'commands': commands,
+        'commandsPerProfile': commands / profiles if profiles else 0.0,
+        'requests': server.requests - requests,
+        'peakMemoryMB': tracemalloc.get_traced_memory()[1] / 2 ** 20,
+        'error': error,
+    }
+
+
+def benchmark(names: list[str], settings: dict, results_file: str):
+    """
+    Runs the handlers against a stand-in server, prints their results next to the previous run with the same
+    settings, and appends the results to the results file.
+
+    :param list[str] names: Specify the benchmark names, e.g. people-search
+    :param dict settings: Specify the stand-in server's settings, the keyword arguments of StandInServer
+    :param str results_file: Specify the JSON lines file which keeps the results of every run
+    """
+    directory = tempfile.mkdtemp(prefix='linkedin-benchmark-')
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+
+    previous = {}
+    if os.path.exists(results_file):
+        with open(results_file, encoding='utf-8') as file:
+            for line in file:
+                record = json.loads(line)
+                if record['settings'] == settings:
+                    previous.update(record['handlers'])
+
+    tracemalloc.start()
+
+    with StandInServer(**settings) as server:
+        configure(server.url, directory)
+
+        handlers = {}
+        try:
+            for name in names:
+                handlers[name] = run(server, name)
+
+                result = handlers[name]
+                baseline = f'{previous[name]["wallSeconds"]:>8.2f} s before' if name in previous else ''
+                print(f'{name:<24}{result["wallSeconds"]:>8.2f} s{baseline:>16}{result["profiles"]:>6} profiles'
+                      f'{result["commandsPerProfile"]:>8.1f} commands/profile{result["peakMemoryMB"]:>8.1f} MB'
+                      f'{"  " + result["error"] if result["error"] else ""}')
+        finally:
+            DriverHandler.get_driver().quit()
+
+    configuration = ConfigurationHandler.get_configuration()
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': get_commit(),
+        'webDriver': configuration['webDriver'],
+        'extractionMode': configuration['extractionMode'],
+        'pipeline': configuration['pipeline']['enabled'],
+        'settings': settings,
+        'handlers': handlers,
+    }
+
+    os.makedirs(os.path.dirname(results_file) or '.', exist_ok=True)
+    with open(results_file, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.handler_benchmark',
+        description='Runs the ConnectionHandler workflows end to end against a local LinkedIn stand-in.'
+    )
+    parser.add_argument('--handlers', nargs='+', choices=HANDLERS, default=list(HANDLERS),
+                        help='handlers to run (default: all)')
+    parser.add_argument('--latency', type=float, default=0, help='seconds every response is held back (default: 0)')
+    parser.add_argument('--render-delay', type=float, default=0,
+                        help='seconds until a page, or a further infinite scroll batch, is rendered (default: 0)')
+    parser.add_argument('--cards', type=int, default=10, help='cards per page or scroll batch (default: 10)')
+    parser.add_argument('--pages', type=int, default=3, help='pages per people search (default: 3)')
+    parser.add_argument('--total', type=int, default=30, help='cards per infinite scroll (default: 30)')
+    parser.add_argument('--results', default=RESULTS_FILE, help=f'results file (default: {RESULTS_FILE})')
+
+    arguments = parser.parse_args()
+
+    benchmark(arguments.handlers,
+              {'latency': arguments.latency, 'render_delay': arguments.render_delay, 'cards': arguments.cards,
+               'pages': arguments.pages, 'total': arguments.total},
+              arguments.results)
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+# Command line arguments => budget in milliseconds for the cumulative import time, interpreter startup included
+BUDGETS = {
+    ('--help',): 100,
+    ('--dry-run', 'company-people', '--connect'): 100,
+}
+
+# Modules which must not be imported unless a workflow actually runs
+HEAVY_MODULES = ['selenium', 'webdriver_manager', 'pandas', 'pyautogui']
+
+
+def measure(arguments: tuple) -> dict[str, int]:
+    """
+    Measures the cumulative import time of every top level module imported by the command line interface.
+
+    :param tuple arguments: Specify the command line arguments
+    :returns: The cumulative import time in microseconds, keyed by the top level module name
+    :rtype: dict[str, int]
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'main', *arguments],
+                             capture_output=True, text=True)
+
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        # Nested modules are indented below their importer
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+def benchmark() -> bool:
+    """
+    Prints the import time of every budgeted command line, and whether it is within its budget.
+
+    :returns: True if every command line is within its budget and imports none of the heavy modules
+    :rtype: bool
+    """
+    passed = True
+
+    for arguments, budget in BUDGETS.items():
+        modules = measure(arguments)
+        total = sum(modules.values()) / 1000
+        heavy = [module for module in modules if module.split('.')[0] in HEAVY_MODULES]
+
+        within_budget = total <= budget and not heavy
+        passed &= within_budget
+
+        print(f'{" ".join(arguments):<40}{total:>8.1f} ms / {budget} ms  {"ok" if within_budget else "FAILED"}')
+        if heavy:
+            print(f'    imports {", ".join(heavy)}')
+
+    return passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if benchmark() else 1)
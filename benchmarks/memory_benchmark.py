@@ -0,0 +1,106 @@
+import argparse
+import sys
+import tracemalloc
+from typing import Callable, Iterator
+
+from providers.profile_batch import ProfileBatch
+
+# Budget in megabytes for the memory held by a ProfileBatch of 100,000 profiles
+BUDGET_MB = 12
+
+# Number of distinct headlines, crawls of a company or a profile's connections repeat the same few headlines
+HEADLINES = 2000
+
+
+def generate(count: int) -> Iterator[tuple[str, str, str]]:
+    """
+    Generates synthetic profiles, every value is a new string object as if it was just extracted from a page.
+
+    :param int count: Specify the number of profiles
+    :returns: The name, headline and link of every profile
+    :rtype: Iterator[tuple[str, str, str]]
+    """
+    for i in range(count):
+        yield (f'Firstname Lastname {i}',
+               f'Senior Software Engineer at Company {i % HEADLINES} | Cloud, Data & Distributed Systems',
+               f'https://www.linkedin.com/in/firstname-lastname-{i:08x}{i * 2654435761 % 2 ** 32:08x}')
+
+
+def collect_lists(count: int) -> list[list[str]]:
+    """
+    Holds the profiles as three parallel lists of strings.
+
+    :param int count: Specify the number of profiles
+    :returns: The names, headlines and links
+    :rtype: list[list[str]]
+    """
+    names, headlines, links = [], [], []
+
+    for name, headline, link in generate(count):
+        names.append(name)
+        headlines.append(headline)
+        links.append(link)
+
+    return [names, headlines, links]
+
+
+def collect_batch(count: int) -> ProfileBatch:
+    """
+    Holds the profiles in a ProfileBatch.
+
+    :param int count: Specify the number of profiles
+    :returns: The batch
+    :rtype: ProfileBatch
+    """
+    return ProfileBatch(generate(count))
+
+
+def measure(collect: Callable, count: int) -> float:
+    """
+    Measures the memory held by a collection of profiles once it is built.
+
+    :param Callable collect: Specify the function which builds the collection
+    :param int count: Specify the number of profiles
+    :returns: The retained memory in megabytes
+    :rtype: float
+    """
+    tracemalloc.start()
+    try:
+        collection = collect(count)
+        retained = tracemalloc.get_traced_memory()[0]
+        del collection
+    finally:
+        tracemalloc.stop()
+
+    return retained / 2 ** 20
+
+
+def benchmark(count: int) -> bool:
+    """
+    Prints the memory held by parallel lists and by a ProfileBatch, and whether the batch is within its budget.
+
+    :param int count: Specify the number of profiles
+    :returns: True if the batch is within its budget, scaled to the number of profiles
+    :rtype: bool
+    """
+    lists = measure(collect_lists, count)
+    batch = measure(collect_batch, count)
+    budget = BUDGET_MB * count / 100_000
+
+    within_budget = batch <= budget
+
+    print(f'{"parallel lists":<24}{lists:>8.1f} MB / {count} profiles')
+    print(f'{"ProfileBatch":<24}{batch:>8.1f} MB / {count} profiles  ({budget:.1f} MB budget, '
+          f'{"ok" if within_budget else "FAILED"})')
+
+    return within_budget
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.memory_benchmark',
+        description='Measures the memory held by the retrieved profiles.'
+    )
+    parser.add_argument('--profiles', type=int, default=100_000, help='number of profiles (default: 100000)')
+
+    sys.exit(0 if benchmark(parser.parse_args().profiles) else 1)
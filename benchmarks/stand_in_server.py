@@ -0,0 +1,126 @@
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.fixture_pages import FixturePages
+
+
+class StandInServer:
+    """
+    A local HTTP stand-in for LinkedIn, serves the fixture pages under the same paths as the URLs in config.json.
+
+    Attributes
+    ----------
+        latency  The seconds every response is held back, simulating the network round trip
+        render_delay  The seconds until a page's content, or a further batch of an infinite scroll, is rendered
+        cards  The number of cards in a page, or in a batch of an infinite scroll
+        pages  The number of pages of a people search
+        total  The total number of cards of an infinite scroll
+        requests  The number of served requests, counted under a lock since every request is served on its own thread
+        url  The base URL of the server, available once started
+
+    Methods
+    -------
+        render(path: str, query: dict[str, list[str]]) -> str:
+            Renders the fixture page of a path.
+        __enter__() -> StandInServer:
+            Starts serving on a free local port in a background thread.
+        __exit__(*_):
+            Stops serving.
+    """
+
+    def __init__(self, latency: float = 0, render_delay: float = 0, cards: int = 10, pages: int = 3,
+                 total: int = 30):
+        self.latency = latency
+        self.render_delay = render_delay
+        self.cards = cards
+        self.pages = pages
+        self.total = total
+        self.requests = 0
+        self.url = None
+
+        self.__server = None
+        self.__thread = None
+        self.__lock = threading.Lock()
+
+    def render(self, path: str, query: dict[str, list[str]]) -> str:
+        """
+        Renders the fixture page of a path, unknown paths are served an empty page (e.g. the cookie domain URL).
+
+        :param str path: Specify the request path, e.g. /search/results/people/
+        :param dict[str, list[str]] query: Specify the parsed query string
+        :returns: The page's HTML
+        :rtype: str
+        """
+        page = int(query.get('page', ['1'])[0])
+
+        if path == '/mynetwork/':
+            return FixturePages.suggestions(self.cards, self.total, self.url, self.render_delay)
+
+        if path == '/mynetwork/invitation-manager/':
+            return FixturePages.invitations('receivedInvitations', self.cards, self.total, self.url,
+                                           self.render_delay)
+
+        if path == '/mynetwork/invitation-manager/sent/':
+            return FixturePages.invitations('sentInvitations', self.cards, self.total, self.url,
+                                           self.render_delay)
+
+        if path == '/search/results/people/':
+            prefix = f'{query["connectionOf"][0]}-connection' if 'connectionOf' in query else 'person'
+            return FixturePages.people_search(self.cards, page, self.pages, self.url, prefix, self.render_delay)
+
+        if re.fullmatch('/company/[^/]+/people/', path):
+            return FixturePages.company_people(self.cards, self.total, self.url, self.render_delay)
+
+        match = re.fullmatch('/in/([^/]+)/?', path)
+        if match:
+            return FixturePages.profile(match.group(1), self.url, self.render_delay)
+
+        return '<html><body></body></html>'
+
+    def __enter__(self) -> 'StandInServer':
+        """
+        Starts serving on a free local port in a background thread.
+
+        :returns: The started server
+        :rtype: StandInServer
+        """
+        stand_in = self
+        lock = self.__lock
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    stand_in.requests += 1
+                time.sleep(stand_in.latency)
+
+                parts = urlsplit(self.path)
+                body = stand_in.render(parts.path, parse_qs(parts.query)).encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), RequestHandler)
+        self.__server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.__server.server_address[1]}'
+
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def __exit__(self, *_):
+        """
+        Stops serving.
+        """
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
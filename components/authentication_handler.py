@@ -1,9 +1,7 @@
-from time import sleep
-
-import pyautogui as pyautogui
-
 from providers.configuration_handler import ConfigurationHandler
+from providers.cookie_jar_handler import CookieJarHandler
 from providers.driver_handler import DriverHandler
+from providers.wait_handler import WaitHandler
 
 
 class AuthenticationHandler:
@@ -14,9 +12,11 @@ class AuthenticationHandler:
     -------
         __request_credentials() -> list[str]:
             Handles credentials acquisition directly from the console stream.
+        __restore_session() -> bool:
+            Attempts to restore the cookies saved by a previous login, and checks them with a single request.
         login():
-            Attempts to log in to LinkedIn with the provided credentials, fetches the credentials from endpoints.longin
-            in config.json, if empty, calls __request_credentials().
+            Attempts to restore the previous session, otherwise, logs in to LinkedIn with the provided credentials,
+            fetches the credentials from endpoints.longin in config.json, if empty, calls __request_credentials().
     """
 
     @staticmethod
@@ -27,23 +27,54 @@ class AuthenticationHandler:
         :returns: The acquired username and password
         :rtype: list[str]
         """
+        import pyautogui
+
         username = input('Please insert your email or phone number:\n')
         password = pyautogui.password(title='Please insert your password:', mask='*')
         return [username, password]
 
     @staticmethod
-    def login():
+    def __restore_session() -> bool:
         """
-        Attempts to log in to LinkedIn with the provided credentials, fetches the credentials from endpoints.longin
-        in config.json, if empty, calls __request_credentials().
+        Attempts to restore the cookies saved by a previous login, and checks them with a single request.
+
+        :returns: True if the restored session is still authenticated
+        :rtype: bool
         """
         login_configuration = ConfigurationHandler.get_configuration()['endpoints']['longin']
 
-        username = login_configuration['username']
-        password = login_configuration['password']
+        cookies = CookieJarHandler.load()
 
-        if not username or not password:
-            username, password = AuthenticationHandler.__request_credentials()
+        if not cookies:
+            return False
+
+        driver = DriverHandler.get_driver()
+
+        driver.get(login_configuration['url'])
+        for cookie in cookies:
+            cookie.pop('sameSite', None)
+            driver.add_cookie(cookie)
+
+        driver.get(login_configuration['sessionValidationURL'])
+
+        if driver.current_url.startswith(login_configuration['sessionValidationURL']):
+            return True
+
+        # Expired
+        CookieJarHandler.clear()
+        driver.delete_all_cookies()
+        return False
+
+    @staticmethod
+    def login():
+        """
+        Attempts to restore the previous session, otherwise, logs in to LinkedIn with the provided credentials,
+        fetches the credentials from endpoints.longin in config.json, if empty, calls __request_credentials().
+        """
+        login_configuration = ConfigurationHandler.get_configuration()['endpoints']['longin']
+
+        if AuthenticationHandler.__restore_session():
+            return
 
         driver = DriverHandler.get_driver()
         url = login_configuration['url']
@@ -54,6 +85,12 @@ class AuthenticationHandler:
         if driver.current_url != url:
             return
 
+        username = login_configuration['username']
+        password = login_configuration['password']
+
+        if not username or not password:
+            username, password = AuthenticationHandler.__request_credentials()
+
         username_field = driver.find_element_by_id(login_configuration['usernameElementId'])
         password_field = driver.find_element_by_id(login_configuration['passwordElementId'])
 
@@ -65,4 +102,14 @@ class AuthenticationHandler:
 
         username_field.submit()
 
-        sleep(ConfigurationHandler.get_configuration()['securityVerificationDelay'])
+        def is_logged_in(web_driver) -> bool:
+            return not web_driver.current_url.startswith(url) and \
+                login_configuration['checkpointURL'] not in web_driver.current_url
+
+        # A security verification gets securityVerificationDelay seconds, a plain login still gets webLoadDelay
+        # seconds to redirect even if no verification is expected
+        WaitHandler.until(is_logged_in, max(ConfigurationHandler.get_configuration()['securityVerificationDelay'],
+                                            ConfigurationHandler.get_configuration()['webLoadDelay']))
+
+        if is_logged_in(driver):
+            CookieJarHandler.save(driver.get_cookies())
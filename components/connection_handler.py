@@ -1,39 +1,97 @@
-from time import sleep
-from typing import Union
+import queue
+import re
+import sys
+import threading
+from typing import Optional
 
-import pandas as pd
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from enums.connection_outcomes import ConnectionOutcomes
+from enums.profile_actions import ProfileActions
+from providers.action_scheduler import ActionScheduler
+from providers.checkpoint_handler import CheckpointHandler
 from providers.configuration_handler import ConfigurationHandler
 from providers.driver_handler import DriverHandler
+from providers.extraction_handler import ExtractionHandler
+from providers.filter_handler import FilterHandler
+from providers.link_handler import LinkHandler
+from providers.metrics_handler import MetricsHandler
+from providers.profile_store_handler import ProfileStoreHandler
+from providers.profile_writer import ProfileWriter
+from providers.resilience_handler import ResilienceHandler, TRANSIENT_EXCEPTIONS
+from providers.session_pool_handler import SessionPoolHandler
+from providers.source_handler import SourceHandler
+from providers.wait_handler import WaitHandler
 
 
 class ConnectionHandler:
     """
     Static methods which handles various connection procedures in LinkedIn.
 
+    Attributes
+    ----------
+        __NAVIGATE_SCRIPT  JavaScript which marks the current document as actioned and starts loading a profile,
+                           without waiting for it to load
+        __AGE_PATTERN  Matches the relative time of an invitation card, e.g. 'Sent 3 weeks ago'
+        __AGE_UNITS  The number of days per unit of a relative time
+        __PROFILE_READY_SCRIPT  JavaScript which checks whether a tab finished loading its next profile, that is, the
+                                connect buttons are rendered in a document which was not actioned yet
+
     Methods
     -------
-        __connect_to_user(url: Union[str, list[str]]):
-            Connects to a specified user(s).
-        handle_suggestions(connect: bool = False):
+        __is_known(link: Optional[str], connect: bool) -> bool:
+            Checks whether a profile was handled by a previous run, and should therefore be skipped.
+        __record(link: Optional[str], name: Optional[str], headline: Optional[str], source: str,
+        action: ProfileActions):
+            Records a handled profile in the profile store.
+        __connect_on_profile_page():
+            Connects to the profile opened in the current tab, once it finished loading.
+        __relocate(endpoint: str, person: dict, fields: dict[str, dict]):
+            Refreshes the record of a card whose elements went stale, by extracting its card again.
+        connect_to_users(urls: list[str]) -> dict[str, ConnectionOutcomes]:
+            Connects to the specified users through their profile pages, reusing a worker tab and preloading the
+            next profiles.
+        __is_connectable(endpoint: str, person: dict) -> bool:
+            Checks whether the profile of a card can be connected to.
+        __connect_to_card(endpoint: str, person: dict, fields: dict[str, dict]) -> Optional[bool]:
+            Connects to the profile of a card, paced by the action scheduler.
+        __handle_source(endpoint: str, url: str, target: str, output: str, connect: bool = False,
+        resume: bool = False, discovered: Optional[list[str]] = None):
+            Iterates through the profiles of a source, skips profiles rejected by the filters or handled by a previous
+            run, connects to them if requested, then writes and records them.
+        __handle_source_pipeline(endpoint: str, url: str, target: str, output: str, resume: bool = False,
+        discovered: Optional[list[str]] = None):
+            Iterates through the profiles of a source and connects to them concurrently.
+        handle_source(endpoint: str, connect: bool = False, resume: bool = False):
+            Iterates through the profiles of any endpoint in config.json which declares a strategy.
+        handle_suggestions(connect: bool = False, resume: bool = False):
             Iterates through profiles in the `suggestions section <SUGGESTIONS_>`_.
-        handle_people_search(connect: bool = False):
+        handle_people_search(connect: bool = False, resume: bool = False):
             Iterates through profiles in the `search page <PEOPLE_SEARCH_>`_.
-        __handle_profile_connections(profile_name: str, accumulated_links: list[str], connect: bool = False, depth: int = 1):
-            Recursively iterate through profiles per specified user(s) in the `search page (with filters)
+        __handle_profile_connections(profile_name: str, connect: bool = False, discovered: Optional[list[str]] = None,
+        resume: bool = False):
+            Iterates through the connections of a single profile in the `search page (with filters)
             <PROFILE_CONNECTIONS_>`_.
-        handle_profile_connections(connect: bool = False, depth: int = 1):
-            Recursively iterate through profiles per specified user(s) in the `search page (with filters)
+        handle_profile_connections(connect: bool = False, depth: int = 1, resume: bool = False):
+            Iterates breadth-first through profiles per specified user(s) in the `search page (with filters)
             <PROFILE_CONNECTIONS_>`_.
-        handle_company_people(connect: bool = False):
+        __handle_company_people(company: str, connect: bool = False, resume: bool = False):
+            Iterates through profiles working in a single company.
+        handle_company_people(connect: bool = False, resume: bool = False):
             Iterates through profiles working in a specified company(s).
+        __get_age(text: Optional[str]) -> float:
+            Converts the relative time of an invitation card into days.
+        __get_confirmation_locator(endpoint: str, key: str) -> str:
+            Provides the XPath locator of a confirmation button, excluding the buttons of the invitation cards.
+        __handle_invitations(endpoint: str, output: str, action: ProfileActions, button: Optional[str] = None,
+        minimum_age: float = 0):
+            Iterates through every invitation of an invitation manager, and takes action on each.
         handle_received_invitations(accept: bool = False, ignore: bool = False):
             Iterates through profiles in the `received invitations page <RECEIVED_INVITATIONS_>`_.
-        handle_sent_invitations(withdraw: bool = False):
+        handle_sent_invitations(withdraw: bool = False, minimum_age: Optional[float] = None):
             Iterates through profiles in the `sent invitations page <SENT_INVITATIONS_>`_.
 
     .. _SUGGESTIONS: https://www.linkedin.com/mynetwork/
@@ -43,395 +101,605 @@ class ConnectionHandler:
     .. _SENT_INVITATIONS: https://www.linkedin.com/mynetwork/invitation-manager/sent/
     """
 
+    __NAVIGATE_SCRIPT = 'window.__profileActioned = true; window.location.assign(arguments[0]);'
+
+    __AGE_PATTERN = re.compile(r'(\d+)\s*(minute|hour|day|week|month|year)')
+
+    __AGE_UNITS = {'minute': 1 / 1440, 'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+    __PROFILE_READY_SCRIPT = '''
+        return !window.__profileActioned && document.evaluate(
+            arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        ).snapshotLength > 1;
+    '''
+
+    @staticmethod
+    def __is_known(link: Optional[str], connect: bool) -> bool:
+        """
+        Checks whether a profile was handled by a previous run, and should therefore be skipped.
+
+        :param Optional[str] link: Specify the profile link
+        :param bool connect: Specify whether the current run connects to profiles, if so, only profiles which were
+                             already connected to are skipped
+        :returns: Whether the profile should be skipped
+        :rtype: bool
+        """
+        if not link or not ConfigurationHandler.get_configuration()['skipKnownProfiles']:
+            return False
+
+        return ProfileStoreHandler.contains(link, [ProfileActions.CONNECTED] if connect else None)
+
+    @staticmethod
+    def __record(link: Optional[str], name: Optional[str], headline: Optional[str], source: str,
+                 action: ProfileActions):
+        """
+        Records a handled profile in the profile store.
+
+        :param Optional[str] link: Specify the profile link, the profile is not recorded if it is missing
+        :param Optional[str] name: Specify the profile name
+        :param Optional[str] headline: Specify the profile headline
+        :param str source: Specify the endpoint which the profile was retrieved from, e.g. peopleSearch
+        :param ProfileActions action: Specify the action taken on the profile
+        """
+        if link:
+            ProfileStoreHandler.record(link, name, headline, source, action)
+
     @staticmethod
-    def __connect_to_user(url: Union[str, list[str]]):
+    def __connect_on_profile_page():
         """
-        Connects to a specified user(s).
+        Connects to the profile opened in the current tab, once it finished loading.
 
-        :param Union[str, list[str]] url: Specify which user to connect to by their URL
+        :raises Exception: if the profile cannot be connected to, e.g. its connect button never rendered
         """
         user_configuration = ConfigurationHandler.get_configuration()['endpoints']['profile']
+        web_load_delay = ConfigurationHandler.get_configuration()['webLoadDelay']
+        locators = ConfigurationHandler.get_locators('profile')
 
         driver = DriverHandler.get_driver()
 
-        urls = []
+        WaitHandler.until(
+            lambda web_driver: web_driver.execute_script(ConnectionHandler.__PROFILE_READY_SCRIPT,
+                                                         locators['connectInnerHTML']),
+            web_load_delay
+        )
 
-        if isinstance(url, str):
-            urls.append(url)
-        else:
-            urls = url
+        accept_button = driver.find_elements(
+            By.XPATH, locators['connectInnerHTML']
+        )[1].find_element(By.XPATH, '..')
 
-        for url in urls:
-            driver.execute_script('window.open("' + url + '");')
-            driver.switch_to.window(driver.window_handles[-1])
+        driver.execute_script('arguments[0].click();', accept_button)
 
-            accept_button = driver.find_elements(
-                By.XPATH,
-                '//*[text()="' + user_configuration['connectInnerHTML'] + '"]'
-            )[1].find_element(By.XPATH, '..')
+        WaitHandler.until(
+            lambda web_driver: web_driver.find_elements(
+                By.XPATH, f'{locators["confirmInnerHTML"]} | {locators["otherInnerHTML"]}'
+            ),
+            web_load_delay
+        )
 
-            driver.execute_script('arguments[0].click();', accept_button)
+        try:
+            connect_confirmation_button = driver.find_element(By.XPATH, locators['confirmInnerHTML'])
+            connect_confirmation_button = connect_confirmation_button.find_element(By.XPATH, '..')
+            connect_confirmation_button.click()
+        except (Exception,):
+            connect_button_reason = driver.find_element(By.XPATH, locators['otherInnerHTML'])
+            connect_button_reason.click()
 
-            try:
-                connect_confirmation_button = driver.find_element(
-                    By.XPATH,
-                    '//*[text()="' + user_configuration['confirmInnerHTML'] + '"]'
-                )
-                connect_confirmation_button.find_element(By.XPATH, '..').click()
-            except (Exception,):
-                connect_button_reason = driver.find_element(
-                    By.XPATH,
-                    '//*[text()="' + user_configuration['otherInnerHTML'] + '"]'
-                )
-                connect_button_reason.click()
-
-                connect_button = driver.find_element(
-                    By.XPATH,
-                    '//*[text()="' + user_configuration['connectInnerHTML'] + '"]'
-                )
-                connect_button.find_element(By.XPATH, '..').click()
-
-                connect_confirmation_button = driver.find_element(
-                    By.XPATH,
-                    '//*[text()="' + user_configuration['confirmInnerHTML'] + '"]'
-                )
-                connect_confirmation_button.find_element(By.XPATH, '..').click()
-
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
-
-            sleep(user_configuration['closeDelay'])
+            connect_button = driver.find_element(By.XPATH, locators['connectInnerHTML'])
+            connect_button.find_element(By.XPATH, '..').click()
+
+            connect_confirmation_button = driver.find_element(By.XPATH, locators['confirmInnerHTML'])
+            connect_confirmation_button = connect_confirmation_button.find_element(By.XPATH, '..')
+            connect_confirmation_button.click()
+
+        WaitHandler.element_gone(connect_confirmation_button, user_configuration['closeDelay'])
 
     @staticmethod
-    def handle_suggestions(connect: bool = False):
+    def __relocate(endpoint: str, person: dict, fields: dict[str, dict]):
         """
-        Iterates through profiles in the `suggestions section <SUGGESTIONS_>`_.
-
-        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        Refreshes the record of a card whose elements went stale, e.g. once LinkedIn re-rendered the list, by
+        extracting its card again using the profile link as a stable key.
 
-        .. _SUGGESTIONS: https://www.linkedin.com/mynetwork/
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param dict person: Specify the card's record, updated in place, its link is kept as is
+        :param dict[str, dict] fields: Specify the fields the record was extracted with
+        :raises NoSuchElementException: if the card is no longer rendered
         """
-        suggestions_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['suggestions']
+        relocated = SourceHandler.relocate(endpoint, person['link'].split('?')[0], fields) if person['link'] else None
 
-        driver = DriverHandler.get_driver()
+        if relocated is None:
+            raise NoSuchElementException(f'the card of {person["link"]} is no longer rendered')
 
-        url = suggestions_configuration['url']
+        person.update({key: value for key, value in relocated.items() if key != 'link'})
 
-        driver.get(url)
+    @staticmethod
+    def connect_to_users(urls: list[str]) -> dict[str, ConnectionOutcomes]:
+        """
+        Connects to the specified users through their profile pages, paced by the action scheduler. A dedicated
+        worker tab is reused for every profile, and profile.preloadTabs further tabs in config.json load the next
+        profiles while the current one is being connected to. A profile which fails transiently is loaded again and
+        retried, see ResilienceHandler.retry(), a failure only affects its own profile.
+
+        :param list[str] urls: Specify which users to connect to by their URL
+        :returns: The outcome of every URL, the URLs left once the weekly connection quota is exhausted are skipped
+        :rtype: dict[str, ConnectionOutcomes]
+        """
+        preload_tabs = ConfigurationHandler.get_configuration()['endpoints']['profile']['preloadTabs']
 
-        WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']) \
-            .until(EC.presence_of_element_located((By.CLASS_NAME, suggestions_configuration['nameClass'])))
+        driver = DriverHandler.get_driver()
 
-        names = []
-        headlines = []
-        links = []
+        outcomes = {url: ConnectionOutcomes.SKIPPED for url in urls}
 
-        counter = 0
-        maximum_connections = ConfigurationHandler.get_configuration()['maximumConnections']
-        prev_len = 0
+        if not urls:
+            return outcomes
 
-        while len(names) < maximum_connections or maximum_connections == -1:
-            suggestion_section = driver.find_element(
-                By.XPATH,
-                '//*[text()="' + suggestions_configuration['headerInnerHTML'] + '"]'
-            ).find_element(By.XPATH, '..').find_element(By.XPATH, '..')
-            people = suggestion_section.find_element(By.CLASS_NAME, suggestions_configuration['listClass']) \
-                .find_elements(By.TAG_NAME, 'li')
-
-            for i in range(counter, len(people)):
-                counter += 1
-
-                name = people[i] \
-                    .find_element(By.CLASS_NAME, suggestions_configuration['nameClass']) \
-                    .get_attribute('innerText')
-                headline = people[i] \
-                    .find_element(By.CLASS_NAME, suggestions_configuration['headlineClass']) \
-                    .get_attribute('innerText')
-                link = people[i] \
-                    .find_element(By.CLASS_NAME, suggestions_configuration['linkClass']) \
-                    .get_attribute('href')
-
-                if connect:
-                    button = people[i].find_elements(By.TAG_NAME, 'button')[-1]
-                    button.click()
-                    sleep(suggestions_configuration['connectDelay'])
+        main_window = driver.current_window_handle
+        tabs = []
 
-                names.append(name)
-                headlines.append(headline)
-                links.append(link)
+        try:
+            for url in urls[:preload_tabs + 1]:
+                driver.switch_to.new_window('tab')
+                driver.execute_script('window.location.assign(arguments[0]);', url)
+                tabs.append(driver.current_window_handle)
 
-                if len(names) >= maximum_connections != -1:
+            for index, url in enumerate(urls):
+                if not ActionScheduler.acquire(ProfileActions.CONNECTED):
                     break
 
-            if prev_len == len(people):
-                if driver.execute_script('(window.innerHeight + window.scrollY) >= document.body.scrollHeight'):
-                    break
-                else:
-                    driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+                tab = tabs[index % len(tabs)]
 
-            prev_len = len(people)
+                def connect():
+                    driver.switch_to.window(tab)
+                    ConnectionHandler.__connect_on_profile_page()
 
-            sleep(suggestions_configuration['scrollDelay'])
+                def reload(_: Exception):
+                    driver.switch_to.window(tab)
+                    driver.execute_script('window.location.assign(arguments[0]);', url)
 
-        df = pd.DataFrame(
-            {'Name': names,
-             'HeadLine': headlines,
-             'Link': links
-             })
+                try:
+                    with MetricsHandler.span('action.connectProfilePage'):
+                        ResilienceHandler.retry(connect, reload, name='connectProfilePage')
+                    outcomes[url] = ConnectionOutcomes.CONNECTED
+                except Exception:
+                    ActionScheduler.refund(ProfileActions.CONNECTED)
+                    outcomes[url] = ConnectionOutcomes.FAILED
 
-        df.to_csv(f'./out/Suggestions.csv', index=False)
+                # The tab starts loading the profile it is going to be connected to next
+                if index + len(tabs) < len(urls):
+                    try:
+                        driver.switch_to.window(tab)
+                        driver.execute_script(ConnectionHandler.__NAVIGATE_SCRIPT, urls[index + len(tabs)])
+                    except Exception:
+                        pass
+        finally:
+            for tab in tabs:
+                driver.switch_to.window(tab)
+                driver.close()
+
+            driver.switch_to.window(main_window)
+
+        return outcomes
 
     @staticmethod
-    def handle_people_search(connect: bool = False):
+    def __is_connectable(endpoint: str, person: dict) -> bool:
         """
-        Iterates through profiles in the `search page <PEOPLE_SEARCH_>`_.
+        Checks whether the profile of a card can be connected to, that is, its button is the connect, message or
+        follow button, and it is not a first degree connection.
 
-        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param dict person: Specify the card's record, extracted with the fields required to connect
+        :returns: Whether the profile can be connected to
+        :rtype: bool
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
 
-        .. _PEOPLE_SEARCH: https://www.linkedin.com/search/results/people/
+        if person['button'] is None:
+            return False
+
+        if 'degreeClass' in configuration and configuration['firstDegreeInnerHTML'] in (person['degree'] or ''):
+            return False
+
+        if person['buttonText'] == configuration['connectInnerHTML']:
+            return True
+
+        return 'messageInnerHTML' in configuration and \
+            person['buttonText'] in (configuration['messageInnerHTML'], configuration['followInnerHTML'])
+
+    @staticmethod
+    def __connect_to_card(endpoint: str, person: dict, fields: dict[str, dict]) -> Optional[bool]:
+        """
+        Connects to the profile of a card, paced by the action scheduler. Connects directly if the card's button is
+        the connect button (confirming if the endpoint declares confirmInnerHTML), or through the profile page if it
+        is the message or follow button. The action is acquired once, only the click and the confirmation are retried
+        on a card which is extracted again, see ResilienceHandler.retry(), and refunded if the retries are exhausted.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param dict person: Specify the card's record, refreshed in place if its elements went stale
+        :param dict[str, dict] fields: Specify the fields the record was extracted with
+        :returns: True if connected, False if the profile cannot be connected to, None if the weekly connection quota
+                  is exhausted
+        :rtype: Optional[bool]
+        :raises Exception: a transient failure once the retries are exhausted
         """
-        people_search_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['peopleSearch']
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
 
-        driver = DriverHandler.get_driver()
+        if not ConnectionHandler.__is_connectable(endpoint, person):
+            return False
+
+        button_text = person['buttonText']
+
+        if button_text == configuration['connectInnerHTML']:
+            if not ActionScheduler.acquire(ProfileActions.CONNECTED):
+                return None
+
+            driver = DriverHandler.get_driver()
+            # Only the confirmation dialog's button, an unrelated element sharing its text (e.g. a message box's send
+            # button) neither stands for an open confirmation nor is clicked
+            confirmation_locator = (
+                By.XPATH,
+                f'({ConfigurationHandler.get_locators(endpoint)["confirmInnerHTML"]}[ancestor::*[@role="dialog"]])'
+                '[last()]/..'
+            ) if 'confirmInnerHTML' in configuration else None
+
+            def connect():
+                # An attempt which went stale once the request was sent leaves a pending card behind
+                if person['buttonText'] != configuration['connectInnerHTML']:
+                    return
+
+                # The confirmation dialog of an interrupted attempt is still open
+                if confirmation_locator is None or not driver.find_elements(*confirmation_locator):
+                    button = ExtractionHandler.get_element(person['button'])
+                    button.click()
+
+                if confirmation_locator is not None:
+                    connect_confirmation_button = WaitHandler.element(
+                        confirmation_locator, ConfigurationHandler.get_configuration()['webLoadDelay']
+                    )
+                    connect_confirmation_button.click()
+                    WaitHandler.element_gone(connect_confirmation_button, configuration['connectDelay'])
+                else:
+                    WaitHandler.text_changed(button, configuration['connectInnerHTML'], configuration['connectDelay'])
+
+            try:
+                with MetricsHandler.span('action.connect'):
+                    ResilienceHandler.retry(connect, lambda _: ConnectionHandler.__relocate(endpoint, person, fields),
+                                            name='connect')
+            except Exception:
+                ActionScheduler.refund(ProfileActions.CONNECTED)
+                raise
+
+            return True
 
-        names = []
-        headlines = []
-        links = []
+        if 'messageInnerHTML' in configuration and \
+                button_text in (configuration['messageInnerHTML'], configuration['followInnerHTML']):
+            outcome = ConnectionHandler.connect_to_users([person['link']])[person['link']]
+            return None if outcome == ConnectionOutcomes.SKIPPED else outcome == ConnectionOutcomes.CONNECTED
+
+        return False
+
+    @staticmethod
+    def __handle_source(endpoint: str, url: str, target: str, output: str, connect: bool = False,
+                        resume: bool = False, discovered: Optional[list[str]] = None):
+        """
+        Iterates through the profiles of a source, skips profiles rejected by the filters in config.json or handled by
+        a previous run, connects to them if requested, then writes and records them. A card which fails transiently
+        is extracted again and retried, and is skipped once the retries are exhausted. Connecting is delegated to
+        __handle_source_pipeline() if pipeline.enabled in config.json is set.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str url: Specify the URL of the source
+        :param str target: Specify the checkpoint target, e.g. the company name, the profile name or the URL
+        :param str output: Specify the output file name, without the extension
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
+        :param Optional[list[str]] discovered: Collects the profile name of every retrieved profile, kept in the
+                                               checkpoint so that pages completed by a previous run are collected
+        """
+        if connect and ConfigurationHandler.get_configuration()['pipeline']['enabled']:
+            ConnectionHandler.__handle_source_pipeline(endpoint, url, target, output, resume=resume,
+                                                       discovered=discovered)
+            return
 
-        counter = 0
-        pagination = 1
-        pagination_threshold = 100
         maximum_connections = ConfigurationHandler.get_configuration()['maximumConnections']
 
-        while (len(names) < maximum_connections or maximum_connections == -1) and pagination <= pagination_threshold:
-            driver.get(f'{people_search_configuration["url"]}'
-                       f'?{people_search_configuration["paginationURL"]}={pagination}')
-            pagination += 1
+        checkpoint = CheckpointHandler.load(endpoint, target) if resume else {}
 
-            WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, people_search_configuration['buttonClass'])
-                ))
+        if discovered is not None:
+            # The pages completed by a previous run are not iterated again
+            discovered.extend(sys.intern(slug) for slug in checkpoint.get('discovered', []))
+            checkpoint['discovered'] = discovered
+
+        fields = SourceHandler.get_fields(endpoint, connect)
 
-            people = driver.find_element(By.CLASS_NAME, people_search_configuration['listClass']) \
-                .find_elements(By.TAG_NAME, 'li')
-
-            driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-            sleep(people_search_configuration['buttonRenderDelay'])
-
-            pagination_threshold = \
-                int(driver.find_element(By.CLASS_NAME, people_search_configuration['paginationInnerHTML'])
-                    .find_elements(By.TAG_NAME, 'li')[-1]
-                    .find_elements(By.CSS_SELECTOR, '*')[0]
-                    .find_elements(By.CSS_SELECTOR, '*')[0]
-                    .get_attribute('innerText'))
-
-            driver.execute_script('window.scrollTo(0, 0);')
-
-            for person in people:
-                counter += 1
-
-                name = person \
-                    .find_element(By.CLASS_NAME, people_search_configuration['nameClass']) \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .get_attribute('innerText')
-                headline = person \
-                    .find_element(By.CLASS_NAME, people_search_configuration['headlineClass']) \
-                    .get_attribute('innerText')
-                link = person \
-                    .find_element(By.CLASS_NAME, people_search_configuration['linkClass']) \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .find_elements(By.CSS_SELECTOR, '*')[0] \
-                    .get_attribute('href').split('?')[0]
-
-                if connect:
-                    button = person.find_element(By.TAG_NAME, 'button')
-                    button_text = button.find_element(By.TAG_NAME, 'span').get_attribute('innerText')
-                    if button_text == people_search_configuration['connectInnerHTML']:
-                        button.click()
-                        connect_confirmation_button = driver.find_element(
-                            By.XPATH,
-                            '//*[text()="' + people_search_configuration['confirmInnerHTML'] + '"]'
-                        )
-                        connect_confirmation_button.find_element(By.XPATH, '..').click()
-                        sleep(people_search_configuration['connectDelay'])
-                    elif button_text == people_search_configuration['messageInnerHTML'] or \
-                            button_text == people_search_configuration['followInnerHTML']:
-                        ConnectionHandler.__connect_to_user(url=link)
-                    else:
+        with ProfileWriter(output, append=resume) as writer:
+            writer.count = checkpoint.get('count', 0)
+
+            if writer.count >= maximum_connections != -1:
+                return
+
+            try:
+                for person in SourceHandler.iterate(endpoint, url, target, fields, checkpoint):
+                    name = person['name']
+                    headline = person['headline']
+                    link = person['link']
+
+                    if discovered is not None and link:
+                        # Profiles discovered through several connections share a single slug string
+                        discovered.append(sys.intern(LinkHandler.get_slug(link)))
+
+                    # Undisclosed or partially rendered cards
+                    if not name or not link:
                         continue
 
-                names.append(name)
-                headlines.append(headline)
-                links.append(link)
+                    if not FilterHandler.accepts(name, headline, link) or \
+                            ConnectionHandler.__is_known(link, connect):
+                        continue
 
-                if len(names) >= maximum_connections != -1:
-                    break
+                    if connect:
+                        try:
+                            connected = ConnectionHandler.__connect_to_card(endpoint, person, fields)
+                        except TRANSIENT_EXCEPTIONS:
+                            MetricsHandler.increment('failures')
+                            continue
 
-            sleep(people_search_configuration['paginationDelay'])
+                        if connected is None:
+                            break
+
+                        if not connected:
+                            continue
 
-        df = pd.DataFrame(
-            {'Name': names,
-             'HeadLine': headlines,
-             'Link': links
-             })
+                    writer.write(name, headline, link)
+                    checkpoint['count'] = writer.count
 
-        df.to_csv(f'./out/People Search.csv', index=False)
+                    ConnectionHandler.__record(link, name, headline, endpoint,
+                                               ProfileActions.CONNECTED if connect else ProfileActions.RECORDED)
+
+                    if writer.count >= maximum_connections != -1:
+                        break
+            finally:
+                # Keeps the count of the page the iteration stopped at, e.g. once maximumConnections is reached
+                CheckpointHandler.save(endpoint, target, checkpoint)
 
     @staticmethod
-    def __handle_profile_connections(profile_name: str, accumulated_links: list[str], connect: bool = False,
-                                     depth: int = 1):
+    def __handle_source_pipeline(endpoint: str, url: str, target: str, output: str, resume: bool = False,
+                                 discovered: Optional[list[str]] = None):
+        """
+        Iterates through the profiles of a source and connects to them concurrently; the harvest keeps walking the
+        source and connects to the cards which have a connect button in place, while the candidates which can only be
+        connected to through their profile pages (message or follow button) are queued for a dedicated session,
+        launched once the first candidate is queued. The queue is bounded by pipeline.queueSize in config.json, so the
+        harvest never waits on a profile page visit unless the queue is full. Up to profile.preloadTabs + 1 queued
+        candidates are connected to as a batch, see connect_to_users(). Queued candidates are kept in the checkpoint
+        until they are handled, a candidate which could not be connected to is dropped.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str url: Specify the URL of the source
+        :param str target: Specify the checkpoint target, e.g. the company name, the profile name or the URL
+        :param str output: Specify the output file name, without the extension
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not, the
+                            candidates left queued by the previous run are handled first
+        :param Optional[list[str]] discovered: Collects the profile name of every retrieved profile, kept in the
+                                               checkpoint so that pages completed by a previous run are collected
+        :raises Exception: the first failure of the connecting session
         """
-        Recursively iterate through profiles per specified user(s) in the `search page (with filters)
-        <PROFILE_CONNECTIONS_>`_.
+        configuration = ConfigurationHandler.get_configuration()
+        maximum_connections = configuration['maximumConnections']
+        preload_tabs = configuration['endpoints']['profile']['preloadTabs']
+        connect_text = configuration['endpoints'][endpoint]['connectInnerHTML']
 
-        :param str profile_name: Specify which profile name to view their connections
-        :param list[str] accumulated_links: Accumulate handled links to avoid infinite callbacks
-               (when an already processed profile gets processed again at a different depth)
-        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
-        :param int depth: Specify the depth of the recursion, that is, the depth of connecting to a profile's
-                          connections who is a connection to the root profile (set to one for no recursion)
+        fields = SourceHandler.get_fields(endpoint, connect=True)
 
-        .. _PROFILE_CONNECTIONS: https://www.linkedin.com/search/results/people/
-        """
-        profile_connections_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['profileConnections']
+        checkpoint = CheckpointHandler.load(endpoint, target) if resume else {}
+        checkpoint['pending'] = checkpoint.get('pending', [])
 
-        driver = DriverHandler.get_driver()
+        if discovered is not None:
+            # The pages completed by a previous run are not iterated again
+            discovered.extend(sys.intern(slug) for slug in checkpoint.get('discovered', []))
+            checkpoint['discovered'] = discovered
 
-        profiles = [profile_name]
+        candidates = queue.Queue(maxsize=configuration['pipeline']['queueSize'])
+        lock = threading.Lock()
+        stopped = threading.Event()
+        errors = []
 
-        for profile in profiles:
-            url = profile_connections_configuration['url']
-            url = url.replace('PROFILE_NAME', profile)
-            driver.get(url)
+        with ProfileWriter(output, append=resume) as writer:
+            writer.count = checkpoint.get('count', 0)
 
-            WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
-                EC.presence_of_element_located(
-                    (By.CLASS_NAME, profile_connections_configuration['connectionsIndicatorClass'])
-                ))
+            if writer.count >= maximum_connections != -1:
+                return
+
+            def act():
+                session = None
+                try:
+                    finished = False
+
+                    while not finished:
+                        batch = [candidates.get()]
+
+                        # Queued candidates are connected to together, so that the next profiles load meanwhile
+                        while batch[-1] is not None and len(batch) <= preload_tabs:
+                            try:
+                                batch.append(candidates.get_nowait())
+                            except queue.Empty:
+                                break
+
+                        if batch[-1] is None:
+                            finished = True
+                            batch.pop()
+
+                        # Left pending for the next run
+                        if stopped.is_set() or not batch:
+                            continue
+
+                        if session is None:
+                            session = SessionPoolHandler.launch()
+                            DriverHandler.bind(session.driver)
+
+                        if maximum_connections != -1:
+                            batch = batch[:maximum_connections - writer.count]
+
+                        outcomes = ConnectionHandler.connect_to_users([candidate['link'] for candidate in batch])
+
+                        for candidate in batch:
+                            outcome = outcomes[candidate['link']]
+
+                            if outcome == ConnectionOutcomes.SKIPPED:
+                                stopped.set()
+                                continue
+
+                            with lock:
+                                if outcome == ConnectionOutcomes.CONNECTED:
+                                    writer.write(candidate['name'], candidate['headline'], candidate['link'])
+
+                                checkpoint['count'] = writer.count
+                                checkpoint['pending'] = [pending for pending in checkpoint['pending']
+                                                         if pending['link'] != candidate['link']]
+
+                            if outcome == ConnectionOutcomes.CONNECTED:
+                                ConnectionHandler.__record(candidate['link'], candidate['name'],
+                                                           candidate['headline'], endpoint, ProfileActions.CONNECTED)
+
+                        if writer.count >= maximum_connections != -1:
+                            stopped.set()
+                except Exception as exception:
+                    errors.append(exception)
+                    stopped.set()
+                finally:
+                    DriverHandler.bind(None)
+                    if session is not None:
+                        SessionPoolHandler.dispose(session)
+
+            def offer(candidate: Optional[dict]) -> bool:
+                while consumer.is_alive() and (candidate is None or not stopped.is_set()):
+                    try:
+                        candidates.put(candidate, timeout=1)
+                        return True
+                    except queue.Full:
+                        pass
+                return False
+
+            consumer = threading.Thread(target=act, daemon=True)
+            consumer.start()
 
             try:
-                url = driver \
-                    .find_element(By.CLASS_NAME, profile_connections_configuration['connectionsIndicatorClass']) \
-                    .find_element(By.TAG_NAME, 'a') \
-                    .get_attribute('href')
-                url = url[0:url.index(profile_connections_configuration['degreeQueryString'])]
-            except NoSuchElementException:
-                continue
-
-            names = []
-            headlines = []
-            links = []
-
-            counter = 0
-            pagination = 1
-            pagination_threshold = 100
-            maximum_connections = ConfigurationHandler.get_configuration()['maximumConnections']
-
-            while (len(names) < maximum_connections or maximum_connections == -1) \
-                    and pagination <= pagination_threshold:
-                driver.get(f'{url}&{profile_connections_configuration["paginationURL"]}={pagination}')
-                pagination += 1
-
-                WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
-                    EC.presence_of_element_located(
-                        (By.CLASS_NAME, profile_connections_configuration['buttonClass'])
-                    ))
-
-                people = driver.find_element(By.CLASS_NAME, profile_connections_configuration['listClass']) \
-                    .find_elements(By.TAG_NAME, 'li')
-
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                sleep(profile_connections_configuration['buttonRenderDelay'])
-
-                pagination_threshold = \
-                    int(driver.find_element(By.CLASS_NAME, profile_connections_configuration['paginationInnerHTML'])
-                        .find_elements(By.TAG_NAME, 'li')[-1]
-                        .find_elements(By.CSS_SELECTOR, '*')[0]
-                        .find_elements(By.CSS_SELECTOR, '*')[0]
-                        .get_attribute('innerText'))
-
-                driver.execute_script('window.scrollTo(0, 0);')
-
-                for person in people:
-                    counter += 1
-
-                    name = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['nameClass']) \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .get_attribute('innerText')
-                    headline = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['headlineClass']) \
-                        .get_attribute('innerText')
-                    link = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['linkClass']) \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .get_attribute('href').split('?')[0]
-
-                    if depth - 1 > 0 and link not in accumulated_links:
-                        driver.execute_script('window.open("");')
-                        driver.switch_to.window(driver.window_handles[-1])
-                        accumulated_links.append(link)
-                        ConnectionHandler.__handle_profile_connections(connect=connect,
-                                                                       depth=depth - 1,
-                                                                       profile_name=link[link.rindex('/') + 1:],
-                                                                       accumulated_links=accumulated_links)
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[-1])
+                for candidate in list(checkpoint['pending']):
+                    if not offer(candidate):
+                        break
 
-                    if connect:
-                        button = person.find_element(By.TAG_NAME, 'button')
-                        button_text = button.find_element(By.TAG_NAME, 'span').get_attribute('innerText')
-                        if button_text == profile_connections_configuration['connectInnerHTML']:
-                            button.click()
-                            connect_confirmation_button = driver.find_element(
-                                By.XPATH,
-                                '//*[text()="' + profile_connections_configuration['confirmInnerHTML'] + '"]'
-                            )
-                            connect_confirmation_button.find_element(By.XPATH, '..').click()
-                            sleep(profile_connections_configuration['connectDelay'])
-                        elif button_text == profile_connections_configuration['messageInnerHTML'] or \
-                                button_text == profile_connections_configuration['followInnerHTML']:
-                            ConnectionHandler.__connect_to_user(url=link)
-                        else:
+                for person in SourceHandler.iterate(endpoint, url, target, fields, checkpoint):
+                    if stopped.is_set():
+                        break
+
+                    link = person['link']
+
+                    if discovered is not None and link:
+                        discovered.append(sys.intern(LinkHandler.get_slug(link)))
+
+                    if not person['name'] or not link:
+                        continue
+
+                    if not FilterHandler.accepts(person['name'], person['headline'], link) or \
+                            ConnectionHandler.__is_known(link, True) or \
+                            not ConnectionHandler.__is_connectable(endpoint, person):
+                        continue
+
+                    # A connect button in place costs a single click, rather than a profile page visit
+                    if person['buttonText'] == connect_text:
+                        try:
+                            connected = ConnectionHandler.__connect_to_card(endpoint, person, fields)
+                        except TRANSIENT_EXCEPTIONS:
+                            MetricsHandler.increment('failures')
+                            continue
+
+                        if connected is None:
+                            stopped.set()
+                            break
+
+                        if not connected:
                             continue
 
-                    names.append(name)
-                    headlines.append(headline)
-                    links.append(link)
+                        with lock:
+                            writer.write(person['name'], person['headline'], link)
+                            checkpoint['count'] = writer.count
+
+                        ConnectionHandler.__record(link, person['name'], person['headline'], endpoint,
+                                                   ProfileActions.CONNECTED)
+
+                        if writer.count >= maximum_connections != -1:
+                            stopped.set()
+                            break
+
+                        continue
+
+                    candidate = {'name': person['name'], 'headline': person['headline'], 'link': link}
+
+                    with lock:
+                        if any(pending['link'] == link for pending in checkpoint['pending']):
+                            continue
+                        checkpoint['pending'] = checkpoint['pending'] + [candidate]
 
-                    if len(names) >= maximum_connections != -1:
+                    if not offer(candidate):
                         break
+            finally:
+                offer(None)
+                consumer.join()
 
-                sleep(profile_connections_configuration['paginationDelay'])
+                with lock:
+                    CheckpointHandler.save(endpoint, target, checkpoint)
 
-            df = pd.DataFrame(
-                {'Name': names,
-                 'HeadLine': headlines,
-                 'Link': links
-                 })
+        if errors:
+            raise errors[0]
 
-            df.to_csv(f'./out/{profile} Connections.csv', index=False)
+    @staticmethod
+    def handle_source(endpoint: str, connect: bool = False, resume: bool = False):
+        """
+        Iterates through the profiles of any endpoint in config.json which declares a strategy, the url value of the
+        endpoint is the source, and the generated file is named after the endpoint.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
+        """
+        url = ConfigurationHandler.get_configuration()['endpoints'][endpoint]['url']
+        ConnectionHandler.__handle_source(endpoint, url, url, endpoint, connect=connect, resume=resume)
 
     @staticmethod
-    def handle_profile_connections(connect: bool = False, depth: int = 1):
+    def handle_suggestions(connect: bool = False, resume: bool = False):
         """
-        Recursively iterate through profiles per specified user(s) in the `search page (with filters)
-        <PROFILE_CONNECTIONS_>`_.
+        Iterates through profiles in the `suggestions section <SUGGESTIONS_>`_.
 
         :param bool connect: Specify whether to connect to the retrieved list of profiles or not
-        :param int depth: Specify the depth of the recursion, that is, the depth of connecting to a profile's
-                          connections who is a connection to the root profile (set to one for no recursion)
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
+
+        .. _SUGGESTIONS: https://www.linkedin.com/mynetwork/
+        """
+        url = ConfigurationHandler.get_configuration()['endpoints']['suggestions']['url']
+        ConnectionHandler.__handle_source('suggestions', url, url, 'Suggestions', connect=connect, resume=resume)
+
+    @staticmethod
+    def handle_people_search(connect: bool = False, resume: bool = False):
+        """
+        Iterates through profiles in the `search page <PEOPLE_SEARCH_>`_.
+
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
+
+        .. _PEOPLE_SEARCH: https://www.linkedin.com/search/results/people/
+        """
+        url = ConfigurationHandler.get_configuration()['endpoints']['peopleSearch']['url']
+        ConnectionHandler.__handle_source('peopleSearch', url, url, 'People Search', connect=connect, resume=resume)
+
+    @staticmethod
+    def __handle_profile_connections(profile_name: str, connect: bool = False,
+                                     discovered: Optional[list[str]] = None, resume: bool = False):
+        """
+        Iterates through the connections of a single profile in the `search page (with filters)
+        <PROFILE_CONNECTIONS_>`_. A profile whose page fails to load once the retries are exhausted is skipped.
+
+        :param str profile_name: Specify which profile name to view their connections
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param Optional[list[str]] discovered: Collects the profile name of every retrieved connection, used to
+                                               expand the crawl frontier
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
 
         .. _PROFILE_CONNECTIONS: https://www.linkedin.com/search/results/people/
         """
@@ -440,232 +708,234 @@ class ConnectionHandler:
 
         driver = DriverHandler.get_driver()
 
-        profiles = ConfigurationHandler.get_configuration()['profileNames']
+        url = profile_connections_configuration['url']
+        url = url.replace('PROFILE_NAME', profile_name)
 
-        for profile in profiles:
-            url = profile_connections_configuration['url']
-            url = url.replace('PROFILE_NAME', profile)
+        def load():
             driver.get(url)
+            ResilienceHandler.check()
 
             WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
                 EC.presence_of_element_located(
                     (By.CLASS_NAME, profile_connections_configuration['connectionsIndicatorClass'])
                 ))
 
-            try:
-                url = driver \
-                    .find_element(By.CLASS_NAME, profile_connections_configuration['connectionsIndicatorClass']) \
-                    .find_element(By.TAG_NAME, 'a') \
-                    .get_attribute('href')
-                url = url[0:url.index(profile_connections_configuration['degreeQueryString'])]
-            except NoSuchElementException:
-                continue
-
-            names = []
-            headlines = []
-            links = []
-
-            counter = 0
-            pagination = 1
-            pagination_threshold = 100
-            maximum_connections = ConfigurationHandler.get_configuration()['maximumConnections']
-
-            while (len(names) < maximum_connections or maximum_connections == -1) \
-                    and pagination <= pagination_threshold:
-                driver.get(f'{url}&{profile_connections_configuration["paginationURL"]}={pagination}')
-                pagination += 1
-
-                WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
-                    EC.presence_of_element_located(
-                        (By.CLASS_NAME, profile_connections_configuration['buttonClass'])
-                    ))
-
-                people = driver.find_element(By.CLASS_NAME, profile_connections_configuration['listClass']) \
-                    .find_elements(By.TAG_NAME, 'li')
-
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                sleep(profile_connections_configuration['buttonRenderDelay'])
-
-                pagination_threshold = \
-                    int(driver.find_element(By.CLASS_NAME, profile_connections_configuration['paginationInnerHTML'])
-                        .find_elements(By.TAG_NAME, 'li')[-1]
-                        .find_elements(By.CSS_SELECTOR, '*')[0]
-                        .find_elements(By.CSS_SELECTOR, '*')[0]
-                        .get_attribute('innerText'))
-
-                driver.execute_script('window.scrollTo(0, 0);')
-
-                for person in people:
-                    counter += 1
-
-                    name = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['nameClass']) \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .get_attribute('innerText')
-                    headline = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['headlineClass']) \
-                        .get_attribute('innerText')
-                    link = person \
-                        .find_element(By.CLASS_NAME, profile_connections_configuration['linkClass']) \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .find_elements(By.CSS_SELECTOR, '*')[0] \
-                        .get_attribute('href').split('?')[0]
-
-                    if depth - 1 > 0:
-                        driver.execute_script('window.open("");')
-                        driver.switch_to.window(driver.window_handles[-1])
-                        ConnectionHandler.__handle_profile_connections(connect=connect,
-                                                                       depth=depth - 1,
-                                                                       profile_name=link[link.rindex('/') + 1:],
-                                                                       accumulated_links=[])
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[-1])
+        # A profile which does not load, e.g. a private one, is skipped rather than stopping the crawl
+        try:
+            with MetricsHandler.span('page.profileConnections'):
+                ResilienceHandler.retry(load, name='page.profileConnections')
+        except TRANSIENT_EXCEPTIONS:
+            MetricsHandler.increment('failures')
+            return
+
+        try:
+            url = driver \
+                .find_element(By.CLASS_NAME, profile_connections_configuration['connectionsIndicatorClass']) \
+                .find_element(By.TAG_NAME, 'a') \
+                .get_attribute('href')
+            url = url[0:url.index(profile_connections_configuration['degreeQueryString'])]
+        except NoSuchElementException:
+            return
 
-                    if connect:
-                        button = person.find_element(By.TAG_NAME, 'button')
-                        button_text = button.find_element(By.TAG_NAME, 'span').get_attribute('innerText')
-                        if button_text == profile_connections_configuration['connectInnerHTML']:
-                            button.click()
-                            connect_confirmation_button = driver.find_element(
-                                By.XPATH,
-                                '//*[text()="' + profile_connections_configuration['confirmInnerHTML'] + '"]'
-                            )
-                            connect_confirmation_button.find_element(By.XPATH, '..').click()
-                            sleep(profile_connections_configuration['connectDelay'])
-                        elif button_text == profile_connections_configuration['messageInnerHTML'] or \
-                                button_text == profile_connections_configuration['followInnerHTML']:
-                            ConnectionHandler.__connect_to_user(url=link)
-                        else:
-                            continue
+        ConnectionHandler.__handle_source('profileConnections', url, profile_name, f'{profile_name} Connections',
+                                          connect=connect, resume=resume, discovered=discovered)
 
-                    names.append(name)
-                    headlines.append(headline)
-                    links.append(link)
+    @staticmethod
+    def handle_profile_connections(connect: bool = False, depth: int = 1, resume: bool = False):
+        """
+        Iterates breadth-first through profiles per specified user(s) in the `search page (with filters)
+        <PROFILE_CONNECTIONS_>`_, every profile is visited at most once regardless of how many times it was
+        discovered. The profiles of each depth are spread across the session pool.
+
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param int depth: Specify the depth of the crawl, that is, the depth of connecting to a profile's
+                          connections who is a connection to the root profile (set to one for no recursion)
+        :param bool resume: Specify whether to continue each profile from the last checkpoint of a previous run or not,
+                            the connections collected by the previous run are kept in the checkpoints, so the crawl
+                            still expands to the profiles discovered on the pages it completed
+
+        .. _PROFILE_CONNECTIONS: https://www.linkedin.com/search/results/people/
+        """
+        profile_connections_configuration = \
+            ConfigurationHandler.get_configuration()['endpoints']['profileConnections']
+
+        depth_budget = profile_connections_configuration['depthBudget']
+
+        profiles = [LinkHandler.get_slug(profile)
+                    for profile in ConfigurationHandler.get_configuration()['profileNames']]
+
+        frontier = profiles
+        visited = set(profiles)
+
+        for level in range(1, depth + 1):
+            def crawl(profile: str, collect: bool = level < depth) -> list[str]:
+                discovered = [] if collect else None
+                ConnectionHandler.__handle_profile_connections(profile_name=profile,
+                                                               connect=connect,
+                                                               discovered=discovered,
+                                                               resume=resume)
+                return discovered or []
 
-                    if len(names) >= maximum_connections != -1:
+            next_frontier = []
+
+            for discovered in SessionPoolHandler.map(crawl, frontier):
+                for child in discovered:
+                    if child in visited:
+                        continue
+
+                    if len(next_frontier) >= depth_budget != -1:
                         break
 
-                sleep(profile_connections_configuration['paginationDelay'])
+                    visited.add(child)
+                    next_frontier.append(child)
+
+            frontier = next_frontier
+
+    @staticmethod
+    def __handle_company_people(company: str, connect: bool = False, resume: bool = False):
+        """
+        Iterates through profiles working in a single company.
 
-            df = pd.DataFrame(
-                {'Name': names,
-                 'HeadLine': headlines,
-                 'Link': links
-                 })
+        :param str company: Specify the company name, as denoted in the company's URL
+        :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
+        """
+        url = ConfigurationHandler.get_configuration()['endpoints']['companyPeople']['url']
+        url = url.replace('COMPANY_NAME', company)
 
-            df.to_csv(f'./out/{profile} Connections.csv', index=False)
+        ConnectionHandler.__handle_source('companyPeople', url, company, f'Company People - {company}',
+                                          connect=connect, resume=resume)
 
     @staticmethod
-    def handle_company_people(connect: bool = False):
+    def handle_company_people(connect: bool = False, resume: bool = False):
         """
-        Iterates through profiles working in a specified company(s).
+        Iterates through profiles working in a specified company(s), the companies are spread across the session
+        pool.
 
         :param bool connect: Specify whether to connect to the retrieved list of profiles or not
+        :param bool resume: Specify whether to continue from the last checkpoint of a previous run or not
         """
-        company_people_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['companyPeople']
+        SessionPoolHandler.map(
+            lambda company: ConnectionHandler.__handle_company_people(company, connect=connect, resume=resume),
+            ConfigurationHandler.get_configuration()['companyNames']
+        )
 
-        driver = DriverHandler.get_driver()
+    @staticmethod
+    def __get_age(text: Optional[str]) -> float:
+        """
+        Converts the relative time of an invitation card into days.
 
-        companies = ConfigurationHandler.get_configuration()['companyNames']
+        :param Optional[str] text: Specify the relative time, e.g. 'Sent 3 weeks ago'
+        :returns: The age in days, 0 if the text is missing or is not recognized
+        :rtype: float
+        """
+        if not text:
+            return 0
 
-        for company in companies:
-            url = company_people_configuration['url']
-            url = url.replace('COMPANY_NAME', company)
+        match = ConnectionHandler.__AGE_PATTERN.search(text.lower())
 
-            driver.get(url)
+        if not match:
+            return 1 if 'yesterday' in text.lower() else 0
 
-            WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']) \
-                .until(EC.presence_of_element_located((By.CLASS_NAME, company_people_configuration['nameClass'])))
+        return int(match.group(1)) * ConnectionHandler.__AGE_UNITS[match.group(2)]
 
-            names = []
-            headlines = []
-            links = []
+    @staticmethod
+    def __get_confirmation_locator(endpoint: str, key: str) -> str:
+        """
+        Provides the XPath locator of a confirmation button, excluding the buttons of the invitation cards, which may
+        share its text.
 
-            counter = 0
-            maximum_connections = ConfigurationHandler.get_configuration()['maximumConnections']
-            prev_len = 0
+        :param str endpoint: Specify the endpoint name, e.g. sentInvitations
+        :param str key: Specify the confirmation's text value, e.g. withdrawConfirmationInnerHTML
+        :returns: The XPath locator of the last matching button outside the invitation list
+        :rtype: str
+        """
+        list_class = ConfigurationHandler.get_configuration()['endpoints'][endpoint]['listClass']
+        predicates = ''.join(f'[contains(concat(" ", normalize-space(@class), " "), " {class_name} ")]'
+                             for class_name in list_class.split('.'))
 
-            while len(names) < maximum_connections or maximum_connections == -1:
-                people = driver.find_element(By.CLASS_NAME, company_people_configuration['listClass']) \
-                    .find_elements(By.TAG_NAME, 'li')
+        return f'({ConfigurationHandler.get_locators(endpoint)[key]}[not(ancestor::*{predicates})])[last()]/..'
 
-                for i in range(counter, len(people)):
-                    counter += 1
+    @staticmethod
+    def __handle_invitations(endpoint: str, output: str, action: ProfileActions, button: Optional[str] = None,
+                             minimum_age: float = 0):
+        """
+        Iterates through every invitation of an invitation manager, however many batches it takes to load, and takes
+        action on each, paced by the action scheduler. An invitation which fails transiently is extracted again and
+        retried, and is skipped once the retries are exhausted.
+
+        :param str endpoint: Specify the endpoint name, either receivedInvitations or sentInvitations
+        :param str output: Specify the output file name
+        :param ProfileActions action: Specify the action to take, RECORDED only records the invitations
+        :param Optional[str] button: Specify the prefix of the action's values in config.json, e.g. withdraw
+        :param float minimum_age: Specify the minimum age of an invitation in days, younger invitations are skipped
+        """
+        # The invitation manager is not loaded at all once the weekly quota is exhausted
+        if button and ActionScheduler.get_remaining(action) == 0:
+            return
 
-                    try:
-                        name = people[i] \
-                            .find_element(By.CLASS_NAME, company_people_configuration['nameClass']) \
-                            .get_attribute('innerText')
-                        headline = people[i] \
-                            .find_element(By.CLASS_NAME, company_people_configuration['headlineClass']) \
-                            .get_attribute('innerText')
-                        link = people[i] \
-                            .find_element(By.CLASS_NAME, company_people_configuration['linkClass']) \
-                            .get_attribute('href')
-
-                        button = people[i].find_element(By.TAG_NAME, 'button')
-                        button_text = button.find_element(By.TAG_NAME, 'span').get_attribute('innerText')
-                    except NoSuchElementException:
-                        continue
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+        web_load_delay = ConfigurationHandler.get_configuration()['webLoadDelay']
+        locators = ConfigurationHandler.get_locators(endpoint)
 
-                    if connect:
-                        degree = people[i] \
-                            .find_element(By.CLASS_NAME, company_people_configuration['degreeClass']) \
-                            .get_attribute('innerText')
+        driver = DriverHandler.get_driver()
+        url = configuration['url']
 
-                        if company_people_configuration['firstDegreeInnerHTML'] in degree:
-                            continue
+        fields = SourceHandler.get_fields(endpoint)
+        if minimum_age:
+            fields['age'] = ExtractionHandler.field('.' + configuration['ageClass'])
 
-                        if button_text == company_people_configuration['connectInnerHTML']:
-                            button.click()
-                            connect_confirmation_button = driver.find_element(
-                                By.XPATH,
-                                '//*[text()="' + company_people_configuration['confirmInnerHTML'] + '"]'
-                            )
-                            connect_confirmation_button.find_element(By.XPATH, '..').click()
-                            sleep(company_people_configuration['connectDelay'])
-                        elif button_text == company_people_configuration['messageInnerHTML'] or \
-                                button_text == company_people_configuration['followInnerHTML']:
-                            link = people[i] \
-                                .find_element(By.CLASS_NAME, company_people_configuration['linkClass']) \
-                                .get_attribute('href')
-                            ConnectionHandler.__connect_to_user(url=link)
-                        else:
-                            continue
+        if button:
+            # Relative to the card, rather than searching the whole document for every invitation
+            button_locator = '.' + locators[f'{button}InnerHTML'] + '/..'
+            confirmation_locator = ConnectionHandler.__get_confirmation_locator(endpoint,
+                                                                                f'{button}ConfirmationInnerHTML')
 
-                    names.append(name)
-                    headlines.append(headline)
-                    links.append(link)
+        def act(person: dict, cards: list):
+            card = ExtractionHandler.get_element(person['element'])
+            cards.append(card)
+            card.find_element(By.XPATH, button_locator).click()
 
-                    if len(names) >= maximum_connections != -1:
-                        break
+            confirmation_button = WaitHandler.element((By.XPATH, confirmation_locator), web_load_delay)
+            confirmation_button.click()
+            WaitHandler.element_gone(confirmation_button, configuration[f'{button}Delay'])
 
-                if prev_len == len(people):
-                    if driver.execute_script('(window.innerHeight + window.scrollY) >= document.body.scrollHeight'):
-                        break
-                    else:
-                        driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+        with ProfileWriter(output) as writer:
+            for person in SourceHandler.iterate(endpoint, url, url, fields, {}):
+                name, headline, link = person['name'], person['headline'], person['link']
 
-                prev_len = len(people)
+                if minimum_age and ConnectionHandler.__get_age(person['age']) < minimum_age:
+                    continue
 
-                sleep(company_people_configuration['scrollDelay'])
+                if button:
+                    if not ActionScheduler.acquire(action):
+                        break
 
-            df = pd.DataFrame(
-                {'Name': names,
-                 'HeadLine': headlines,
-                 'Link': links
-                 })
+                    cards = []
+                    try:
+                        with MetricsHandler.span(f'action.{button}'):
+                            ResilienceHandler.retry(
+                                lambda: act(person, cards),
+                                lambda _: ConnectionHandler.__relocate(endpoint, person, fields),
+                                name=button
+                            )
+                    except TRANSIENT_EXCEPTIONS:
+                        ActionScheduler.refund(action)
+                        MetricsHandler.increment('failures')
+                        continue
+                    finally:
+                        # Lets the source keep its place in the list once LinkedIn removes the actioned card, even if
+                        # a failed attempt removed it
+                        person['removed'] = bool(cards) and EC.staleness_of(cards[-1])(driver)
 
-            df.to_csv(f'./out/Company People - {company}.csv', index=False)
+                writer.write(name, headline, link)
+                ConnectionHandler.__record(link, name, headline, endpoint, action)
 
     @staticmethod
     def handle_received_invitations(accept: bool = False, ignore: bool = False):
         """
-        Iterates through profiles in the `received invitations page <RECEIVED_INVITATIONS_>`_.
+        Iterates through profiles in the `received invitations page <RECEIVED_INVITATIONS_>`_, loading every batch of
+        the list.
 
         :param bool accept: Specify whether to accept the invitation of the retrieved list of profiles or not
         :param bool ignore: Specify whether to ignore the invitation of the retrieved list of profiles or not
@@ -676,142 +946,35 @@ class ConnectionHandler:
         if accept and ignore:
             raise ValueError('accept and ignore cannot be set to True at the same time')
 
-        received_invitations_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['receivedInvitations']
-
-        driver = DriverHandler.get_driver()
-        url = received_invitations_configuration['url']
-
-        driver.get(url)
-
-        WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']) \
-            .until(EC.presence_of_element_located((By.CLASS_NAME, received_invitations_configuration['nameClass'])))
-
-        people = driver \
-            .find_element(By.CLASS_NAME, received_invitations_configuration['invitationListClass']) \
-            .find_elements(By.TAG_NAME, 'li')
-
-        names = []
-        headlines = []
-        links = []
-
-        for person in people:
-            names.append(
-                person
-                .find_element(By.CLASS_NAME, received_invitations_configuration['nameClass'])
-                .get_attribute('innerText')
-            )
-            headlines.append(
-                person
-                .find_element(By.CLASS_NAME, received_invitations_configuration['headlineClass'])
-                .get_attribute('innerText')
-            )
-            links.append(
-                person
-                .find_element(By.CLASS_NAME, received_invitations_configuration['linkClass'])
-                .get_attribute('href')
-            )
-
-            if accept:
-                accept_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + received_invitations_configuration['acceptInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                accept_button.click()
-
-                accept_confirmation_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + received_invitations_configuration['acceptConfirmationInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                accept_confirmation_button.click()
-                sleep(received_invitations_configuration['acceptDelay'])
-
-            if ignore:
-                ignore_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + received_invitations_configuration['ignoreInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                ignore_button.click()
-
-                ignore_confirmation_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + received_invitations_configuration['ignoreConfirmationInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                ignore_confirmation_button.click()
-                sleep(received_invitations_configuration['ignoreDelay'])
-
-        df = pd.DataFrame(
-            {'Name': names,
-             'HeadLine': headlines,
-             'Link': links
-             })
-
-        df.to_csv('./out/Received Invitations.csv', index=False)
+        if accept:
+            ConnectionHandler.__handle_invitations('receivedInvitations', 'Received Invitations',
+                                                   ProfileActions.ACCEPTED, 'accept')
+        elif ignore:
+            ConnectionHandler.__handle_invitations('receivedInvitations', 'Received Invitations',
+                                                   ProfileActions.IGNORED, 'ignore')
+        else:
+            ConnectionHandler.__handle_invitations('receivedInvitations', 'Received Invitations',
+                                                   ProfileActions.RECORDED)
 
     @staticmethod
-    def handle_sent_invitations(withdraw: bool = False):
+    def handle_sent_invitations(withdraw: bool = False, minimum_age: Optional[float] = None):
         """
-        Iterates through profiles in the `sent invitations page <SENT_INVITATIONS_>`_.
+        Iterates through profiles in the `sent invitations page <SENT_INVITATIONS_>`_, loading every batch of the
+        list.
 
         :param bool withdraw: Specify whether to withdraw the invitation sent to the retrieved list of profiles or not
-        :raises ValueError: if both accept and ignore are truthful
+        :param Optional[float] minimum_age: Specify the minimum age of an invitation in days, e.g. 21 only handles
+                                            invitations sent three weeks ago or earlier, defaults to the minimumAge
+                                            value in config.json
 
         .. _SENT_INVITATIONS: https://www.linkedin.com/mynetwork/invitation-manager/sent/
         """
-        sent_invitations_configuration = \
-            ConfigurationHandler.get_configuration()['endpoints']['sentInvitations']
+        if minimum_age is None:
+            minimum_age = ConfigurationHandler.get_configuration()['endpoints']['sentInvitations']['minimumAge']
 
-        driver = DriverHandler.get_driver()
-        url = sent_invitations_configuration['url']
-
-        driver.get(url)
-
-        WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']) \
-            .until(EC.presence_of_element_located((By.CLASS_NAME, sent_invitations_configuration['nameClass'])))
-
-        people = driver \
-            .find_element(By.CLASS_NAME, sent_invitations_configuration['invitationListClass']) \
-            .find_elements(By.TAG_NAME, 'li')
-
-        names = []
-        headlines = []
-        links = []
-
-        for person in people:
-            names.append(
-                person
-                .find_element(By.CLASS_NAME, sent_invitations_configuration['nameClass'])
-                .get_attribute('innerText')
-            )
-            headlines.append(
-                person
-                .find_element(By.CLASS_NAME, sent_invitations_configuration['headlineClass'])
-                .get_attribute('innerText')
-            )
-            links.append(
-                person
-                .find_element(By.CLASS_NAME, sent_invitations_configuration['linkClass'])
-                .get_attribute('href')
-            )
-
-            if withdraw:
-                withdraw_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + sent_invitations_configuration['withdrawInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                withdraw_button.click()
-
-                withdraw_confirmation_button = person.find_element(
-                    By.XPATH,
-                    '//*[text()="' + sent_invitations_configuration['withdrawConfirmationInnerHTML'] + '"]'
-                ).find_element(By.XPATH, '..')
-                withdraw_confirmation_button.click()
-                sleep(sent_invitations_configuration['withdrawDelay'])
-
-        df = pd.DataFrame(
-            {'Name': names,
-             'HeadLine': headlines,
-             'Link': links
-             })
-
-        df.to_csv('./out/Sent Invitations.csv', index=False)
+        if withdraw:
+            ConnectionHandler.__handle_invitations('sentInvitations', 'Sent Invitations', ProfileActions.WITHDRAWN,
+                                                   'withdraw', minimum_age)
+        else:
+            ConnectionHandler.__handle_invitations('sentInvitations', 'Sent Invitations', ProfileActions.RECORDED,
+                                                   minimum_age=minimum_age)
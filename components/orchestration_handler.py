@@ -0,0 +1,189 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from providers.account_handler import AccountHandler
+from providers.configuration_handler import ConfigurationHandler
+from providers.profile_store_handler import ProfileStoreHandler
+
+
+class OrchestrationHandler:
+    """
+    Static methods which runs a workflow for several accounts at once, one worker process per account, so that the
+    throughput scales with the number of accounts. Every worker is an ordinary run of the command line with its own
+    web driver, cookie jar, action quota and output directory, see AccountHandler, and the progress of every worker is
+    aggregated from its profile store.
+
+    Attributes
+    ----------
+        __ACCOUNT_OPTIONS  The command line options which select the accounts, removed from the workers' arguments
+
+    Methods
+    -------
+        __get_worker_arguments(argv: list[str]) -> list[str]:
+            Removes the account options from the command line arguments.
+        __get_progress(name: str, started: float) -> dict[str, int]:
+            Provides the number of profiles an account handled since the workers were started, per action.
+        __report(workers: dict[str, subprocess.Popen], started: float) -> dict:
+            Prints and provides the aggregated progress of the workers.
+        run(names: list[str], argv: list[str]) -> int:
+            Runs a workflow for every specified account, each in its own worker process, and waits for them.
+    """
+
+    __ACCOUNT_OPTIONS = ['--account', '--all-accounts']
+
+    @staticmethod
+    def __get_worker_arguments(argv: list[str]) -> list[str]:
+        """
+        Removes the account options from the command line arguments, every worker receives its own account instead.
+
+        :param list[str] argv: Specify the command line arguments
+        :returns: The command line arguments, without --account NAME and --all-accounts
+        :rtype: list[str]
+        """
+        arguments = []
+        skip = False
+
+        for argument in argv:
+            if skip:
+                skip = False
+            elif argument == '--account':
+                skip = True
+            elif argument.split('=')[0] not in OrchestrationHandler.__ACCOUNT_OPTIONS:
+                arguments.append(argument)
+
+        return arguments
+
+    @staticmethod
+    def __get_progress(name: str, started: float) -> dict[str, int]:
+        """
+        Provides the number of profiles an account handled since the workers were started, per action, read from the
+        account's profile store while the worker is writing to it.
+
+        :param str name: Specify the account name
+        :param float started: Specify the UNIX time the workers were started at
+        :returns: The number of profiles keyed by the action, e.g. connected
+        :rtype: dict[str, int]
+        """
+        return ProfileStoreHandler.count_actions(AccountHandler.get_overrides(name)['profileStore'], started)
+
+    @staticmethod
+    def __report(workers: dict[str, subprocess.Popen], started: float) -> dict:
+        """
+        Prints a single line with the progress of every worker and their total, and provides the aggregated
+        progress.
+
+        :param dict[str, subprocess.Popen] workers: Specify the worker process of every account
+        :param float started: Specify the UNIX time the workers were started at
+        :returns: The elapsed seconds, the profiles per minute, the total number of profiles per action and the
+                  progress of every account
+        :rtype: dict
+        """
+        elapsed = time.time() - started
+        accounts = {}
+        actions = {}
+
+        for name, worker in workers.items():
+            progress = OrchestrationHandler.__get_progress(name, started)
+            accounts[name] = {'exitCode': worker.poll(), 'actions': progress}
+
+            for action, count in progress.items():
+                actions[action] = actions.get(action, 0) + count
+
+        profiles_per_minute = sum(actions.values()) / (elapsed / 60) if elapsed else 0.0
+
+        def describe(counts: dict[str, int]) -> str:
+            return ', '.join(f'{count} {action}' for action, count in sorted(counts.items())) or 'no profiles'
+
+        statuses = []
+        for name, account in accounts.items():
+            state = 'running' if account['exitCode'] is None else f'exited {account["exitCode"]}'
+            statuses.append(f'{name} {state}: {describe(account["actions"])}')
+
+        print(f'[{int(elapsed) // 3600:02}:{int(elapsed) % 3600 // 60:02}:{int(elapsed) % 60:02}] '
+              f'{" | ".join(statuses)} | total: {describe(actions)}, {profiles_per_minute:.1f} profiles/minute',
+              flush=True)
+
+        return {
+            'elapsedSeconds': elapsed,
+            'profilesPerMinute': profiles_per_minute,
+            'actions': actions,
+            'accounts': accounts,
+        }
+
+    @staticmethod
+    def run(names: list[str], argv: list[str]) -> int:
+        """
+        Runs a workflow for every specified account, each in its own worker process, and waits for them. The progress
+        is printed every accounts.statusInterval seconds in config.json, the output of every worker is written to
+        worker.log in its account's directory, and the final progress of every account, along with its metrics
+        summary if metrics.enabled is set, is written to summary.json in accounts.directory. Workers do not read the
+        console, every account must declare its credentials in its overrides, or have a valid cookie jar.
+
+        :param list[str] names: Specify the account names
+        :param list[str] argv: Specify the command line arguments of the workflow, the account options are removed
+        :returns: 0 if every worker succeeded, 1 otherwise
+        :rtype: int
+        """
+        configuration = ConfigurationHandler.get_configuration()['accounts']
+        arguments = OrchestrationHandler.__get_worker_arguments(argv)
+
+        started = time.time()
+        workers = {}
+        logs = []
+
+        try:
+            for name in names:
+                directory = AccountHandler.get_directory(name)
+                os.makedirs(directory, exist_ok=True)
+
+                log = open(os.path.join(directory, 'worker.log'), 'a', encoding='utf-8')
+                logs.append(log)
+
+                workers[name] = subprocess.Popen([sys.executable, '-m', 'main', '--account', name, *arguments],
+                                                 stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT)
+
+            finished = False
+
+            while not finished:
+                deadline = time.monotonic() + configuration['statusInterval']
+
+                for worker in workers.values():
+                    try:
+                        worker.wait(max(deadline - time.monotonic(), 0))
+                    except subprocess.TimeoutExpired:
+                        pass
+
+                finished = all(worker.poll() is not None for worker in workers.values())
+
+                summary = OrchestrationHandler.__report(workers, started)
+        except KeyboardInterrupt:
+            # The workers received the interrupt as well, and save their checkpoints before exiting
+            for worker in workers.values():
+                try:
+                    worker.wait(configuration['statusInterval'])
+                except subprocess.TimeoutExpired:
+                    worker.terminate()
+                    worker.wait()
+
+            summary = OrchestrationHandler.__report(workers, started)
+        finally:
+            for log in logs:
+                log.close()
+
+        for name, account in summary['accounts'].items():
+            path = AccountHandler.get_overrides(name)['metrics.summaryFile']
+            account['metrics'] = None
+
+            if path and os.path.exists(path) and os.path.getmtime(path) >= started:
+                with open(path, encoding='utf-8') as file:
+                    account['metrics'] = json.load(file)
+
+        path = os.path.join(configuration['directory'], 'summary.json')
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+        os.replace(f'{path}.tmp', path)
+
+        return 0 if all(worker.returncode == 0 for worker in workers.values()) else 1
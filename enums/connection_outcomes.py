@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ConnectionOutcomes(Enum):
+    """
+    Enumerate outcomes of connecting to a profile through its profile page.
+    """
+    CONNECTED = 'connected'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
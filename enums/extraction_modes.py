@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ExtractionModes(Enum):
+    """
+    Enumerate profile card extraction modes.
+    """
+    LEGACY = 'legacy'
+    BATCH = 'batch'
+    SNAPSHOT = 'snapshot'
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ProfileActions(Enum):
+    """
+    Enumerate actions taken on a profile.
+    """
+    RECORDED = 'recorded'
+    CONNECTED = 'connected'
+    ACCEPTED = 'accepted'
+    IGNORED = 'ignored'
+    WITHDRAWN = 'withdrawn'
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class SourceStrategies(Enum):
+    """
+    Enumerate the strategies of traversing a profile source.
+    """
+    PAGINATION = 'pagination'
+    INFINITE_SCROLL = 'infinite scroll'
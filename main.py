@@ -1,4 +1,148 @@
-from components.authentication_handler import AuthenticationHandler
-from components.connection_handler import ConnectionHandler
+import argparse
+import sys
+from typing import Optional
 
-AuthenticationHandler.login()
+# Subcommand => (ConnectionHandler method, help), the handlers are imported only when a subcommand actually runs
+COMMANDS = {
+    'suggestions': ('handle_suggestions', "Connects to the profiles under the 'More suggestions for you' section"),
+    'people-search': ('handle_people_search', 'Connects to the profiles of each people search page'),
+    'profile-connections': ('handle_profile_connections',
+                            'Connects to the connections of the profileNames in config.json, breadth-first'),
+    'company-people': ('handle_company_people', 'Connects to the people of the companyNames in config.json'),
+    'received-invitations': ('handle_received_invitations', 'Accepts/ignores the incoming connection requests'),
+    'sent-invitations': ('handle_sent_invitations', 'Withdraws the outgoing connection requests'),
+    'source': ('handle_source', 'Connects to the profiles of any endpoint in config.json which declares a strategy'),
+}
+
+# Arguments which configure the run rather than the handler
+GLOBAL_ARGUMENTS = ['command', 'dry_run', 'refresh_drivers', 'account', 'all_accounts']
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line parser, with a subcommand per ConnectionHandler.handle_* method.
+
+    :returns: The command line parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m main',
+        description='Logs in to LinkedIn and runs a connection workflow, passive unless an action flag is set.'
+    )
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print the workflow which would run, without launching a browser')
+    parser.add_argument('--refresh-drivers', action='store_true',
+                        help='install the web driver binary again, regardless of the manifest')
+    parser.add_argument('--account', action='append', metavar='NAME',
+                        help='run as an account of accounts.profiles in config.json, repeat to run several accounts at '
+                             'once, one process per account')
+    parser.add_argument('--all-accounts', action='store_true',
+                        help='run every account of accounts.profiles in config.json at once, one process per account')
+
+    subparsers = parser.add_subparsers(dest='command', metavar='command', required=True)
+    commands = {name: subparsers.add_parser(name, help=help_text, description=help_text)
+                for name, (_, help_text) in COMMANDS.items()}
+
+    commands['source'].add_argument('endpoint', help='endpoint name in config.json, e.g. peopleSearch')
+
+    for name in ['suggestions', 'people-search', 'profile-connections', 'company-people', 'source']:
+        commands[name].add_argument('--connect', action='store_true', help='send connection requests')
+        commands[name].add_argument('--resume', action='store_true',
+                                    help='continue an interrupted run from its last checkpoint')
+
+    commands['profile-connections'].add_argument('--depth', type=int, default=1,
+                                                 help='number of connection levels to crawl (default: 1)')
+
+    commands['received-invitations'].add_argument('--accept', action='store_true', help='accept the requests')
+    commands['received-invitations'].add_argument('--ignore', action='store_true', help='ignore the requests')
+
+    commands['sent-invitations'].add_argument('--withdraw', action='store_true',
+                                              help='withdraw the requests, LinkedIn will not permit reconnecting '
+                                                   'to the same profile for three weeks')
+    commands['sent-invitations'].add_argument('--minimum-age', type=float, metavar='DAYS',
+                                              help='only handle requests sent at least DAYS days ago (default: '
+                                                   'minimumAge in config.json)')
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None):
+    """
+    Parses the command line, logs in and invokes the selected ConnectionHandler.handle_* method. Several accounts
+    are handed over to OrchestrationHandler, which runs this very command line once per account.
+
+    :param Optional[list[str]] argv: Specify the command line arguments, defaults to sys.argv
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    arguments = vars(build_parser().parse_args(argv))
+
+    method = COMMANDS[arguments['command']][0]
+    parameters = {key: value for key, value in arguments.items() if key not in GLOBAL_ARGUMENTS}
+
+    from providers.configuration_handler import ConfigurationHandler
+
+    # An invalid config.json fails before the browser is launched rather than midway through a run
+    try:
+        configuration = ConfigurationHandler.get_configuration()
+    except (OSError, ValueError) as exception:
+        raise SystemExit(f'config.json: {exception}')
+
+    # Listed twice, an account would run in two processes sharing its files
+    accounts = list(dict.fromkeys(arguments['account'] or []))
+    orchestrated = arguments['all_accounts'] or len(accounts) > 1
+
+    if accounts or arguments['all_accounts']:
+        from providers.account_handler import AccountHandler
+
+        if arguments['all_accounts']:
+            accounts = AccountHandler.get_names()
+
+        if not accounts:
+            raise SystemExit('config.json: accounts.profiles declares no account')
+
+        try:
+            for account in accounts:
+                AccountHandler.get_overrides(account)
+
+            if not orchestrated:
+                AccountHandler.apply(accounts[0])
+                configuration = ConfigurationHandler.get_configuration()
+        except (KeyError, ValueError) as exception:
+            raise SystemExit(f'config.json: {exception.args[0]}')
+
+    if arguments['dry_run']:
+        for account in accounts:
+            print(f'Account: {account} ({AccountHandler.get_directory(account)})'
+                  f'{", in its own process" if orchestrated else ""}')
+        print(f'Web driver: {configuration["webDriver"]}')
+        print(f'Workflow: ConnectionHandler.{method}'
+              f'({", ".join(f"{key}={value}" for key, value in parameters.items())})')
+        if method == 'handle_company_people':
+            print(f'Targets: {", ".join(configuration["companyNames"])}')
+        elif method == 'handle_profile_connections':
+            print(f'Targets: {", ".join(configuration["profileNames"])}')
+        return
+
+    if orchestrated:
+        from components.orchestration_handler import OrchestrationHandler
+
+        raise SystemExit(OrchestrationHandler.run(accounts, argv))
+
+    if arguments['refresh_drivers']:
+        ConfigurationHandler.set_value('driverBinaries.refresh', True)
+
+    from components.authentication_handler import AuthenticationHandler
+    from components.connection_handler import ConnectionHandler
+    from providers.metrics_handler import MetricsHandler
+
+    with MetricsHandler.span('handler.login'):
+        AuthenticationHandler.login()
+
+    with MetricsHandler.span(f'handler.{method}'):
+        getattr(ConnectionHandler, method)(**parameters)
+
+
+if __name__ == '__main__':
+    main()
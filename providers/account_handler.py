@@ -0,0 +1,126 @@
+import os
+from typing import Any, Mapping
+
+from providers.configuration_handler import ConfigurationHandler
+
+
+class AccountHandler:
+    """
+    Static methods which isolates the accounts declared by accounts.profiles in config.json from one another; every
+    account runs in its own process, and is given its own output, checkpoint, profile store, action quota, cookie jar
+    and metrics files under accounts.directory/NAME.
+
+    Attributes
+    ----------
+        __PATHS  The configuration keys of the files and directories of a run, mapped to their location within the
+                 account's directory, empty values in config.json (e.g. a disabled cookie jar) are kept empty
+
+    Methods
+    -------
+        __thaw(value) -> Any:
+            Converts a read-only configuration value into a decoded JSON one.
+        get_names() -> list[str]:
+            Provides the name of every account.
+        get_directory(name: str) -> str:
+            Provides the directory which receives every file of an account.
+        get_overrides(name: str) -> dict[str, Any]:
+            Provides the configuration values which are overridden for an account.
+        apply(name: str):
+            Overrides the configuration for an account, for the rest of the run.
+    """
+
+    __PATHS = {
+        'outputDirectory': '',
+        'checkpointDirectory': 'checkpoints',
+        'snapshotDirectory': 'snapshots',
+        'profileStore': 'profiles.db',
+        'actionScheduler.quotaFile': 'action_quota.json',
+        'endpoints.longin.cookieJar': 'cookies.json',
+        'metrics.summaryFile': 'metrics.json',
+        'metrics.prometheusFile': 'metrics.prom',
+    }
+
+    @staticmethod
+    def __thaw(value) -> Any:
+        """
+        Converts a read-only configuration value into a decoded JSON one, mappings become dictionaries and tuples
+        become lists.
+
+        :param value: Specify the read-only value
+        :returns: The decoded JSON value
+        :rtype: Any
+        """
+        if isinstance(value, Mapping):
+            return {key: AccountHandler.__thaw(item) for key, item in value.items()}
+
+        if isinstance(value, tuple):
+            return [AccountHandler.__thaw(item) for item in value]
+
+        return value
+
+    @staticmethod
+    def get_names() -> list[str]:
+        """
+        Provides the name of every account, in the order of accounts.profiles in config.json.
+
+        :returns: The account names
+        :rtype: list[str]
+        """
+        return [profile['name'] for profile in ConfigurationHandler.get_configuration()['accounts']['profiles']]
+
+    @staticmethod
+    def get_directory(name: str) -> str:
+        """
+        Provides the directory which receives every file of an account.
+
+        :param str name: Specify the account name
+        :returns: The account's directory, within accounts.directory in config.json
+        :rtype: str
+        """
+        return os.path.join(ConfigurationHandler.get_configuration()['accounts']['directory'], name)
+
+    @staticmethod
+    def get_overrides(name: str) -> dict[str, Any]:
+        """
+        Provides the configuration values which are overridden for an account, that is, the paths of every file the
+        run writes, followed by the account's overrides in config.json, which take precedence.
+
+        :param str name: Specify the account name
+        :returns: The overridden values, keyed by their dotted configuration key, e.g. endpoints.longin.username
+        :rtype: dict[str, Any]
+        :raises KeyError: if the account is not declared in config.json
+        """
+        configuration = ConfigurationHandler.get_configuration()
+
+        profiles = [profile for profile in configuration['accounts']['profiles'] if profile['name'] == name]
+
+        if not profiles:
+            raise KeyError(f'the account {name} is not declared by accounts.profiles in config.json')
+
+        directory = AccountHandler.get_directory(name)
+        overrides = {}
+
+        for key, location in AccountHandler.__PATHS.items():
+            value = configuration
+            for part in key.split('.'):
+                value = value[part]
+
+            path = os.path.join(directory, location) if location else directory
+            overrides[key] = path if value else value
+
+        overrides.update(AccountHandler.__thaw(profiles[0]['overrides']))
+
+        return overrides
+
+    @staticmethod
+    def apply(name: str):
+        """
+        Overrides the configuration for an account, for the rest of the run; must be invoked before anything is read
+        or written.
+
+        :param str name: Specify the account name
+        :raises KeyError: if the account is not declared in config.json, or an override's section does not exist
+        :raises ValueError: if an override is invalid
+        """
+        for key, value in AccountHandler.get_overrides(name).items():
+            ConfigurationHandler.set_value(key, value)
@@ -0,0 +1,176 @@
+import json
+import os
+import random
+import threading
+import time
+
+from enums.profile_actions import ProfileActions
+from providers.configuration_handler import ConfigurationHandler
+from providers.metrics_handler import MetricsHandler
+from providers.resilience_handler import ResilienceHandler
+
+WEEK = 7 * 24 * 60 * 60
+
+
+class ActionScheduler:
+    """
+    Static methods which paces every click on a profile (connect, accept, ignore, withdraw) across all handlers and
+    sessions, using a token bucket per action and a rolling weekly quota persisted across runs.
+
+    Attributes
+    ----------
+        __buckets  The available tokens and the last refill time, keyed by the action
+        __history  The timestamps of the actions performed in the last week, keyed by the action
+        __lock  Guards the buckets and the history
+
+    Methods
+    -------
+        __get_limits(action: ProfileActions) -> dict:
+            Provides the rate limits of an action based on the actionScheduler.actions value in config.json.
+        __get_history() -> dict[str, list[float]]:
+            Provides the actions performed in the last week, loads them from the quota file on first use.
+        __save_history():
+            Atomically replaces the quota file.
+        get_remaining(action: ProfileActions) -> int:
+            Provides the number of actions left in the rolling weekly quota.
+        acquire(action: ProfileActions) -> bool:
+            Waits until an action can be performed without exceeding its rate limits, and reserves it.
+        refund(action: ProfileActions):
+            Gives back a reservation of an action which was not performed.
+    """
+
+    __buckets = {}
+    __history = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def __get_limits(action: ProfileActions) -> dict:
+        """
+        Provides the rate limits of an action based on the actionScheduler.actions value in config.json.
+
+        :param ProfileActions action: Specify the action
+        :returns: The hourly rate, the burst size and the weekly limit of the action, -1 denotes no limit
+        :rtype: dict
+        """
+        return ConfigurationHandler.get_configuration()['actionScheduler']['actions'][action.value]
+
+    @staticmethod
+    def __get_history() -> dict[str, list[float]]:
+        """
+        Provides the actions performed in the last week, loads them from the quota file on first use.
+
+        :returns: The timestamps of the performed actions, keyed by the action
+        :rtype: dict[str, list[float]]
+        """
+        if ActionScheduler.__history is None:
+            path = ConfigurationHandler.get_configuration()['actionScheduler']['quotaFile']
+
+            try:
+                with open(path, encoding='utf-8') as file:
+                    ActionScheduler.__history = json.load(file)
+            except (OSError, ValueError):
+                ActionScheduler.__history = {}
+
+        cutoff = time.time() - WEEK
+        for action, timestamps in ActionScheduler.__history.items():
+            ActionScheduler.__history[action] = [timestamp for timestamp in timestamps if timestamp > cutoff]
+
+        return ActionScheduler.__history
+
+    @staticmethod
+    def __save_history():
+        """
+        Atomically replaces the quota file.
+        """
+        path = ConfigurationHandler.get_configuration()['actionScheduler']['quotaFile']
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(ActionScheduler.__history, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def get_remaining(action: ProfileActions) -> int:
+        """
+        Provides the number of actions left in the rolling weekly quota.
+
+        :param ProfileActions action: Specify the action
+        :returns: The number of actions left, -1 if the action has no weekly limit
+        :rtype: int
+        """
+        weekly_limit = ActionScheduler.__get_limits(action)['weeklyLimit']
+
+        if weekly_limit == -1:
+            return -1
+
+        with ActionScheduler.__lock:
+            return max(weekly_limit - len(ActionScheduler.__get_history().get(action.value, [])), 0)
+
+    @staticmethod
+    def acquire(action: ProfileActions) -> bool:
+        """
+        Waits until an action can be performed without exceeding its rate limits, and reserves it. Only waits for a
+        random jitter of up to actionScheduler.jitter seconds in config.json while the action's bucket holds tokens,
+        otherwise additionally waits exactly until the next token is refilled. Also waits while the circuit breaker
+        is open, see ResilienceHandler.check().
+
+        :param ProfileActions action: Specify the action
+        :returns: False if the weekly quota of the action is exhausted, in which case the action must not be performed
+        :rtype: bool
+        :raises RuntimeError: if the run was stopped by the circuit breaker
+        """
+        ResilienceHandler.wait_closed()
+
+        limits = ActionScheduler.__get_limits(action)
+        rate = limits['perHour'] / 3600
+        burst = limits['burst']
+
+        with ActionScheduler.__lock:
+            history = ActionScheduler.__get_history()
+            timestamps = history.setdefault(action.value, [])
+
+            if limits['weeklyLimit'] != -1 and len(timestamps) >= limits['weeklyLimit']:
+                return False
+
+            tokens = 0
+            if rate > 0:
+                now = time.monotonic()
+                tokens, updated = ActionScheduler.__buckets.get(action, (burst, now))
+                tokens = min(burst, tokens + (now - updated) * rate) - 1
+                ActionScheduler.__buckets[action] = (tokens, now)
+
+            timestamps.append(time.time())
+            ActionScheduler.__save_history()
+
+        # A negative balance is owed by this reservation, concurrent sessions queue up behind it
+        wait = -tokens / rate if tokens < 0 else 0
+        with MetricsHandler.span('sleep.scheduler'):
+            time.sleep(wait + random.uniform(0, ConfigurationHandler.get_configuration()['actionScheduler']['jitter']))
+
+        return True
+
+    @staticmethod
+    def refund(action: ProfileActions):
+        """
+        Gives back a reservation of an action which was not performed, e.g. every attempt to click failed, so that it
+        does not count towards the rate limits nor the weekly quota. Must be invoked at most once per successful
+        acquire(action).
+
+        :param ProfileActions action: Specify the action
+        """
+        limits = ActionScheduler.__get_limits(action)
+
+        with ActionScheduler.__lock:
+            timestamps = ActionScheduler.__get_history().get(action.value, [])
+
+            if timestamps:
+                timestamps.pop()
+                ActionScheduler.__save_history()
+
+            if action in ActionScheduler.__buckets:
+                tokens, updated = ActionScheduler.__buckets[action]
+                ActionScheduler.__buckets[action] = (min(limits['burst'], tokens + 1), updated)
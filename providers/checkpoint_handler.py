@@ -0,0 +1,72 @@
+import json
+import os
+import re
+
+from providers.configuration_handler import ConfigurationHandler
+
+
+class CheckpointHandler:
+    """
+    Static methods which handles the progress checkpoints of handlers, used to resume interrupted runs.
+
+    Methods
+    -------
+        __get_path(handler: str, target: str) -> str:
+            Provides the checkpoint file path of a handler and target.
+        load(handler: str, target: str) -> dict:
+            Provides the last saved checkpoint of a handler and target.
+        save(handler: str, target: str, checkpoint: dict):
+            Atomically replaces the checkpoint of a handler and target.
+    """
+
+    @staticmethod
+    def __get_path(handler: str, target: str) -> str:
+        """
+        Provides the checkpoint file path of a handler and target.
+
+        :param str handler: Specify the handler's endpoint name, e.g. peopleSearch
+        :param str target: Specify the handler's target, e.g. the company name, the profile name or the search URL
+        :returns: The checkpoint file path
+        :rtype: str
+        """
+        target = re.sub(r'[^\w.-]+', '_', target).strip('_')
+        return os.path.join(ConfigurationHandler.get_configuration()['checkpointDirectory'],
+                            f'{handler} - {target}.json')
+
+    @staticmethod
+    def load(handler: str, target: str) -> dict:
+        """
+        Provides the last saved checkpoint of a handler and target.
+
+        :param str handler: Specify the handler's endpoint name, e.g. peopleSearch
+        :param str target: Specify the handler's target, e.g. the company name, the profile name or the search URL
+        :returns: The checkpoint, empty if none was saved
+        :rtype: dict
+        """
+        path = CheckpointHandler.__get_path(handler, target)
+
+        if not os.path.exists(path):
+            return {}
+
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def save(handler: str, target: str, checkpoint: dict):
+        """
+        Atomically replaces the checkpoint of a handler and target.
+
+        :param str handler: Specify the handler's endpoint name, e.g. peopleSearch
+        :param str target: Specify the handler's target, e.g. the company name, the profile name or the search URL
+        :param dict checkpoint: Specify the checkpoint, e.g. the last completed page and the pagination threshold
+        """
+        path = CheckpointHandler.__get_path(handler, target)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(f'{path}.tmp', path)
@@ -1,32 +1,415 @@
+import copy
 import json
+import os
+import re
+import threading
+import time
+import warnings
+from types import MappingProxyType
+from typing import Mapping
+
+from enums.extraction_modes import ExtractionModes
+from enums.profile_actions import ProfileActions
+from enums.source_strategies import SourceStrategies
+from enums.web_drivers import WebDrivers
+
+NUMBER = (int, float)
 
 
 class ConfigurationHandler:
     """
-    Static methods which handles config.json decoding.
+    Static methods which handles config.json decoding. The configuration is validated and frozen once, and reloaded
+    whenever config.json is modified.
 
     Attributes
     ----------
-        __configuration  Acts as a cache for storing the configuration dictionary
+        __PATH  The path of the configuration file
+        __SCHEMA  The type of every required value, nested sections are described by nested dictionaries
+        __SOURCE_SCHEMA  The type of every value required by an endpoint which declares a strategy, per strategy
+        __CONNECT_SCHEMA  The type of every value required by an endpoint which declares a strategy to connect to its
+                          profiles
+        __INVITATION_ENDPOINTS  The endpoints which declare a strategy, but act upon invitations rather than connect
+        __document  The decoded configuration file, without the overrides
+        __overrides  The values overridden for the rest of the run, keyed by their dotted key
+        __configuration  Acts as a cache for storing the frozen configuration
+        __locators  The XPath locators of the text values of every endpoint, keyed by the endpoint name
+        __modified  The modification time of the configuration file when it was last read
+        __checked  The time config.json was last checked for modifications
+        __lock  Guards reloading the configuration
 
     Methods
     -------
-        get_configuration() -> dict:
-            Provides a dictionary of the configuration.
+        __freeze(value):
+            Converts a decoded JSON value into a read-only one.
+        __literal(text: str) -> str:
+            Quotes a text as an XPath string literal.
+        __check(value, schema, key: str, errors: list[str]):
+            Validates a value against its schema.
+        __validate(configuration: dict):
+            Validates a configuration, reporting every invalid value at once.
+        __build():
+            Applies the overrides to the decoded configuration file, validates, freezes and compiles it.
+        __load():
+            Reads config.json and builds the configuration.
+        get_configuration() -> Mapping:
+            Provides a read-only mapping of the configuration.
+        get_locators(endpoint: str) -> Mapping[str, str]:
+            Provides the precompiled XPath locators of an endpoint's text values.
+        set_value(key: str, value):
+            Overrides a configuration value for the rest of the run, without modifying config.json.
     """
 
+    __PATH = './config.json'
+
+    __SCHEMA = {
+        'webDriver': str,
+        'maximumConnections': int,
+        'securityVerificationDelay': NUMBER,
+        'webLoadDelay': NUMBER,
+        'waitPollFrequency': NUMBER,
+        'configurationReloadInterval': NUMBER,
+        'extractionMode': str,
+        'snapshotDirectory': str,
+        'outputDirectory': str,
+        'outputFormats': list,
+        'outputFsyncInterval': int,
+        'checkpointDirectory': str,
+        'profileStore': str,
+        'skipKnownProfiles': bool,
+        'filters': {'includeKeywords': list, 'excludeKeywords': list, 'includePatterns': list,
+                    'excludePatterns': list, 'blockedProfiles': list},
+        'driverBinaries': {'manifest': str, 'refresh': bool},
+        'performanceProfile': {'enabled': bool, 'headless': bool, 'windowSize': str, 'pageLoadStrategy': str,
+                               'blockImages': bool, 'blockMedia': bool, 'blockedURLs': list},
+        'metrics': {'enabled': bool, 'summaryFile': str, 'prometheusFile': str},
+        'resilience': {'retries': int, 'backoff': NUMBER, 'maximumBackoff': NUMBER, 'restrictionURLs': list,
+                       'pauseTimeout': NUMBER},
+        'pipeline': {'enabled': bool, 'queueSize': int},
+        'actionScheduler': {
+            'quotaFile': str,
+            'jitter': NUMBER,
+            'actions': {action.value: {'perHour': NUMBER, 'burst': NUMBER, 'weeklyLimit': int}
+                        for action in ProfileActions if action != ProfileActions.RECORDED},
+        },
+        'sessionPool': {'size': int, 'maximumFailures': int, 'cookieDomainURL': str},
+        'accounts': {'directory': str, 'statusInterval': NUMBER, 'profiles': list},
+        'companyNames': list,
+        'profileNames': list,
+        'endpoints': {
+            'longin': {'url': str, 'username': str, 'password': str, 'usernameElementId': str,
+                       'passwordElementId': str, 'checkpointURL': str, 'cookieJar': str, 'sessionValidationURL': str},
+            'profile': {'connectInnerHTML': str, 'confirmInnerHTML': str, 'otherInnerHTML': str, 'closeDelay': NUMBER,
+                        'preloadTabs': int},
+            'profileConnections': {'connectionsIndicatorClass': str, 'degreeQueryString': str, 'depthBudget': int},
+            'receivedInvitations': {'strategy': str, 'acceptInnerHTML': str, 'acceptConfirmationInnerHTML': str,
+                                    'ignoreInnerHTML': str, 'ignoreConfirmationInnerHTML': str,
+                                    'acceptDelay': NUMBER, 'ignoreDelay': NUMBER},
+            'sentInvitations': {'strategy': str, 'ageClass': str, 'minimumAge': NUMBER, 'withdrawInnerHTML': str,
+                                'withdrawConfirmationInnerHTML': str, 'withdrawDelay': NUMBER},
+        },
+    }
+
+    __SOURCE_SCHEMA = {
+        SourceStrategies.PAGINATION.value: {
+            'url': str, 'nameDepth': int, 'linkDepth': int, 'lastButton': bool, 'listClass': str, 'nameClass': str,
+            'headlineClass': str, 'linkClass': str, 'paginationURL': str, 'paginationInnerHTML': str,
+            'buttonClass': str, 'buttonRenderDelay': NUMBER, 'paginationDelay': NUMBER,
+        },
+        SourceStrategies.INFINITE_SCROLL.value: {
+            'url': str, 'nameDepth': int, 'linkDepth': int, 'lastButton': bool, 'listClass': str, 'nameClass': str,
+            'headlineClass': str, 'linkClass': str, 'scrollDelay': NUMBER,
+        },
+    }
+
+    __CONNECT_SCHEMA = {'connectInnerHTML': str, 'connectDelay': NUMBER}
+
+    __INVITATION_ENDPOINTS = ('receivedInvitations', 'sentInvitations')
+
+    __document = None
+    __overrides = {}
     __configuration = None
+    __locators = {}
+    __modified = None
+    __checked = 0.0
+    __lock = threading.RLock()
+
+    @staticmethod
+    def __freeze(value):
+        """
+        Converts a decoded JSON value into a read-only one, objects become mappings and arrays become tuples.
+
+        :param value: Specify the decoded JSON value
+        :returns: The read-only value
+        """
+        if isinstance(value, dict):
+            return MappingProxyType({key: ConfigurationHandler.__freeze(item) for key, item in value.items()})
+
+        if isinstance(value, list):
+            return tuple(ConfigurationHandler.__freeze(item) for item in value)
+
+        return value
+
+    @staticmethod
+    def __literal(text: str) -> str:
+        """
+        Quotes a text as an XPath string literal, texts containing both quote characters are concatenated.
+
+        :param str text: Specify the text
+        :returns: The XPath string literal
+        :rtype: str
+        """
+        if '"' not in text:
+            return f'"{text}"'
+
+        if "'" not in text:
+            return f"'{text}'"
+
+        return 'concat(' + ', \'"\', '.join(f'"{part}"' for part in text.split('"')) + ')'
+
+    @staticmethod
+    def __check(value, schema, key: str, errors: list[str]):
+        """
+        Validates a value against its schema.
+
+        :param value: Specify the value
+        :param schema: Specify the value's schema, a type, a tuple of types or a dictionary describing a section
+        :param str key: Specify the dotted key of the value, used in the error messages
+        :param list[str] errors: Collects the error messages
+        """
+        if isinstance(schema, dict):
+            if not isinstance(value, dict):
+                errors.append(f'{key} must be an object')
+                return
+
+            for name, item_schema in schema.items():
+                if name not in value:
+                    errors.append(f'{key}.{name} is missing')
+                else:
+                    ConfigurationHandler.__check(value[name], item_schema, f'{key}.{name}', errors)
+            return
+
+        # JSON booleans are integers in Python
+        if not isinstance(value, schema) or isinstance(value, bool) and schema is not bool:
+            names = ' or '.join(type_.__name__ for type_ in (schema if isinstance(schema, tuple) else (schema,)))
+            errors.append(f'{key} must be of type {names}, found {json.dumps(value)}')
+
+    @staticmethod
+    def __validate(configuration: dict):
+        """
+        Validates a configuration, reporting every invalid value at once.
+
+        :param dict configuration: Specify the decoded configuration
+        :raises ValueError: if a required value is missing, or a value has an unexpected type or an unsupported choice
+        """
+        errors = []
+
+        for name, schema in ConfigurationHandler.__SCHEMA.items():
+            if name not in configuration:
+                errors.append(f'{name} is missing')
+            else:
+                ConfigurationHandler.__check(configuration[name], schema, name, errors)
+
+        choices = [
+            ('webDriver', [web_driver.value for web_driver in WebDrivers]),
+            ('extractionMode', [mode.value for mode in ExtractionModes]),
+        ]
+        for name, values in choices:
+            if configuration.get(name) not in values:
+                errors.append(f'{name} must be one of {", ".join(values)}')
+
+        for output_format in configuration.get('outputFormats') or []:
+            if output_format not in ['csv', 'jsonl']:
+                errors.append(f'outputFormats contains the unsupported format {json.dumps(output_format)}')
+
+        filters = configuration.get('filters')
+        filter_errors = len(errors)
+        for name, values in (filters.items() if isinstance(filters, dict) else []):
+            for value in values if isinstance(values, list) else []:
+                if not isinstance(value, str):
+                    errors.append(f'filters.{name} contains the non-string value {json.dumps(value)}')
+                elif name.endswith('Patterns'):
+                    try:
+                        re.compile(value)
+                    except re.error as exception:
+                        errors.append(f'filters.{name} contains the invalid pattern {json.dumps(value)}, {exception}')
+                        continue
+
+                    # Numbered groups are renumbered once the patterns are combined
+                    if re.search(r'(?<!\\)(?:\\\\)*\\[1-9]', value):
+                        errors.append(f'filters.{name} contains the pattern {json.dumps(value)} with a numbered '
+                                      f'backreference, use a named group and (?P=name) instead')
+
+        # The patterns are matched as a single regular expression, which must compile as a whole as well
+        if len(errors) == filter_errors and isinstance(filters, dict):
+            from providers.filter_handler import FilterHandler
+
+            for kind in ['include', 'exclude']:
+                try:
+                    FilterHandler.combine(filters.get(f'{kind}Keywords') or [], filters.get(f'{kind}Patterns') or [])
+                except re.error as exception:
+                    errors.append(f'filters.{kind}Patterns cannot be combined, {exception}')
+
+        accounts = configuration.get('accounts')
+        profiles = accounts.get('profiles') if isinstance(accounts, dict) else None
+        names = set()
+        for index, profile in enumerate(profiles if isinstance(profiles, list) else []):
+            if not isinstance(profile, dict) or not isinstance(profile.get('name'), str) or \
+                    not re.fullmatch(r'[\w.-]+', profile['name']):
+                errors.append(f'accounts.profiles[{index}].name must consist of letters, digits, dots, dashes and '
+                              f'underscores')
+            elif profile['name'] in names:
+                errors.append(f'accounts.profiles[{index}].name duplicates {json.dumps(profile["name"])}')
+            else:
+                names.add(profile['name'])
+
+            if isinstance(profile, dict) and not isinstance(profile.get('overrides'), dict):
+                errors.append(f'accounts.profiles[{index}].overrides must be an object')
+
+        endpoints = configuration.get('endpoints')
+        for endpoint, endpoint_configuration in (endpoints.items() if isinstance(endpoints, dict) else []):
+            if not isinstance(endpoint_configuration, dict) or 'strategy' not in endpoint_configuration:
+                continue
+
+            strategy = endpoint_configuration['strategy']
+            if strategy not in ConfigurationHandler.__SOURCE_SCHEMA:
+                errors.append(f'endpoints.{endpoint}.strategy must be one of '
+                              f'{", ".join(strategy.value for strategy in SourceStrategies)}')
+                continue
+
+            ConfigurationHandler.__check(endpoint_configuration, ConfigurationHandler.__SOURCE_SCHEMA[strategy],
+                                         f'endpoints.{endpoint}', errors)
+
+            if endpoint not in ConfigurationHandler.__INVITATION_ENDPOINTS:
+                ConfigurationHandler.__check(endpoint_configuration, ConfigurationHandler.__CONNECT_SCHEMA,
+                                             f'endpoints.{endpoint}', errors)
+
+            for key, required in [('degreeClass', 'firstDegreeInnerHTML'), ('messageInnerHTML', 'followInnerHTML')]:
+                if key in endpoint_configuration and required not in endpoint_configuration:
+                    errors.append(f'endpoints.{endpoint}.{required} is required by {key}')
+
+        if errors:
+            raise ValueError('invalid configuration\n  ' + '\n  '.join(errors))
 
     @staticmethod
-    def get_configuration() -> dict:
+    def __build():
         """
-        Provides a dictionary of the configuration.
+        Applies the overrides to the decoded configuration file, validates, freezes and compiles it.
 
-        :returns: Configurations as is from config.json file
-        :rtype: dict
+        :raises ValueError: if the configuration is invalid, the current configuration is kept
         """
-        if ConfigurationHandler.__configuration is None:
-            file = open('./config.json')
-            ConfigurationHandler.__configuration = json.load(file)
+        configuration = copy.deepcopy(ConfigurationHandler.__document)
+
+        for key, value in ConfigurationHandler.__overrides.items():
+            *parents, name = key.split('.')
+
+            section = configuration
+            for parent in parents:
+                section = section[parent]
+
+            section[name] = value
+
+        ConfigurationHandler.__validate(configuration)
+
+        ConfigurationHandler.__configuration = ConfigurationHandler.__freeze(configuration)
+        ConfigurationHandler.__locators = {
+            endpoint: MappingProxyType({
+                key: f'//*[text()={ConfigurationHandler.__literal(value)}]'
+                for key, value in endpoint_configuration.items()
+                if key.endswith('InnerHTML') and isinstance(value, str)
+            })
+            for endpoint, endpoint_configuration in configuration['endpoints'].items()
+        }
+
+    @staticmethod
+    def __load():
+        """
+        Reads config.json and builds the configuration.
+
+        :raises OSError: if config.json cannot be read
+        :raises ValueError: if config.json is not valid JSON, or the configuration is invalid
+        """
+        # Recorded first, so that an invalid modification is not read again until config.json is modified again
+        ConfigurationHandler.__modified = os.stat(ConfigurationHandler.__PATH).st_mtime_ns
+
+        with open(ConfigurationHandler.__PATH, encoding='utf-8') as file:
+            document = json.load(file)
+
+        previous = ConfigurationHandler.__document
+        ConfigurationHandler.__document = document
+
+        try:
+            ConfigurationHandler.__build()
+        except (KeyError, TypeError, ValueError):
+            ConfigurationHandler.__document = previous
+            raise
+
+    @staticmethod
+    def get_configuration() -> Mapping:
+        """
+        Provides a read-only mapping of the configuration, without copying it. config.json is checked for
+        modifications at most once every configurationReloadInterval seconds, an invalid modification is reported
+        and the current configuration is kept.
+
+        :returns: Configurations as is from config.json file, with the values overridden by set_value()
+        :rtype: Mapping
+        :raises ValueError: if config.json is invalid when first read
+        """
+        configuration = ConfigurationHandler.__configuration
+
+        if configuration is None:
+            with ConfigurationHandler.__lock:
+                if ConfigurationHandler.__configuration is None:
+                    ConfigurationHandler.__load()
+                    ConfigurationHandler.__checked = time.monotonic()
+                return ConfigurationHandler.__configuration
+
+        interval = configuration['configurationReloadInterval']
+        if interval == -1 or time.monotonic() - ConfigurationHandler.__checked < interval:
+            return configuration
+
+        with ConfigurationHandler.__lock:
+            ConfigurationHandler.__checked = time.monotonic()
+
+            try:
+                if os.stat(ConfigurationHandler.__PATH).st_mtime_ns != ConfigurationHandler.__modified:
+                    ConfigurationHandler.__load()
+            except (OSError, KeyError, TypeError, ValueError) as exception:
+                warnings.warn(f'config.json was not reloaded, {exception}')
+
+            return ConfigurationHandler.__configuration
+
+    @staticmethod
+    def get_locators(endpoint: str) -> Mapping[str, str]:
+        """
+        Provides the precompiled XPath locators of an endpoint's text values, compiled whenever the configuration is
+        loaded rather than for every card.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :returns: The locators of the elements whose text is the value, keyed by the *InnerHTML key, e.g.
+                  connectInnerHTML => //*[text()="Connect"]
+        :rtype: Mapping[str, str]
+        """
+        ConfigurationHandler.get_configuration()
+        return ConfigurationHandler.__locators[endpoint]
+
+    @staticmethod
+    def set_value(key: str, value):
+        """
+        Overrides a configuration value for the rest of the run, without modifying config.json, the override
+        survives reloads.
+
+        :param str key: Specify the configuration key, nested keys are separated by a dot, e.g. driverBinaries.refresh
+        :param value: Specify the new value
+        :raises ValueError: if the overridden configuration is invalid, the override is discarded
+        """
+        with ConfigurationHandler.__lock:
+            ConfigurationHandler.get_configuration()
+
+            previous = ConfigurationHandler.__overrides.copy()
+            ConfigurationHandler.__overrides[key] = value
 
-        return ConfigurationHandler.__configuration.copy()
+            try:
+                ConfigurationHandler.__build()
+            except (KeyError, TypeError, ValueError):
+                ConfigurationHandler.__overrides = previous
+                raise
@@ -0,0 +1,82 @@
+import json
+import os
+
+from providers.configuration_handler import ConfigurationHandler
+
+
+class CookieJarHandler:
+    """
+    Static methods which persists the authenticated session's cookies, used to skip the login flow on later runs.
+
+    Methods
+    -------
+        __get_path() -> str:
+            Provides the cookie jar file path based on the endpoints.longin.cookieJar value in config.json.
+        load() -> list[dict]:
+            Provides the saved cookies.
+        save(cookies: list[dict]):
+            Atomically replaces the saved cookies, the file is only readable by its owner.
+        clear():
+            Removes the saved cookies.
+    """
+
+    @staticmethod
+    def __get_path() -> str:
+        """
+        Provides the cookie jar file path based on the endpoints.longin.cookieJar value in config.json.
+
+        :returns: The cookie jar file path, empty if persisting the session is disabled
+        :rtype: str
+        """
+        return ConfigurationHandler.get_configuration()['endpoints']['longin']['cookieJar']
+
+    @staticmethod
+    def load() -> list[dict]:
+        """
+        Provides the saved cookies.
+
+        :returns: The saved cookies, empty if none were saved or if the file is unreadable
+        :rtype: list[dict]
+        """
+        path = CookieJarHandler.__get_path()
+
+        if not path or not os.path.exists(path):
+            return []
+
+        try:
+            with open(path, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return []
+
+    @staticmethod
+    def save(cookies: list[dict]):
+        """
+        Atomically replaces the saved cookies, the file is only readable by its owner.
+
+        :param list[dict] cookies: Specify the cookies, as returned by the web driver
+        """
+        path = CookieJarHandler.__get_path()
+
+        if not path:
+            return
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        descriptor = os.open(f'{path}.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(cookies, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def clear():
+        """
+        Removes the saved cookies.
+        """
+        path = CookieJarHandler.__get_path()
+
+        if path and os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,144 @@
+import importlib
+import json
+import os
+import warnings
+from typing import Optional
+
+from enums.web_drivers import WebDrivers
+from providers.configuration_handler import ConfigurationHandler
+
+
+class DriverBinaryHandler:
+    """
+    Static methods which resolves web driver binaries from a local manifest, so that starting up does not require any
+    network access once a binary is cached.
+
+    Attributes
+    ----------
+        __MANAGERS  The driver manager module and class name of every web driver, imported only when installing
+        __BROWSER_TYPES  The webdriver_manager browser type used to detect the installed browser version of every web
+                         driver, e.g. ChromeType.MSEDGE for edge
+
+    Methods
+    -------
+        __get_browser_version(web_driver: str) -> Optional[str]:
+            Detects the installed browser version, without accessing the network.
+        __load_manifest() -> dict:
+            Provides the manifest based on the driverBinaries.manifest value in config.json.
+        __save_manifest(manifest: dict):
+            Atomically replaces the manifest.
+        resolve(web_driver: str) -> str:
+            Provides the web driver binary path, installs it only if it is missing from the manifest, the browser
+            version changed or driverBinaries.refresh in config.json is enabled.
+    """
+
+    __MANAGERS = {
+        WebDrivers.INTERNET_EXPLORER.value: ('webdriver_manager.microsoft', 'IEDriverManager'),
+        WebDrivers.EDGE.value: ('webdriver_manager.microsoft', 'EdgeChromiumDriverManager'),
+        WebDrivers.FIREFOX.value: ('webdriver_manager.firefox', 'GeckoDriverManager'),
+        WebDrivers.OPERA.value: ('webdriver_manager.opera', 'OperaDriverManager'),
+        WebDrivers.CHROME.value: ('webdriver_manager.chrome', 'ChromeDriverManager'),
+    }
+
+    __BROWSER_TYPES = {
+        WebDrivers.EDGE.value: 'edge',
+        WebDrivers.FIREFOX.value: 'firefox',
+        WebDrivers.CHROME.value: 'google-chrome',
+    }
+
+    @staticmethod
+    def __get_browser_version(web_driver: str) -> Optional[str]:
+        """
+        Detects the installed browser version, without accessing the network. A supported browser whose version
+        cannot be detected is reported, since its pinned binary is then reused regardless of the browser version.
+
+        :param str web_driver: Specify the web driver, e.g. chrome
+        :returns: The installed browser version, None if it cannot be detected
+        :rtype: Optional[str]
+        """
+        browser_type = DriverBinaryHandler.__BROWSER_TYPES.get(web_driver)
+
+        if browser_type is None:
+            return None
+
+        try:
+            from webdriver_manager.core.utils import get_browser_version_from_os
+            version = get_browser_version_from_os(browser_type) or None
+        except Exception as exception:
+            version = None
+            warnings.warn(f'the {web_driver} browser version could not be detected, {exception}')
+        else:
+            if version is None:
+                warnings.warn(f'the {web_driver} browser version could not be detected, the most recently pinned '
+                              f'web driver binary is used')
+
+        return version
+
+    @staticmethod
+    def __load_manifest() -> dict:
+        """
+        Provides the manifest based on the driverBinaries.manifest value in config.json.
+
+        :returns: The installed binary paths, keyed by web driver then browser version
+        :rtype: dict
+        """
+        path = ConfigurationHandler.get_configuration()['driverBinaries']['manifest']
+
+        if not os.path.exists(path):
+            return {}
+
+        try:
+            with open(path, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def __save_manifest(manifest: dict):
+        """
+        Atomically replaces the manifest.
+
+        :param dict manifest: Specify the installed binary paths, keyed by web driver then browser version
+        """
+        path = ConfigurationHandler.get_configuration()['driverBinaries']['manifest']
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def resolve(web_driver: str) -> str:
+        """
+        Provides the web driver binary path, installs it only if it is missing from the manifest, the browser version
+        changed or driverBinaries.refresh in config.json is enabled.
+
+        :param str web_driver: Specify the web driver, e.g. chrome
+        :returns: The web driver binary path
+        :rtype: str
+        """
+        refresh = ConfigurationHandler.get_configuration()['driverBinaries']['refresh']
+
+        manifest = DriverBinaryHandler.__load_manifest()
+        binaries = manifest.get(web_driver, {})
+
+        # Falls back to the most recently pinned binary if the browser version cannot be detected
+        version = DriverBinaryHandler.__get_browser_version(web_driver)
+        path = binaries.get(version) if version else next(reversed(binaries.values()), None)
+
+        if not refresh and path and os.path.exists(path):
+            return path
+
+        module, manager = DriverBinaryHandler.__MANAGERS[web_driver]
+        path = getattr(importlib.import_module(module), manager)().install()
+
+        binaries.pop(version or 'unknown', None)
+        binaries[version or 'unknown'] = path
+        manifest[web_driver] = binaries
+        DriverBinaryHandler.__save_manifest(manifest)
+
+        return path
@@ -1,19 +1,19 @@
-from typing import Union
+import threading
+from typing import Optional, Union
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.ie.webdriver import WebDriver as ieWebDriver
 from selenium.webdriver.edge.webdriver import WebDriver as edgeWebDriver
 from selenium.webdriver.firefox.webdriver import WebDriver as firefoxWebDriver
 from selenium.webdriver.opera.webdriver import WebDriver as operaWebDriver
+from selenium.webdriver.opera.options import Options as operaOptions
 from selenium.webdriver.chrome.webdriver import WebDriver as chromeWebDriver
-from webdriver_manager.microsoft import IEDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.opera import OperaDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
 
 from enums.web_drivers import WebDrivers
 from providers.configuration_handler import ConfigurationHandler
+from providers.driver_binary_handler import DriverBinaryHandler
+from providers.metrics_handler import MetricsHandler
 
 
 class DriverHandler:
@@ -23,35 +23,183 @@ class DriverHandler:
     Attributes
     ----------
         __driver  Acts as a cache for storing the web driver instance
+        __local  Holds the web driver bound to the current thread, if any
 
     Methods
     -------
+        __apply_chromium_profile(options):
+            Applies the performanceProfile values in config.json to Chromium based browser options.
+        __apply_firefox_profile(options: webdriver.FirefoxOptions):
+            Applies the performanceProfile values in config.json to Firefox options.
+        __block_urls(driver):
+            Blocks the performanceProfile.blockedURLs patterns in config.json using the Chrome DevTools Protocol.
+        create_driver(user_data_directory: Optional[str] = None)
+        -> Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]:
+            Launches a new web driver instance based on the webDriver value in config.json.
+        bind(driver: Optional[Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]]):
+            Binds a web driver to the current thread, get_driver() returns it until it is unbound.
         get_driver() -> Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]:
-            Returns a web driver instance based on the webDriver value in config.json.
+            Returns the web driver bound to the current thread, or a web driver instance based on the webDriver value
+            in config.json.
     """
 
     __driver = None
+    __local = threading.local()
+
+    @staticmethod
+    def __apply_chromium_profile(options):
+        """
+        Applies the performanceProfile values in config.json to Chromium based browser options.
+
+        :param options: Specify the Chrome, Edge or Opera options
+        """
+        performance_profile = ConfigurationHandler.get_configuration()['performanceProfile']
+
+        if not performance_profile['enabled']:
+            return
+
+        options.page_load_strategy = performance_profile['pageLoadStrategy']
+
+        if performance_profile['headless']:
+            options.add_argument('--headless')
+            options.add_argument(f'--window-size={performance_profile["windowSize"]}')
+
+        if performance_profile['blockImages']:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+        if performance_profile['blockMedia']:
+            options.add_argument('--autoplay-policy=user-gesture-required')
+            options.add_argument('--mute-audio')
+
+    @staticmethod
+    def __apply_firefox_profile(options: webdriver.FirefoxOptions):
+        """
+        Applies the performanceProfile values in config.json to Firefox options, trackers are blocked by Firefox's
+        tracking protection since URL patterns cannot be blocked through the Chrome DevTools Protocol.
+
+        :param webdriver.FirefoxOptions options: Specify the Firefox options
+        """
+        performance_profile = ConfigurationHandler.get_configuration()['performanceProfile']
+
+        if not performance_profile['enabled']:
+            return
+
+        options.page_load_strategy = performance_profile['pageLoadStrategy']
+
+        if performance_profile['headless']:
+            options.add_argument('-headless')
+            width, height = performance_profile['windowSize'].split(',')
+            options.add_argument(f'--width={width}')
+            options.add_argument(f'--height={height}')
+
+        if performance_profile['blockImages']:
+            options.set_preference('permissions.default.image', 2)
+
+        if performance_profile['blockMedia']:
+            options.set_preference('media.autoplay.default', 5)
+            options.set_preference('media.autoplay.blocking_policy', 2)
+            options.set_preference('browser.display.use_document_fonts', 0)
+
+        if performance_profile['blockedURLs']:
+            options.set_preference('privacy.trackingprotection.enabled', True)
+
+    @staticmethod
+    def __block_urls(driver):
+        """
+        Blocks the performanceProfile.blockedURLs patterns in config.json using the Chrome DevTools Protocol, skipped
+        if the browser does not support it.
+
+        :param driver: Specify the Chromium based web driver
+        """
+        performance_profile = ConfigurationHandler.get_configuration()['performanceProfile']
+
+        if not performance_profile['enabled'] or not performance_profile['blockedURLs']:
+            return
+
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': performance_profile['blockedURLs']})
+        except (AttributeError, WebDriverException):
+            pass
+
+    @staticmethod
+    def create_driver(user_data_directory: Optional[str] = None) \
+            -> Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]:
+        """
+        Launches a new web driver instance based on the webDriver value in config.json.
+
+        :param Optional[str] user_data_directory: Specify an isolated browser profile directory, ignored by Internet
+                                                  Explorer
+        :returns: The specified web driver type object
+        :rtype: Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]
+        """
+        web_driver = ConfigurationHandler.get_configuration()['webDriver']
+
+        if web_driver == WebDrivers.INTERNET_EXPLORER.value:
+            driver = webdriver.Ie(executable_path=DriverBinaryHandler.resolve(web_driver))
+        elif web_driver == WebDrivers.EDGE.value:
+            options = webdriver.EdgeOptions()
+            if user_data_directory:
+                options.add_argument(f'--user-data-dir={user_data_directory}')
+            DriverHandler.__apply_chromium_profile(options)
+            driver = webdriver.Edge(executable_path=DriverBinaryHandler.resolve(web_driver), options=options)
+            DriverHandler.__block_urls(driver)
+        elif web_driver == WebDrivers.FIREFOX.value:
+            options = webdriver.FirefoxOptions()
+            if user_data_directory:
+                options.add_argument('-profile')
+                options.add_argument(user_data_directory)
+            DriverHandler.__apply_firefox_profile(options)
+            driver = webdriver.Firefox(executable_path=DriverBinaryHandler.resolve(web_driver), options=options)
+        elif web_driver == WebDrivers.OPERA.value:
+            options = operaOptions()
+            if user_data_directory:
+                options.add_argument(f'--user-data-dir={user_data_directory}')
+            DriverHandler.__apply_chromium_profile(options)
+            driver = webdriver.Opera(executable_path=DriverBinaryHandler.resolve(web_driver), options=options)
+            DriverHandler.__block_urls(driver)
+        else:
+            options = webdriver.ChromeOptions()
+            if user_data_directory:
+                options.add_argument(f'--user-data-dir={user_data_directory}')
+            DriverHandler.__apply_chromium_profile(options)
+            driver = webdriver.Chrome(executable_path=DriverBinaryHandler.resolve(web_driver), options=options)
+            DriverHandler.__block_urls(driver)
+
+        performance_profile = ConfigurationHandler.get_configuration()['performanceProfile']
+
+        if not performance_profile['enabled'] or not performance_profile['headless']:
+            driver.maximize_window()
+
+        MetricsHandler.instrument(driver)
+
+        return driver
+
+    @staticmethod
+    def bind(driver: Optional[Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]]):
+        """
+        Binds a web driver to the current thread, get_driver() returns it until it is unbound.
+
+        :param driver: Specify the web driver to bind, set to None to unbind
+        """
+        DriverHandler.__local.driver = driver
 
     @staticmethod
     def get_driver() -> Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]:
         """
-        Returns a web driver instance based on the webDriver value in config.json.
+        Returns the web driver bound to the current thread, or a web driver instance based on the webDriver value in
+        config.json.
 
         :returns: The specified web driver type object
         :rtype: Union[ieWebDriver, edgeWebDriver, firefoxWebDriver, operaWebDriver, chromeWebDriver]
         """
+        driver = getattr(DriverHandler.__local, 'driver', None)
+
+        if driver is not None:
+            return driver
+
         if DriverHandler.__driver is None:
-            web_driver = ConfigurationHandler.get_configuration()['webDriver']
-            if web_driver == WebDrivers.INTERNET_EXPLORER.value:
-                DriverHandler.__driver = webdriver.Ie(IEDriverManager().install())
-            elif web_driver == WebDrivers.EDGE.value:
-                DriverHandler.__driver = webdriver.Edge(EdgeChromiumDriverManager().install())
-            elif web_driver == WebDrivers.FIREFOX.value:
-                DriverHandler.__driver = webdriver.Firefox(GeckoDriverManager().install())
-            elif web_driver == WebDrivers.OPERA.value:
-                DriverHandler.__driver = webdriver.Opera(OperaDriverManager().install())
-            else:
-                DriverHandler.__driver = webdriver.Chrome(ChromeDriverManager().install())
-            DriverHandler.__driver.maximize_window()
+            DriverHandler.__driver = DriverHandler.create_driver()
 
         return DriverHandler.__driver
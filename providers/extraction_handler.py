@@ -0,0 +1,347 @@
+from typing import Optional, Union
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from enums.extraction_modes import ExtractionModes
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.snapshot_handler import SnapshotHandler
+
+
+class SnapshotElement:
+    """
+    A reference to an element of a card extracted from a snapshot, which is only located once it is acted upon.
+
+    Attributes
+    ----------
+        container  The list element which contains the cards
+        index  The index of the card in the list when the snapshot was taken
+        field  The field specification of the element, None refers to the card itself
+        card_id  The data-snapshot-id of the card, which keeps referring to it after preceding cards were removed,
+                 None falls back to the index
+    """
+
+    def __init__(self, container: WebElement, index: int, field: Optional[dict] = None,
+                 card_id: Optional[str] = None):
+        self.container = container
+        self.index = index
+        self.field = field
+        self.card_id = card_id
+
+
+class ExtractionHandler:
+    """
+    Static methods which handles extracting profile cards from a list element.
+
+    Attributes
+    ----------
+        __RESOLVE_FUNCTION  JavaScript which resolves a single field of a card, shared by the scripts below
+        __BATCH_SCRIPT  JavaScript which resolves every field of every card in a single round trip
+        __COLLECTOR_SCRIPT  JavaScript which observes a list and resolves only the cards added since the last call
+        __PENDING_SCRIPT  JavaScript which counts the cards added since the last drain
+        __LOCATE_SCRIPT  JavaScript which locates a single field's element of a card
+
+    Methods
+    -------
+        field(selector: str, depth: int = 0, attribute: str = 'innerText', last: bool = False) -> dict:
+            Describes how a single value is located inside a profile card.
+        __resolve_field(card: WebElement, field: dict):
+            Resolves a single field of a card using chained WebDriver calls.
+        __extract_legacy(container: WebElement, fields: dict[str, dict], start: int = 0) -> list[dict]:
+            Extracts the cards using a WebDriver call per element lookup.
+        __extract_batch(container: WebElement, fields: dict[str, dict], start: int = 0) -> list[dict]:
+            Extracts the cards using a single execute_script call.
+        __extract_snapshot(container: WebElement, fields: dict[str, dict], start: int = 0,
+        name: Optional[str] = None) -> list[dict]:
+            Extracts the cards by parsing a snapshot of the list element locally.
+        extract_cards(container: WebElement, fields: dict[str, dict], start: int = 0, mode: Optional[str] = None,
+        name: Optional[str] = None) -> list[dict]:
+            Extracts the cards found inside a list element into plain records.
+        get_element(element: Union[WebElement, SnapshotElement]) -> WebElement:
+            Provides the web element of an 'element' field, locating it if the card was extracted from a snapshot.
+        drain_cards(container: WebElement, fields: dict[str, dict], key: str) -> list[dict]:
+            Extracts only the cards added to a list element since the previous call, using an in-page observer.
+        count_pending(key: str) -> int:
+            Provides the number of cards added to an observed list element since the previous drain_cards() call.
+    """
+
+    __RESOLVE_FUNCTION = '''
+        const resolve = (card, field) => {
+            const matches = card.querySelectorAll(field.selector);
+            if (!matches.length) {
+                return null;
+            }
+            let element = field.last ? matches[matches.length - 1] : matches[0];
+            for (let i = 0; i < field.depth; i++) {
+                element = element.children[0];
+                if (!element) {
+                    return null;
+                }
+            }
+            if (field.attribute === 'element') {
+                return element;
+            }
+            const value = element[field.attribute];
+            return value === undefined || value === null ? element.getAttribute(field.attribute) : value;
+        };
+    '''
+
+    __BATCH_SCRIPT = __RESOLVE_FUNCTION + '''
+        const container = arguments[0];
+        const fields = arguments[1];
+        const start = arguments[2];
+
+        const cards = container.getElementsByTagName('li');
+        const records = [];
+        for (let i = start; i < cards.length; i++) {
+            const record = {element: cards[i]};
+            for (const [key, field] of Object.entries(fields)) {
+                record[key] = resolve(cards[i], field);
+            }
+            records.push(record);
+        }
+        return records;
+    '''
+
+    __COLLECTOR_SCRIPT = __RESOLVE_FUNCTION + '''
+        const container = arguments[0];
+        const fields = arguments[1];
+        const key = arguments[2];
+
+        const collectors = window.__profileCollectors = window.__profileCollectors || {};
+        const collector = collectors[key] = collectors[key] || {buffer: [], links: new Set(), next: 0};
+
+        // Observes the list once, or again if it was re-rendered, buffering every card as it is added
+        if (collector.container !== container) {
+            if (collector.observer) {
+                collector.observer.disconnect();
+            }
+            collector.container = container;
+            collector.observer = new MutationObserver((mutations) => {
+                for (const mutation of mutations) {
+                    for (const node of mutation.addedNodes) {
+                        if (node.nodeType !== Node.ELEMENT_NODE) {
+                            continue;
+                        }
+                        if (node.tagName === 'LI') {
+                            collector.buffer.push(node);
+                        }
+                        collector.buffer.push(...node.getElementsByTagName('li'));
+                    }
+                }
+            });
+            collector.observer.observe(container, {childList: true, subtree: true});
+            collector.buffer.push(...container.getElementsByTagName('li'));
+        }
+
+        const records = [];
+        for (const card of collector.buffer.splice(0)) {
+            if (card.dataset.collectorId !== undefined) {
+                continue;
+            }
+            card.dataset.collectorId = String(collector.next++);
+
+            const record = {element: card, id: card.dataset.collectorId};
+            for (const [key, field] of Object.entries(fields)) {
+                record[key] = resolve(card, field);
+            }
+
+            // Virtualized lists re-create cards which were already collected
+            if (record.link) {
+                if (collector.links.has(record.link)) {
+                    continue;
+                }
+                collector.links.add(record.link);
+            }
+
+            records.push(record);
+        }
+        return records;
+    '''
+
+    __PENDING_SCRIPT = '''
+        const collector = (window.__profileCollectors || {})[arguments[0]];
+        return collector ? collector.buffer.length : 0;
+    '''
+
+    __LOCATE_SCRIPT = __RESOLVE_FUNCTION + '''
+        const card = arguments[3] !== null
+            ? arguments[0].querySelector(`li[data-snapshot-id="${arguments[3]}"]`)
+            : arguments[0].getElementsByTagName('li')[arguments[1]];
+        return card && arguments[2] ? resolve(card, arguments[2]) : card || null;
+    '''
+
+    @staticmethod
+    def field(selector: str, depth: int = 0, attribute: str = 'innerText', last: bool = False) -> dict:
+        """
+        Describes how a single value is located inside a profile card.
+
+        :param str selector: Specify the CSS selector of the element relative to the card
+        :param int depth: Specify how many times to descend to the first child of the matched element
+        :param str attribute: Specify the attribute to read, or 'element' to return the element itself
+        :param bool last: Specify whether to use the last matched element instead of the first one
+        :returns: The field specification
+        :rtype: dict
+        """
+        return {'selector': selector, 'depth': depth, 'attribute': attribute, 'last': last}
+
+    @staticmethod
+    def __resolve_field(card: WebElement, field: dict):
+        """
+        Resolves a single field of a card using chained WebDriver calls.
+
+        :param WebElement card: Specify the card element
+        :param dict field: Specify the field specification, as returned by field()
+        :returns: The attribute value, the element itself, or None if it was not found
+        """
+        try:
+            elements = card.find_elements(By.CSS_SELECTOR, field['selector'])
+            element = elements[-1] if field['last'] else elements[0]
+            for _ in range(field['depth']):
+                element = element.find_elements(By.CSS_SELECTOR, '*')[0]
+        except IndexError:
+            return None
+
+        if field['attribute'] == 'element':
+            return element
+
+        return element.get_attribute(field['attribute'])
+
+    @staticmethod
+    def __extract_legacy(container: WebElement, fields: dict[str, dict], start: int = 0) -> list[dict]:
+        """
+        Extracts the cards using a WebDriver call per element lookup.
+
+        :param WebElement container: Specify the list element which contains the cards
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param int start: Specify the index of the first card to extract
+        :returns: A record per card, the card element itself is stored under the 'element' key
+        :rtype: list[dict]
+        """
+        records = []
+
+        for card in container.find_elements(By.TAG_NAME, 'li')[start:]:
+            record = {'element': card}
+            for key, field in fields.items():
+                record[key] = ExtractionHandler.__resolve_field(card, field)
+            records.append(record)
+
+        return records
+
+    @staticmethod
+    def __extract_batch(container: WebElement, fields: dict[str, dict], start: int = 0) -> list[dict]:
+        """
+        Extracts the cards using a single execute_script call.
+
+        :param WebElement container: Specify the list element which contains the cards
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param int start: Specify the index of the first card to extract
+        :returns: A record per card, the card element itself is stored under the 'element' key
+        :rtype: list[dict]
+        """
+        return DriverHandler.get_driver().execute_script(ExtractionHandler.__BATCH_SCRIPT, container, fields, start)
+
+    @staticmethod
+    def __extract_snapshot(container: WebElement, fields: dict[str, dict], start: int = 0,
+                           name: Optional[str] = None) -> list[dict]:
+        """
+        Extracts the cards by parsing a snapshot of the list element locally, using a single WebDriver call. The
+        elements are only located once acted upon, see get_element().
+
+        :param WebElement container: Specify the list element which contains the cards
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param int start: Specify the index of the first card to extract
+        :param Optional[str] name: Specify the snapshot's file name prefix, e.g. the endpoint name
+        :returns: A record per card, the card element itself is stored under the 'element' key as a SnapshotElement
+        :rtype: list[dict]
+        """
+        records = SnapshotHandler.parse(SnapshotHandler.take(container, name), fields, start)
+
+        for record in records:
+            index = record.pop('index')
+            card_id = record.pop('id')
+            record['element'] = SnapshotElement(container, index, card_id=card_id)
+
+            for key, field in fields.items():
+                if field['attribute'] == 'element' and record[key] is not None:
+                    record[key] = SnapshotElement(container, index, field, card_id)
+
+        return records
+
+    @staticmethod
+    def extract_cards(container: WebElement, fields: dict[str, dict], start: int = 0,
+                      mode: Optional[str] = None, name: Optional[str] = None) -> list[dict]:
+        """
+        Extracts the cards found inside a list element into plain records.
+
+        :param WebElement container: Specify the list element which contains the cards
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param int start: Specify the index of the first card to extract
+        :param Optional[str] mode: Specify the extraction mode, defaults to the extractionMode value in config.json
+        :param Optional[str] name: Specify the snapshot's file name prefix in the snapshot extraction mode, e.g. the
+                                   endpoint name
+        :returns: A record per card, the card element itself is stored under the 'element' key, missing values are
+                  set to None
+        :rtype: list[dict]
+        """
+        if mode is None:
+            mode = ConfigurationHandler.get_configuration()['extractionMode']
+
+        if mode == ExtractionModes.BATCH.value:
+            return ExtractionHandler.__extract_batch(container, fields, start)
+
+        if mode == ExtractionModes.SNAPSHOT.value:
+            return ExtractionHandler.__extract_snapshot(container, fields, start, name)
+
+        return ExtractionHandler.__extract_legacy(container, fields, start)
+
+    @staticmethod
+    def get_element(element: Union[WebElement, SnapshotElement]) -> WebElement:
+        """
+        Provides the web element of an 'element' field, locating it if the card was extracted from a snapshot.
+
+        :param Union[WebElement, SnapshotElement] element: Specify the field's value
+        :returns: The web element
+        :rtype: WebElement
+        :raises NoSuchElementException: if the card or its element is no longer rendered
+        """
+        if not isinstance(element, SnapshotElement):
+            return element
+
+        located = DriverHandler.get_driver().execute_script(ExtractionHandler.__LOCATE_SCRIPT, element.container,
+                                                            element.index, element.field, element.card_id)
+
+        if located is None:
+            raise NoSuchElementException(f'card {element.index} is no longer rendered')
+
+        return located
+
+    @staticmethod
+    def drain_cards(container: WebElement, fields: dict[str, dict], key: str) -> list[dict]:
+        """
+        Extracts only the cards added to a list element since the previous call, using an in-page observer, so that
+        the WebDriver traffic is proportional to the new cards rather than to the whole list. Every card is given a
+        stable data-collector-id, and cards re-created by a virtualized list are extracted once per link.
+
+        :param WebElement container: Specify the list element which contains the cards, observing restarts if the
+                                     list element was re-rendered
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param str key: Specify the observer's name, e.g. the endpoint name, reset whenever the page is loaded
+        :returns: A record per new card, the card element itself is stored under the 'element' key and its stable ID
+                  under the 'id' key, missing values are set to None
+        :rtype: list[dict]
+        """
+        return DriverHandler.get_driver().execute_script(ExtractionHandler.__COLLECTOR_SCRIPT, container, fields, key)
+
+    @staticmethod
+    def count_pending(key: str) -> int:
+        """
+        Provides the number of cards added to an observed list element since the previous drain_cards() call.
+
+        :param str key: Specify the observer's name, e.g. the endpoint name
+        :returns: The number of cards waiting to be drained, duplicates included
+        :rtype: int
+        """
+        return DriverHandler.get_driver().execute_script(ExtractionHandler.__PENDING_SCRIPT, key)
@@ -0,0 +1,126 @@
+import re
+from typing import Optional
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.link_handler import LinkHandler
+from providers.metrics_handler import MetricsHandler
+
+
+class FilterHandler:
+    """
+    Static methods which decides whether a retrieved profile is a candidate, before any action is taken on it. The
+    filters values in config.json are compiled into a single include and a single exclude regular expression, so that
+    every profile is matched against every keyword and pattern in one pass.
+
+    Attributes
+    ----------
+        __GLOBAL_FLAGS  Matches the inline global flags a pattern starts with, e.g. (?i)
+        __compiled  The filters section which the matchers were compiled from, followed by the include matcher, the
+                    exclude matcher and the blocked profile slugs
+
+    Methods
+    -------
+        __scope(pattern: str) -> str:
+            Limits the inline global flags of a regular expression to the regular expression itself.
+        combine(keywords: list[str], patterns: list[str]) -> Optional[re.Pattern]:
+            Combines keywords and regular expressions into a single case-insensitive regular expression.
+        __get_matchers() -> tuple:
+            Provides the compiled matchers of the filters values in config.json.
+        accepts(name: Optional[str], headline: Optional[str], link: Optional[str]) -> bool:
+            Checks whether a profile passes the filters values in config.json.
+    """
+
+    __GLOBAL_FLAGS = re.compile(r'\(\?([aiLmsux]+)\)')
+
+    __compiled = (None, None, None, frozenset())
+
+    @staticmethod
+    def __scope(pattern: str) -> str:
+        """
+        Limits the inline global flags of a regular expression to the regular expression itself, since global flags
+        are only allowed at the start of the combined regular expression, e.g. (?s)a.b becomes (?s:a.b). The group of a
+        verbose regular expression is closed on a new line.
+
+        :param str pattern: Specify the regular expression
+        :returns: The regular expression, as a non-capturing group
+        :rtype: str
+        """
+        match = FilterHandler.__GLOBAL_FLAGS.match(pattern)
+
+        if match is None:
+            return f'(?:{pattern})'
+
+        # A trailing comment of a verbose regular expression would otherwise swallow the closing parenthesis
+        end = '\n)' if 'x' in match.group(1) else ')'
+
+        return f'(?{match.group(1)}:{pattern[match.end():]}{end}'
+
+    @staticmethod
+    def combine(keywords: list[str], patterns: list[str]) -> Optional[re.Pattern]:
+        """
+        Combines keywords and regular expressions into a single case-insensitive regular expression, keywords only
+        match whole words, and ^ and $ match at the start and end of the name and of the headline. Numbered
+        backreferences refer to the combined groups, and are therefore rejected by the configuration's validation.
+
+        :param list[str] keywords: Specify the keywords, e.g. recruiter
+        :param list[str] patterns: Specify the regular expressions
+        :returns: The combined regular expression, None if there is neither a keyword nor a pattern
+        :rtype: Optional[re.Pattern]
+        :raises re.error: if the regular expressions cannot be combined, e.g. two of them declare the same group name
+        """
+        alternatives = [rf'(?<!\w){re.escape(keyword)}(?!\w)' for keyword in keywords] + \
+                       [FilterHandler.__scope(pattern) for pattern in patterns]
+
+        if not alternatives:
+            return None
+
+        return re.compile('|'.join(alternatives), re.IGNORECASE | re.MULTILINE)
+
+    @staticmethod
+    def __get_matchers() -> tuple:
+        """
+        Provides the compiled matchers of the filters values in config.json, compiled again only once the
+        configuration is reloaded or overridden.
+
+        :returns: The include matcher, the exclude matcher and the blocked profile slugs
+        :rtype: tuple
+        """
+        filters = ConfigurationHandler.get_configuration()['filters']
+        compiled = FilterHandler.__compiled
+
+        if compiled[0] is not filters:
+            compiled = (
+                filters,
+                FilterHandler.combine(filters['includeKeywords'], filters['includePatterns']),
+                FilterHandler.combine(filters['excludeKeywords'], filters['excludePatterns']),
+                frozenset(LinkHandler.get_slug(profile) for profile in filters['blockedProfiles']),
+            )
+            FilterHandler.__compiled = compiled
+
+        return compiled[1:]
+
+    @staticmethod
+    def accepts(name: Optional[str], headline: Optional[str], link: Optional[str]) -> bool:
+        """
+        Checks whether a profile passes the filters values in config.json; its slug must not be blocked, its name or
+        headline must match an include keyword or pattern if any is declared, and must not match an exclude keyword or
+        pattern. Rejected profiles are counted by the filtered metric.
+
+        :param Optional[str] name: Specify the profile name
+        :param Optional[str] headline: Specify the profile headline
+        :param Optional[str] link: Specify the profile link
+        :returns: Whether the profile is a candidate
+        :rtype: bool
+        """
+        include, exclude, blocked = FilterHandler.__get_matchers()
+
+        text = f'{name or ""}\n{headline or ""}'
+
+        accepted = not (blocked and link and LinkHandler.get_slug(link) in blocked) and \
+            (include is None or include.search(text) is not None) and \
+            (exclude is None or exclude.search(text) is None)
+
+        if not accepted:
+            MetricsHandler.increment('filtered')
+
+        return accepted
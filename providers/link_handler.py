@@ -0,0 +1,37 @@
+from urllib.parse import urlsplit
+
+
+class LinkHandler:
+    """
+    Static methods which handles LinkedIn profile links.
+
+    Methods
+    -------
+        get_slug(link: str) -> str:
+            Provides the profile name (the denoted string value from the URL) of a profile link.
+        normalize(link: str) -> str:
+            Provides a canonical form of a profile link, used as a key when comparing profiles.
+    """
+
+    @staticmethod
+    def get_slug(link: str) -> str:
+        """
+        Provides the profile name (the denoted string value from the URL) of a profile link.
+
+        :param str link: Specify the profile link, or the profile name itself
+        :returns: The lowercase profile name, without the query string or trailing slashes
+        :rtype: str
+        """
+        return link.split('?')[0].rstrip('/').rsplit('/', 1)[-1].lower()
+
+    @staticmethod
+    def normalize(link: str) -> str:
+        """
+        Provides a canonical form of a profile link, used as a key when comparing profiles.
+
+        :param str link: Specify the profile link
+        :returns: The lowercase link, without the scheme, query string, fragment or trailing slashes
+        :rtype: str
+        """
+        parts = urlsplit(link.strip())
+        return f'{parts.netloc.removeprefix("www.")}{parts.path}'.rstrip('/').lower()
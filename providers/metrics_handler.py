@@ -0,0 +1,224 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from providers.configuration_handler import ConfigurationHandler
+
+
+class MetricsHandler:
+    """
+    Static methods which measures where a run's time goes, opt-in through metrics.enabled in config.json.
+
+    Spans are named after what they measure, prefixed by their kind: handler.*, page.*, scroll.*, action.*, wait and
+    sleep.*.
+
+    Attributes
+    ----------
+        __PREFIX  The prefix of every Prometheus metric name
+        __started  The time of the first measurement, None if nothing was measured yet
+        __commands  The number of WebDriver commands and the seconds spent in them, keyed by the command name
+        __spans  The number of spans and the seconds spent in them, keyed by the span name
+        __counters  The measured quantities, e.g. the number of written profiles, keyed by their name
+        __lock  Guards the measurements, which are shared by every session
+
+    Methods
+    -------
+        is_enabled() -> bool:
+            Checks whether metrics.enabled in config.json is set.
+        __start():
+            Starts the run's clock, and exports the measurements when the program exits.
+        __observe(measurements: dict[str, list], name: str, seconds: float):
+            Adds a single observation to a measurement.
+        instrument(driver):
+            Counts and times every WebDriver command issued by a web driver.
+        span(name: str) -> Iterator[None]:
+            Times the enclosed block.
+        increment(name: str, value: int = 1):
+            Increments a counter, e.g. profiles.
+        get_summary() -> dict:
+            Provides the run summary, including profiles/minute, commands/profile and the sleep-vs-work ratio.
+        export():
+            Writes the run summary as JSON to metrics.summaryFile and as a Prometheus textfile to
+            metrics.prometheusFile.
+    """
+
+    __PREFIX = 'linkedin_automation'
+
+    __started = None
+    __commands = {}
+    __spans = {}
+    __counters = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Checks whether metrics.enabled in config.json is set.
+
+        :returns: Whether the run is instrumented
+        :rtype: bool
+        """
+        return ConfigurationHandler.get_configuration()['metrics']['enabled']
+
+    @staticmethod
+    def __start():
+        """
+        Starts the run's clock, and exports the measurements when the program exits.
+        """
+        if MetricsHandler.__started is None:
+            MetricsHandler.__started = time.perf_counter()
+            atexit.register(MetricsHandler.export)
+
+    @staticmethod
+    def __observe(measurements: dict[str, list], name: str, seconds: float):
+        """
+        Adds a single observation to a measurement.
+
+        :param dict[str, list] measurements: Specify the measurements, either the commands or the spans
+        :param str name: Specify the measurement name
+        :param float seconds: Specify the observed duration
+        """
+        with MetricsHandler.__lock:
+            MetricsHandler.__start()
+            measurement = measurements.setdefault(name, [0, 0.0])
+            measurement[0] += 1
+            measurement[1] += seconds
+
+    @staticmethod
+    def instrument(driver):
+        """
+        Counts and times every WebDriver command issued by a web driver, ignored if metrics are disabled.
+
+        :param driver: Specify the web driver
+        """
+        if not MetricsHandler.is_enabled():
+            return
+
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                MetricsHandler.__observe(MetricsHandler.__commands, driver_command, time.perf_counter() - started)
+
+        driver.execute = timed_execute
+
+    @staticmethod
+    @contextmanager
+    def span(name: str) -> Iterator[None]:
+        """
+        Times the enclosed block, ignored if metrics are disabled.
+
+        :param str name: Specify the span name, e.g. page.peopleSearch
+        """
+        if not MetricsHandler.is_enabled():
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            MetricsHandler.__observe(MetricsHandler.__spans, name, time.perf_counter() - started)
+
+    @staticmethod
+    def increment(name: str, value: int = 1):
+        """
+        Increments a counter, ignored if metrics are disabled.
+
+        :param str name: Specify the counter name, e.g. profiles
+        :param int value: Specify the increment
+        """
+        if not MetricsHandler.is_enabled():
+            return
+
+        with MetricsHandler.__lock:
+            MetricsHandler.__start()
+            MetricsHandler.__counters[name] = MetricsHandler.__counters.get(name, 0) + value
+
+    @staticmethod
+    def get_summary() -> dict:
+        """
+        Provides the run summary, including profiles/minute, commands/profile and the sleep-vs-work ratio, the waits
+        and sleeps are summed across sessions, so the ratio may exceed one when running several sessions.
+
+        :returns: The run summary
+        :rtype: dict
+        """
+        with MetricsHandler.__lock:
+            elapsed = time.perf_counter() - MetricsHandler.__started if MetricsHandler.__started is not None else 0.0
+            commands = {name: {'count': count, 'seconds': seconds}
+                        for name, (count, seconds) in MetricsHandler.__commands.items()}
+            spans = {name: {'count': count, 'seconds': seconds}
+                     for name, (count, seconds) in MetricsHandler.__spans.items()}
+            counters = dict(MetricsHandler.__counters)
+
+        profiles = counters.get('profiles', 0)
+        command_count = sum(command['count'] for command in commands.values())
+        idle = sum(span['seconds'] for name, span in spans.items() if name == 'wait' or name.startswith('sleep.'))
+
+        return {
+            'elapsedSeconds': elapsed,
+            'profiles': profiles,
+            'profilesPerMinute': profiles / (elapsed / 60) if elapsed else 0.0,
+            'commands': command_count,
+            'commandsPerProfile': command_count / profiles if profiles else 0.0,
+            'idleSeconds': idle,
+            'sleepToWorkRatio': idle / (elapsed - idle) if elapsed > idle else 0.0,
+            'commandsByType': commands,
+            'spans': spans,
+            'counters': counters,
+        }
+
+    @staticmethod
+    def export():
+        """
+        Writes the run summary as JSON to metrics.summaryFile and as a Prometheus textfile to metrics.prometheusFile,
+        ignored if nothing was measured.
+        """
+        if MetricsHandler.__started is None:
+            return
+
+        configuration = ConfigurationHandler.get_configuration()['metrics']
+        summary = MetricsHandler.get_summary()
+        prefix = MetricsHandler.__PREFIX
+
+        lines = [
+            f'# TYPE {prefix}_commands_total counter',
+            *[f'{prefix}_commands_total{{command="{name}"}} {command["count"]}'
+              for name, command in summary['commandsByType'].items()],
+            f'# TYPE {prefix}_command_seconds_total counter',
+            *[f'{prefix}_command_seconds_total{{command="{name}"}} {command["seconds"]:.6f}'
+              for name, command in summary['commandsByType'].items()],
+            f'# TYPE {prefix}_spans_total counter',
+            *[f'{prefix}_spans_total{{span="{name}"}} {span["count"]}' for name, span in summary['spans'].items()],
+            f'# TYPE {prefix}_span_seconds_total counter',
+            *[f'{prefix}_span_seconds_total{{span="{name}"}} {span["seconds"]:.6f}'
+              for name, span in summary['spans'].items()],
+            f'# TYPE {prefix}_elapsed_seconds gauge',
+            f'{prefix}_elapsed_seconds {summary["elapsedSeconds"]:.6f}',
+            f'# TYPE {prefix}_profiles_total counter',
+            f'{prefix}_profiles_total {summary["profiles"]}',
+            f'# TYPE {prefix}_profiles_per_minute gauge',
+            f'{prefix}_profiles_per_minute {summary["profilesPerMinute"]:.6f}',
+            f'# TYPE {prefix}_commands_per_profile gauge',
+            f'{prefix}_commands_per_profile {summary["commandsPerProfile"]:.6f}',
+            f'# TYPE {prefix}_sleep_to_work_ratio gauge',
+            f'{prefix}_sleep_to_work_ratio {summary["sleepToWorkRatio"]:.6f}',
+        ]
+
+        for path, content in [(configuration['summaryFile'], json.dumps(summary, indent=2)),
+                              (configuration['prometheusFile'], '\n'.join(lines) + '\n')]:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+            # The Prometheus textfile collector must never read a partially written file
+            with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+                file.write(content)
+
+            os.replace(f'{path}.tmp', path)
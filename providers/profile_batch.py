@@ -0,0 +1,296 @@
+from array import array
+from typing import Iterable, Iterator, Optional
+
+
+class ProfileRecord:
+    """
+    A single profile of a ProfileBatch.
+
+    Attributes
+    ----------
+        name  The profile name
+        headline  The profile headline
+        link  The profile link
+    """
+
+    __slots__ = ('name', 'headline', 'link')
+
+    def __init__(self, name: Optional[str], headline: Optional[str], link: Optional[str]):
+        self.name = name
+        self.headline = headline
+        self.link = link
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter((self.name, self.headline, self.link))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProfileRecord) and tuple(self) == tuple(other)
+
+    def __repr__(self) -> str:
+        return f'ProfileRecord(name={self.name!r}, headline={self.headline!r}, link={self.link!r})'
+
+
+class ProfileBatch:
+    """
+    A columnar, append-only collection of profiles, laid out as Arrow arrays so that it can be exported without
+    copying every value. Names and profile slugs are stored as UTF-8 bytes back to back, headlines and link prefixes
+    (e.g. https://www.linkedin.com/in/) are stored once and referenced by their index.
+
+    Attributes
+    ----------
+        __COLUMNS  The exported columns, as written by ProfileWriter
+        __names  The UTF-8 bytes of every name
+        __name_offsets  The end offset of every name in __names, preceded by 0
+        __name_validity  A bitmap of the profiles which have a name
+        __headlines  The distinct headlines
+        __headline_codes  The index of every distinct headline in __headlines
+        __headline_indices  The headline index of every profile, 0 if it has none
+        __headline_validity  A bitmap of the profiles which have a headline
+        __prefixes  The distinct link prefixes, that is, everything up to the profile slug
+        __prefix_codes  The index of every distinct link prefix in __prefixes
+        __prefix_indices  The link prefix index of every profile, 0 if it has no link
+        __slugs  The UTF-8 bytes of every link past its prefix
+        __slug_offsets  The end offset of every slug in __slugs, preceded by 0
+        __link_validity  A bitmap of the profiles which have a link
+
+    Methods
+    -------
+        __set_valid(bitmap: bytearray, index: int, valid: bool):
+            Records whether a profile has a value in a validity bitmap.
+        __is_valid(bitmap: bytearray, index: int) -> bool:
+            Checks whether a profile has a value in a validity bitmap.
+        __encode(table: list[str], codes: dict[str, int], value: str) -> int:
+            Provides the index of a value in a table of distinct values, adding it if it is missing.
+        append(name: Optional[str], headline: Optional[str], link: Optional[str]):
+            Adds a profile to the batch.
+        extend(records: Iterable):
+            Adds every profile of an iterable to the batch.
+        get_slug(index: int) -> Optional[str]:
+            Provides the profile slug of a profile, without decoding its link.
+        get_size() -> int:
+            Provides the number of bytes held by the batch's buffers and tables.
+        to_arrow():
+            Exports the batch into an Arrow table, requires pyarrow.
+        to_dataframe():
+            Exports the batch into a DataFrame, requires pandas.
+    """
+
+    __COLUMNS = ['Name', 'HeadLine', 'Link']
+
+    def __init__(self, records: Iterable = ()):
+        """
+        Creates a batch.
+
+        :param Iterable records: Specify the initial profiles, either ProfileRecord instances or (name, headline,
+                                 link) tuples
+        """
+        self.__names = bytearray()
+        self.__name_offsets = array('q', [0])
+        self.__name_validity = bytearray()
+        self.__headlines = []
+        self.__headline_codes = {}
+        self.__headline_indices = array('q')
+        self.__headline_validity = bytearray()
+        self.__prefixes = []
+        self.__prefix_codes = {}
+        self.__prefix_indices = array('q')
+        self.__slugs = bytearray()
+        self.__slug_offsets = array('q', [0])
+        self.__link_validity = bytearray()
+
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self.__headline_indices)
+
+    def __getitem__(self, index: int) -> ProfileRecord:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('profile index out of range')
+
+        name = None
+        if ProfileBatch.__is_valid(self.__name_validity, index):
+            name = self.__names[self.__name_offsets[index]:self.__name_offsets[index + 1]].decode()
+
+        headline = None
+        if ProfileBatch.__is_valid(self.__headline_validity, index):
+            headline = self.__headlines[self.__headline_indices[index]]
+
+        link = None
+        if ProfileBatch.__is_valid(self.__link_validity, index):
+            link = self.__prefixes[self.__prefix_indices[index]] + self.get_slug(index)
+
+        return ProfileRecord(name, headline, link)
+
+    def __iter__(self) -> Iterator[ProfileRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @staticmethod
+    def __set_valid(bitmap: bytearray, index: int, valid: bool):
+        """
+        Records whether a profile has a value in a validity bitmap, using Arrow's least significant bit order.
+
+        :param bytearray bitmap: Specify the validity bitmap
+        :param int index: Specify the profile index, the next one to be appended
+        :param bool valid: Specify whether the profile has a value
+        """
+        if index % 8 == 0:
+            bitmap.append(0)
+
+        if valid:
+            bitmap[index >> 3] |= 1 << (index & 7)
+
+    @staticmethod
+    def __is_valid(bitmap: bytearray, index: int) -> bool:
+        """
+        Checks whether a profile has a value in a validity bitmap.
+
+        :param bytearray bitmap: Specify the validity bitmap
+        :param int index: Specify the profile index
+        :returns: Whether the profile has a value
+        :rtype: bool
+        """
+        return bool(bitmap[index >> 3] & 1 << (index & 7))
+
+    @staticmethod
+    def __encode(table: list[str], codes: dict[str, int], value: str) -> int:
+        """
+        Provides the index of a value in a table of distinct values, adding it if it is missing.
+
+        :param list[str] table: Specify the distinct values
+        :param dict[str, int] codes: Specify the index of every distinct value
+        :param str value: Specify the value
+        :returns: The value's index
+        :rtype: int
+        """
+        code = codes.get(value)
+
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+
+        return code
+
+    def append(self, name: Optional[str], headline: Optional[str], link: Optional[str]):
+        """
+        Adds a profile to the batch.
+
+        :param Optional[str] name: Specify the profile name
+        :param Optional[str] headline: Specify the profile headline
+        :param Optional[str] link: Specify the profile link
+        :raises BufferError: if a table exported by to_arrow() still refers to the batch
+        """
+        index = len(self)
+        encoded_name = (name or '').encode()
+
+        # Resizing an exported buffer fails, before the batch is modified
+        self.__name_offsets.append(len(self.__names) + len(encoded_name))
+        self.__names += encoded_name
+        ProfileBatch.__set_valid(self.__name_validity, index, name is not None)
+
+        ProfileBatch.__set_valid(self.__headline_validity, index, headline is not None)
+        self.__headline_indices.append(
+            0 if headline is None else ProfileBatch.__encode(self.__headlines, self.__headline_codes, headline)
+        )
+
+        ProfileBatch.__set_valid(self.__link_validity, index, link is not None)
+        if link is None:
+            self.__prefix_indices.append(0)
+        else:
+            # Everything up to the last path segment is shared by every profile link
+            split = link.rstrip('/').rfind('/') + 1
+            self.__prefix_indices.append(ProfileBatch.__encode(self.__prefixes, self.__prefix_codes, link[:split]))
+            self.__slugs += link[split:].encode()
+        self.__slug_offsets.append(len(self.__slugs))
+
+    def extend(self, records: Iterable):
+        """
+        Adds every profile of an iterable to the batch.
+
+        :param Iterable records: Specify the profiles, either ProfileRecord instances or (name, headline, link) tuples
+        """
+        for name, headline, link in records:
+            self.append(name, headline, link)
+
+    def get_slug(self, index: int) -> Optional[str]:
+        """
+        Provides the profile slug of a profile, without decoding its link.
+
+        :param int index: Specify the profile index
+        :returns: The last path segment of the profile link as written, None if the profile has no link
+        :rtype: Optional[str]
+        """
+        if not ProfileBatch.__is_valid(self.__link_validity, index):
+            return None
+
+        return self.__slugs[self.__slug_offsets[index]:self.__slug_offsets[index + 1]].decode()
+
+    def get_size(self) -> int:
+        """
+        Provides the number of bytes held by the batch's buffers and tables, excluding the lookup dictionaries.
+
+        :returns: The number of bytes
+        :rtype: int
+        """
+        buffers = [self.__names, self.__name_offsets, self.__name_validity, self.__headline_indices,
+                   self.__headline_validity, self.__prefix_indices, self.__slugs, self.__slug_offsets,
+                   self.__link_validity]
+
+        return sum(memoryview(buffer).nbytes for buffer in buffers) + \
+            sum(len(value.encode()) for value in self.__headlines + self.__prefixes)
+
+    def to_arrow(self):
+        """
+        Exports the batch into an Arrow table, requires pyarrow. The names and the headline indices are shared with
+        the batch rather than copied, the batch must not be appended to while the table is in use.
+
+        :returns: The table, with the Name, HeadLine (dictionary encoded) and Link columns
+        :rtype: pa.Table
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        count = len(self)
+
+        names = pa.LargeStringArray.from_buffers(count, pa.py_buffer(self.__name_offsets),
+                                                 pa.py_buffer(self.__names), pa.py_buffer(self.__name_validity))
+
+        headline_indices = pa.Array.from_buffers(pa.int64(), count, [pa.py_buffer(self.__headline_validity),
+                                                                      pa.py_buffer(self.__headline_indices)])
+        headlines = pa.DictionaryArray.from_arrays(headline_indices, pa.array(self.__headlines, pa.large_string()))
+
+        prefix_indices = pa.Array.from_buffers(pa.int64(), count, [pa.py_buffer(self.__link_validity),
+                                                                    pa.py_buffer(self.__prefix_indices)])
+        prefixes = pa.DictionaryArray.from_arrays(prefix_indices, pa.array(self.__prefixes, pa.large_string()))
+        slugs = pa.LargeStringArray.from_buffers(count, pa.py_buffer(self.__slug_offsets),
+                                                 pa.py_buffer(self.__slugs), pa.py_buffer(self.__link_validity))
+        links = pc.binary_join_element_wise(prefixes.dictionary_decode(), slugs, pa.scalar('', pa.large_string()))
+
+        return pa.table([names, headlines, links], names=ProfileBatch.__COLUMNS)
+
+    def to_dataframe(self):
+        """
+        Exports the batch into a DataFrame, requires pandas. The headlines are categorical, so that every distinct
+        headline is held once, and the batch is exported through Arrow if pyarrow is installed.
+
+        :returns: The batch's profiles, with the Name, HeadLine and Link columns
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        try:
+            return self.to_arrow().to_pandas()
+        except ImportError:
+            pass
+
+        headline_codes = [code if ProfileBatch.__is_valid(self.__headline_validity, index) else -1
+                          for index, code in enumerate(self.__headline_indices)]
+
+        return pd.DataFrame({
+            'Name': [record.name for record in self],
+            'HeadLine': pd.Categorical.from_codes(headline_codes, categories=self.__headlines),
+            'Link': [record.link for record in self],
+        }, columns=ProfileBatch.__COLUMNS)
@@ -0,0 +1,173 @@
+import csv
+import glob
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from enums.profile_actions import ProfileActions
+from providers.configuration_handler import ConfigurationHandler
+from providers.link_handler import LinkHandler
+
+
+class ProfileStoreHandler:
+    """
+    Static methods which handles the persistent profile store, shared across runs.
+
+    Attributes
+    ----------
+        __connection  Acts as a cache for storing the SQLite connection
+        __lock  Serializes access to the connection, which is shared across the session pool's threads
+
+    Methods
+    -------
+        __get_connection() -> sqlite3.Connection:
+            Returns a connection to the profile store, creates and seeds the store if it does not exist.
+        __seed(connection: sqlite3.Connection):
+            Imports the profiles found in previously generated CSV files.
+        contains(link: str, actions: Optional[list[ProfileActions]] = None) -> bool:
+            Checks whether a profile is already known.
+        record(link: str, name: Optional[str], headline: Optional[str], source: str, action: ProfileActions):
+            Inserts or updates a profile in the store.
+        count_actions(path: str, since: float = 0) -> dict[str, int]:
+            Counts the profiles of any profile store per recorded action.
+    """
+
+    __connection = None
+    __lock = threading.RLock()
+
+    @staticmethod
+    def __get_connection() -> sqlite3.Connection:
+        """
+        Returns a connection to the profile store, creates and seeds the store if it does not exist.
+
+        :returns: The profile store's connection
+        :rtype: sqlite3.Connection
+        """
+        with ProfileStoreHandler.__lock:
+            if ProfileStoreHandler.__connection is None:
+                path = ConfigurationHandler.get_configuration()['profileStore']
+                exists = os.path.exists(path)
+
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+                connection = sqlite3.connect(path, check_same_thread=False)
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS profiles ('
+                    'normalized_link TEXT PRIMARY KEY, '
+                    'link TEXT NOT NULL, '
+                    'name TEXT, '
+                    'headline TEXT, '
+                    'source TEXT NOT NULL, '
+                    'action TEXT NOT NULL, '
+                    'timestamp REAL NOT NULL'
+                    ')'
+                )
+
+                if not exists:
+                    ProfileStoreHandler.__seed(connection)
+
+                connection.commit()
+
+                ProfileStoreHandler.__connection = connection
+
+        return ProfileStoreHandler.__connection
+
+    @staticmethod
+    def __seed(connection: sqlite3.Connection):
+        """
+        Imports the profiles found in previously generated CSV files.
+
+        :param sqlite3.Connection connection: Specify the profile store's connection
+        """
+        directory = os.path.dirname(ConfigurationHandler.get_configuration()['profileStore']) or '.'
+
+        for path in glob.glob(os.path.join(directory, '*.csv')):
+            source = os.path.splitext(os.path.basename(path))[0]
+            timestamp = os.path.getmtime(path)
+
+            with open(path, newline='', encoding='utf-8') as file:
+                rows = [
+                    (LinkHandler.normalize(row['Link']), row['Link'], row.get('Name'), row.get('HeadLine'), source,
+                     ProfileActions.RECORDED.value, timestamp)
+                    for row in csv.DictReader(file) if row.get('Link')
+                ]
+
+            connection.executemany('INSERT OR IGNORE INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    @staticmethod
+    def contains(link: str, actions: Optional[list[ProfileActions]] = None) -> bool:
+        """
+        Checks whether a profile is already known.
+
+        :param str link: Specify the profile link
+        :param Optional[list[ProfileActions]] actions: Specify the recorded actions to consider, defaults to any action
+        :returns: Whether the profile is known
+        :rtype: bool
+        """
+        with ProfileStoreHandler.__lock:
+            row = ProfileStoreHandler.__get_connection().execute(
+                'SELECT action FROM profiles WHERE normalized_link = ?',
+                (LinkHandler.normalize(link),)
+            ).fetchone()
+
+        if row is None:
+            return False
+
+        return actions is None or row[0] in [action.value for action in actions]
+
+    @staticmethod
+    def record(link: str, name: Optional[str], headline: Optional[str], source: str, action: ProfileActions):
+        """
+        Inserts or updates a profile in the store, recording a profile keeps the action taken on it earlier, e.g. a
+        connected profile which is retrieved again without connecting stays connected.
+
+        :param str link: Specify the profile link
+        :param Optional[str] name: Specify the profile name
+        :param Optional[str] headline: Specify the profile headline
+        :param str source: Specify the endpoint which the profile was retrieved from, e.g. peopleSearch
+        :param ProfileActions action: Specify the action taken on the profile
+        """
+        with ProfileStoreHandler.__lock:
+            connection = ProfileStoreHandler.__get_connection()
+            connection.execute(
+                'INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(normalized_link) DO UPDATE SET '
+                'link = excluded.link, name = excluded.name, headline = excluded.headline, source = excluded.source, '
+                'action = CASE WHEN excluded.action = ? THEN profiles.action ELSE excluded.action END, '
+                'timestamp = CASE WHEN excluded.action = ? THEN profiles.timestamp ELSE excluded.timestamp END',
+                (LinkHandler.normalize(link), link, name, headline, source, action.value, time.time(),
+                 ProfileActions.RECORDED.value, ProfileActions.RECORDED.value)
+            )
+            connection.commit()
+
+    @staticmethod
+    def count_actions(path: str, since: float = 0) -> dict[str, int]:
+        """
+        Counts the profiles of any profile store per recorded action, read-only, so that the store of a run in
+        progress can be read from another process.
+
+        :param str path: Specify the profile store's path
+        :param float since: Specify the UNIX time from which the profiles are counted
+        :returns: The number of profiles keyed by the action, empty if the store was not created yet
+        :rtype: dict[str, int]
+        """
+        if not os.path.exists(path):
+            return {}
+
+        connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        try:
+            rows = connection.execute(
+                'SELECT action, COUNT(*) FROM profiles WHERE timestamp >= ? GROUP BY action',
+                (since,)
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # Created, but not initialized yet
+            return {}
+        finally:
+            connection.close()
+
+        return dict(rows)
@@ -0,0 +1,162 @@
+import csv
+import json
+import os
+from typing import Optional
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.metrics_handler import MetricsHandler
+from providers.profile_batch import ProfileBatch
+
+
+class ProfileWriter:
+    """
+    Appends retrieved profiles to the output files as soon as they are produced, so that an interrupted run keeps
+    every profile retrieved so far.
+
+    Attributes
+    ----------
+        __HEADER  The output columns
+        count  The number of profiles written by this writer
+        __files  The open output files, keyed by their format
+        __csv_writer  The CSV writer, if the csv format is enabled
+        __fsync_interval  The number of profiles written between two fsync calls
+
+    Methods
+    -------
+        write(name: Optional[str], headline: Optional[str], link: Optional[str]):
+            Appends a profile to every output file and flushes it.
+        __sync():
+            Forces the written profiles to be persisted on disk.
+        close():
+            Persists and closes the output files.
+        read_dataframe(name: str):
+            Loads a previously written output file into a DataFrame, requires pandas.
+        read_batch(name: str) -> ProfileBatch:
+            Loads a previously written output file into a compact, columnar batch.
+    """
+
+    __HEADER = ['Name', 'HeadLine', 'Link']
+
+    def __init__(self, name: str, append: bool = False):
+        """
+        Opens the output files of a handler.
+
+        :param str name: Specify the output file name, without the extension
+        :param bool append: Specify whether to append to existing output files instead of overwriting them
+        """
+        configuration = ConfigurationHandler.get_configuration()
+        directory = configuration['outputDirectory']
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.count = 0
+        self.__files = {}
+        self.__csv_writer = None
+        self.__fsync_interval = configuration['outputFsyncInterval']
+
+        for output_format in configuration['outputFormats']:
+            path = os.path.join(directory, f'{name}.{output_format}')
+            write_header = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+
+            file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+            self.__files[output_format] = file
+
+            if output_format == 'csv':
+                self.__csv_writer = csv.writer(file, lineterminator='\n')
+                if write_header:
+                    self.__csv_writer.writerow(ProfileWriter.__HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, name: Optional[str], headline: Optional[str], link: Optional[str]):
+        """
+        Appends a profile to every output file and flushes it.
+
+        :param Optional[str] name: Specify the profile name
+        :param Optional[str] headline: Specify the profile headline
+        :param Optional[str] link: Specify the profile link
+        """
+        if self.__csv_writer is not None:
+            self.__csv_writer.writerow([name, headline, link])
+
+        if 'jsonl' in self.__files:
+            self.__files['jsonl'].write(
+                json.dumps(dict(zip(ProfileWriter.__HEADER, [name, headline, link])), ensure_ascii=False) + '\n'
+            )
+
+        for file in self.__files.values():
+            file.flush()
+
+        self.count += 1
+        MetricsHandler.increment('profiles')
+
+        if self.__fsync_interval > 0 and self.count % self.__fsync_interval == 0:
+            self.__sync()
+
+    def __sync(self):
+        """
+        Forces the written profiles to be persisted on disk.
+        """
+        for file in self.__files.values():
+            file.flush()
+            os.fsync(file.fileno())
+
+    def close(self):
+        """
+        Persists and closes the output files.
+        """
+        if not self.__files:
+            return
+
+        self.__sync()
+
+        for file in self.__files.values():
+            file.close()
+
+        self.__files = {}
+        self.__csv_writer = None
+
+    @staticmethod
+    def read_dataframe(name: str):
+        """
+        Loads a previously written output file into a DataFrame, requires pandas. The file is read into a
+        ProfileBatch first, so that the headlines are categorical and every distinct headline is held once.
+
+        :param str name: Specify the output file name, without the extension
+        :returns: The output file's profiles, with the Name, HeadLine and Link columns
+        :rtype: pd.DataFrame
+        :raises FileNotFoundError: if neither a jsonl nor a csv output file exists
+        """
+        return ProfileWriter.read_batch(name).to_dataframe()
+
+    @staticmethod
+    def read_batch(name: str) -> ProfileBatch:
+        """
+        Loads a previously written output file into a compact, columnar batch, reading one profile at a time. The
+        JSON lines file is preferred since it keeps missing values apart from empty ones.
+
+        :param str name: Specify the output file name, without the extension
+        :returns: The output file's profiles
+        :rtype: ProfileBatch
+        :raises FileNotFoundError: if neither a jsonl nor a csv output file exists
+        """
+        path = os.path.join(ConfigurationHandler.get_configuration()['outputDirectory'], name)
+        batch = ProfileBatch()
+
+        if os.path.exists(f'{path}.jsonl'):
+            with open(f'{path}.jsonl', encoding='utf-8') as file:
+                for line in file:
+                    profile = json.loads(line)
+                    batch.append(*(profile.get(column) for column in ProfileWriter.__HEADER))
+            return batch
+
+        with open(f'{path}.csv', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            batch.extend(reader)
+
+        return batch
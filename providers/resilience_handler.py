@@ -0,0 +1,155 @@
+import threading
+import time
+import warnings
+from typing import Callable, Optional, TypeVar
+
+from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException, \
+    StaleElementReferenceException, TimeoutException
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.metrics_handler import MetricsHandler
+from providers.wait_handler import WaitHandler
+
+# Failures caused by a page which is still loading, was re-rendered or was briefly covered, e.g. by a toast
+TRANSIENT_EXCEPTIONS = (StaleElementReferenceException, TimeoutException, NoSuchElementException,
+                        ElementClickInterceptedException, IndexError)
+
+T = TypeVar('T')
+
+
+class ResilienceHandler:
+    """
+    Static methods which recovers page operations in place rather than failing the run; transient failures are
+    retried with exponential backoff, and a circuit breaker pauses every action of every session while LinkedIn shows
+    a checkpoint or restriction page.
+
+    Attributes
+    ----------
+        __condition  Guards the circuit breaker, and notifies the paused sessions once it is closed again
+        __open  Whether the circuit breaker is open, that is, every action is paused
+        __failure  The reason the run was stopped, set once a restriction page was not cleared in time
+
+    Methods
+    -------
+        is_restricted(url: str) -> bool:
+            Checks whether a URL is a checkpoint or restriction page.
+        wait_closed():
+            Waits while the circuit breaker is open.
+        check():
+            Opens the circuit breaker if the current page is a checkpoint or restriction page, until it is cleared.
+        retry(operation: Callable[[], T], recover: Optional[Callable[[Exception], None]] = None,
+        name: str = 'operation') -> T:
+            Invokes an operation, retrying it with exponential backoff when it fails transiently.
+    """
+
+    __condition = threading.Condition()
+    __open = False
+    __failure = None
+
+    @staticmethod
+    def is_restricted(url: str) -> bool:
+        """
+        Checks whether a URL is a checkpoint or restriction page.
+
+        :param str url: Specify the URL
+        :returns: Whether the URL contains any of the resilience.restrictionURLs values in config.json
+        :rtype: bool
+        """
+        return any(part in url for part in ConfigurationHandler.get_configuration()['resilience']['restrictionURLs'])
+
+    @staticmethod
+    def wait_closed():
+        """
+        Waits while the circuit breaker is open.
+
+        :raises RuntimeError: if the run was stopped because a restriction page was not cleared in time
+        """
+        with ResilienceHandler.__condition:
+            while ResilienceHandler.__open:
+                ResilienceHandler.__condition.wait()
+
+            if ResilienceHandler.__failure is not None:
+                raise RuntimeError(ResilienceHandler.__failure)
+
+    @staticmethod
+    def check():
+        """
+        Opens the circuit breaker if the current page is a checkpoint or restriction page, pausing every action until
+        the page is cleared (e.g. the challenge is solved in the browser window) or resilience.pauseTimeout seconds in
+        config.json elapse.
+
+        :raises RuntimeError: if the page was not cleared in time, every later action fails the same way
+        """
+        if not ResilienceHandler.is_restricted(DriverHandler.get_driver().current_url):
+            return
+
+        with ResilienceHandler.__condition:
+            opened = not ResilienceHandler.__open and ResilienceHandler.__failure is None
+            if opened:
+                ResilienceHandler.__open = True
+
+        # Another session is already waiting for the restriction to be cleared, or the run was stopped
+        if not opened:
+            ResilienceHandler.wait_closed()
+            return
+
+        pause_timeout = ConfigurationHandler.get_configuration()['resilience']['pauseTimeout']
+
+        warnings.warn('LinkedIn shows a checkpoint or restriction page, every action is paused until it is cleared')
+        MetricsHandler.increment('circuitBreaker')
+
+        cleared = False
+        try:
+            cleared = WaitHandler.until(lambda web_driver: not ResilienceHandler.is_restricted(web_driver.current_url),
+                                        float('inf') if pause_timeout == -1 else pause_timeout)
+        finally:
+            with ResilienceHandler.__condition:
+                ResilienceHandler.__open = False
+                if not cleared:
+                    ResilienceHandler.__failure = 'LinkedIn showed a checkpoint or restriction page which was not ' \
+                                                  'cleared in time, the run was stopped'
+                ResilienceHandler.__condition.notify_all()
+
+        if not cleared:
+            raise RuntimeError(ResilienceHandler.__failure)
+
+    @staticmethod
+    def retry(operation: Callable[[], T], recover: Optional[Callable[[Exception], None]] = None,
+              name: str = 'operation') -> T:
+        """
+        Invokes an operation, retrying it up to resilience.retries times in config.json when it fails transiently;
+        the n-th retry waits resilience.backoff * 2^(n-1) seconds, up to resilience.maximumBackoff seconds, and
+        checks for a restriction page beforehand.
+
+        :param Callable[[], T] operation: Specify the operation
+        :param Optional[Callable[[Exception], None]] recover: Specify a function which restores the operation's state
+                                                            before a retry, e.g. re-locates a stale card, receives the
+                                                            failure
+        :param str name: Specify the operation name, retries are counted by the retries.NAME metric
+        :returns: The operation's result
+        :rtype: T
+        :raises Exception: the last failure once the retries are exhausted, a non-transient failure immediately
+        """
+        configuration = ConfigurationHandler.get_configuration()['resilience']
+
+        attempt = 0
+
+        while True:
+            ResilienceHandler.wait_closed()
+
+            try:
+                return operation()
+            except TRANSIENT_EXCEPTIONS as exception:
+                attempt += 1
+                if attempt > configuration['retries']:
+                    raise
+
+                MetricsHandler.increment(f'retries.{name}')
+                ResilienceHandler.check()
+
+                with MetricsHandler.span('sleep.backoff'):
+                    time.sleep(min(configuration['backoff'] * 2 ** (attempt - 1), configuration['maximumBackoff']))
+
+                if recover is not None:
+                    recover(exception)
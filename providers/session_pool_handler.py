@@ -0,0 +1,231 @@
+import atexit
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.metrics_handler import MetricsHandler
+
+
+class Session:
+    """
+    An isolated browser instance of the session pool.
+
+    Attributes
+    ----------
+        driver  The session's web driver
+        directory  The session's user data directory
+        failures  The number of consecutive failed targets
+    """
+
+    def __init__(self, driver, directory: str):
+        self.driver = driver
+        self.directory = directory
+        self.failures = 0
+
+
+class SessionPoolHandler:
+    """
+    Static methods which spreads targets across a pool of isolated, logged in browser instances.
+
+    Attributes
+    ----------
+        __sessions  The launched sessions
+        __idle  The sessions which are not currently handling a target
+        __lock  Guards launching and replacing sessions
+
+    Methods
+    -------
+        get_size() -> int:
+            Provides the number of sessions based on the sessionPool.size value in config.json.
+        launch() -> Session:
+            Launches a session and copies the login state of the main web driver into it.
+        dispose(session: Session):
+            Quits a session's web driver and removes its user data directory.
+        start():
+            Launches the sessions, if they were not launched already.
+        stop():
+            Disposes every session.
+        __acquire() -> Session:
+            Waits for an idle session.
+        __replace(session: Session) -> Optional[Session]:
+            Disposes a failing session and launches a fresh one in its place.
+        map(function: Callable[[Any], Any], targets: list) -> list:
+            Invokes a function for every target, each invocation runs on its own session.
+    """
+
+    __sessions = []
+    __idle = queue.Queue()
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_size() -> int:
+        """
+        Provides the number of sessions based on the sessionPool.size value in config.json.
+
+        :returns: The number of sessions, -1 in config.json resolves to the number of available cores
+        :rtype: int
+        """
+        size = ConfigurationHandler.get_configuration()['sessionPool']['size']
+        return (os.cpu_count() or 1) if size == -1 else size
+
+    @staticmethod
+    def launch() -> Session:
+        """
+        Launches a session and copies the login state of the main web driver into it.
+
+        :returns: The launched session
+        :rtype: Session
+        """
+        main_driver = DriverHandler.get_driver()
+        cookies = main_driver.get_cookies()
+
+        directory = tempfile.mkdtemp(prefix='linkedin-session-')
+        driver = DriverHandler.create_driver(user_data_directory=directory)
+
+        driver.get(ConfigurationHandler.get_configuration()['sessionPool']['cookieDomainURL'])
+        for cookie in cookies:
+            cookie.pop('sameSite', None)
+            driver.add_cookie(cookie)
+
+        return Session(driver, directory)
+
+    @staticmethod
+    def dispose(session: Session):
+        """
+        Quits a session's web driver and removes its user data directory.
+
+        :param Session session: Specify the session
+        """
+        try:
+            session.driver.quit()
+        finally:
+            shutil.rmtree(session.directory, ignore_errors=True)
+
+    @staticmethod
+    def start():
+        """
+        Launches the sessions, if they were not launched already.
+        """
+        with SessionPoolHandler.__lock:
+            if SessionPoolHandler.__sessions:
+                return
+
+            for _ in range(SessionPoolHandler.get_size()):
+                session = SessionPoolHandler.launch()
+                SessionPoolHandler.__sessions.append(session)
+                SessionPoolHandler.__idle.put(session)
+
+            atexit.register(SessionPoolHandler.stop)
+
+    @staticmethod
+    def stop():
+        """
+        Disposes every session.
+        """
+        with SessionPoolHandler.__lock:
+            for session in SessionPoolHandler.__sessions:
+                SessionPoolHandler.dispose(session)
+
+            SessionPoolHandler.__sessions = []
+            SessionPoolHandler.__idle = queue.Queue()
+
+    @staticmethod
+    def __acquire() -> Session:
+        """
+        Waits for an idle session.
+
+        :returns: The session, which must be returned to the idle sessions once the target is handled
+        :rtype: Session
+        :raises RuntimeError: if every session was dropped, since none could be launched in its place
+        """
+        while True:
+            try:
+                return SessionPoolHandler.__idle.get(timeout=1)
+            except queue.Empty:
+                with SessionPoolHandler.__lock:
+                    if not SessionPoolHandler.__sessions:
+                        raise RuntimeError('every session of the pool failed and none could be launched again')
+
+    @staticmethod
+    def __replace(session: Session) -> Optional[Session]:
+        """
+        Disposes a failing session and launches a fresh one in its place, counted by the sessionPool.replaced metric.
+        If the fresh session cannot be launched, the pool shrinks by one, counted by the sessionPool.dropped metric.
+
+        :param Session session: Specify the failing session
+        :returns: The fresh session, None if it could not be launched
+        :rtype: Optional[Session]
+        """
+        with SessionPoolHandler.__lock:
+            SessionPoolHandler.__sessions.remove(session)
+            SessionPoolHandler.dispose(session)
+
+            try:
+                session = SessionPoolHandler.launch()
+            except Exception as exception:
+                MetricsHandler.increment('sessionPool.dropped')
+                warnings.warn(f'a failing session could not be replaced, the pool continues with '
+                              f'{len(SessionPoolHandler.__sessions)} session(s), {exception}')
+                return None
+
+            SessionPoolHandler.__sessions.append(session)
+            MetricsHandler.increment('sessionPool.replaced')
+
+            return session
+
+    @staticmethod
+    def map(function: Callable[[Any], Any], targets: list) -> list:
+        """
+        Invokes a function for every target, each invocation runs on its own session. Runs sequentially on the main
+        web driver if the pool size is one or less. A session which fails sessionPool.maximumFailures consecutive
+        targets is replaced by a freshly launched one, or dropped if none can be launched.
+
+        :param Callable[[Any], Any] function: Specify the function, receives a target
+        :param list targets: Specify the targets, e.g. company names
+        :returns: The function's result for every target, in the same order
+        :rtype: list
+        :raises Exception: the first failure, after every target was attempted
+        """
+        if SessionPoolHandler.get_size() <= 1 or len(targets) <= 1:
+            return [function(target) for target in targets]
+
+        SessionPoolHandler.start()
+
+        maximum_failures = ConfigurationHandler.get_configuration()['sessionPool']['maximumFailures']
+
+        def run(target):
+            session = SessionPoolHandler.__acquire()
+            DriverHandler.bind(session.driver)
+            try:
+                result = function(target)
+                session.failures = 0
+                return result
+            except Exception:
+                session.failures += 1
+                if session.failures >= maximum_failures:
+                    # The fresh session copies the login state of the main web driver
+                    DriverHandler.bind(None)
+                    session = SessionPoolHandler.__replace(session)
+                raise
+            finally:
+                DriverHandler.bind(None)
+                # Only a live session is handed to the next targets
+                if session is not None:
+                    SessionPoolHandler.__idle.put(session)
+
+        with ThreadPoolExecutor(max_workers=len(SessionPoolHandler.__sessions)) as executor:
+            futures = [executor.submit(run, target) for target in targets]
+
+        errors = [future.exception() for future in futures if future.exception() is not None]
+
+        if errors:
+            raise errors[0]
+
+        return [future.result() for future in futures]
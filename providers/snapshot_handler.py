@@ -0,0 +1,207 @@
+import os
+import re
+import time
+from functools import lru_cache
+from html import escape
+from typing import Optional
+from urllib.parse import urljoin
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+
+
+class SnapshotHandler:
+    """
+    Static methods which snapshots a list element's HTML in a single WebDriver call, and parses the snapshot locally
+    with lxml, which is only required by the snapshot extraction mode. A snapshot is a standalone HTML document,
+    which can be saved and re-parsed offline, e.g. as a regression fixture.
+
+    Attributes
+    ----------
+        __SNAPSHOT_SCRIPT  JavaScript which tags every card with a stable data-snapshot-id, and provides the outerHTML
+                           of an element and the URL which its links are relative to
+        __SIMPLE_SELECTOR  Matches a compound selector of a tag name and/or class names, e.g. button.primary
+
+    Methods
+    -------
+        __compile(selector: str):
+            Compiles a CSS selector into an lxml XPath object, once per selector.
+        __resolve(card, field: dict, base_url: str):
+            Resolves a single field of a parsed card.
+        take(container: WebElement, name: Optional[str] = None) -> str:
+            Snapshots a list element into a standalone HTML document.
+        save(snapshot: str, name: str) -> str:
+            Writes a snapshot into the snapshotDirectory value in config.json.
+        parse(snapshot: str, fields: dict[str, dict], start: int = 0) -> list[dict]:
+            Extracts the cards of a snapshot into plain records.
+        parse_file(path: str, fields: dict[str, dict]) -> list[dict]:
+            Extracts the cards of a saved snapshot into plain records.
+    """
+
+    __SNAPSHOT_SCRIPT = '''
+        const cards = arguments[0].getElementsByTagName('li');
+        for (const card of cards) {
+            if (card.dataset.snapshotId === undefined) {
+                window.__snapshotNext = (window.__snapshotNext || 0) + 1;
+                card.dataset.snapshotId = String(window.__snapshotNext);
+            }
+        }
+        return [arguments[0].outerHTML, document.baseURI];
+    '''
+
+    __SIMPLE_SELECTOR = re.compile(r'([A-Za-z][\w-]*)?((?:\.[\w-]+)*)')
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __compile(selector: str):
+        """
+        Compiles a CSS selector into an lxml XPath object, once per selector. Only descendant combinators of tag
+        names and class names are supported, which covers every selector derived from config.json.
+
+        :param str selector: Specify the CSS selector, e.g. '.entity-result__title-line' or 'button span'
+        :returns: The compiled XPath, relative to a card
+        :rtype: lxml.etree.XPath
+        :raises ValueError: if the selector is not supported
+        """
+        from lxml import etree
+
+        steps = []
+
+        for part in selector.split():
+            match = SnapshotHandler.__SIMPLE_SELECTOR.fullmatch(part)
+
+            if not match or not any(match.groups()):
+                raise ValueError(f'unsupported snapshot selector: {selector}')
+
+            tag_name, classes = match.groups()
+            predicates = ''.join(f'[contains(concat(" ", normalize-space(@class), " "), " {class_name} ")]'
+                                 for class_name in classes.split('.') if class_name)
+            steps.append(f'descendant::{tag_name or "*"}{predicates}')
+
+        return etree.XPath('/'.join(steps))
+
+    @staticmethod
+    def __resolve(card, field: dict, base_url: str):
+        """
+        Resolves a single field of a parsed card, mirroring the in-page resolution of the batch extraction mode;
+        innerText is approximated by the element's whitespace-collapsed text, and links are made absolute.
+
+        :param lxml.html.HtmlElement card: Specify the parsed card element
+        :param dict field: Specify the field specification, as returned by ExtractionHandler.field()
+        :param str base_url: Specify the URL which the links are relative to
+        :returns: The attribute value, the parsed element itself, or None if it was not found
+        """
+        matches = SnapshotHandler.__compile(field['selector'])(card)
+
+        if not matches:
+            return None
+
+        element = matches[-1] if field['last'] else matches[0]
+
+        for _ in range(field['depth']):
+            if not len(element):
+                return None
+            element = element[0]
+
+        if field['attribute'] == 'element':
+            return element
+
+        if field['attribute'] == 'innerText':
+            return ' '.join(element.text_content().split())
+
+        value = element.get(field['attribute'])
+
+        if value is not None and field['attribute'] in ('href', 'src'):
+            return urljoin(base_url, value)
+
+        return value
+
+    @staticmethod
+    def take(container: WebElement, name: Optional[str] = None) -> str:
+        """
+        Snapshots a list element into a standalone HTML document, using a single WebDriver call. The snapshot is
+        saved if the snapshotDirectory value in config.json is set.
+
+        :param WebElement container: Specify the list element which contains the cards
+        :param Optional[str] name: Specify the snapshot's file name prefix, e.g. the endpoint name
+        :returns: The snapshot, the list element is the only child of its body and the page URL is its base
+        :rtype: str
+        """
+        outer_html, base_url = DriverHandler.get_driver().execute_script(SnapshotHandler.__SNAPSHOT_SCRIPT,
+                                                                         container)
+
+        snapshot = f'<!DOCTYPE html><html><head><meta charset="utf-8"><base href="{escape(base_url)}"></head>' \
+                   f'<body>{outer_html}</body></html>'
+
+        if ConfigurationHandler.get_configuration()['snapshotDirectory']:
+            SnapshotHandler.save(snapshot, name or 'snapshot')
+
+        return snapshot
+
+    @staticmethod
+    def save(snapshot: str, name: str) -> str:
+        """
+        Writes a snapshot into the snapshotDirectory value in config.json.
+
+        :param str snapshot: Specify the snapshot, as returned by take()
+        :param str name: Specify the file name prefix, e.g. the endpoint name
+        :returns: The path of the written file, named after the prefix and the time it was written
+        :rtype: str
+        """
+        directory = ConfigurationHandler.get_configuration()['snapshotDirectory']
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f'{name}-{time.time_ns()}.html')
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(snapshot)
+
+        return path
+
+    @staticmethod
+    def parse(snapshot: str, fields: dict[str, dict], start: int = 0) -> list[dict]:
+        """
+        Extracts the cards of a snapshot into plain records, without any WebDriver call.
+
+        :param str snapshot: Specify the snapshot, as returned by take()
+        :param dict[str, dict] fields: Specify the fields to extract, keyed by the record key
+        :param int start: Specify the index of the first card to extract
+        :returns: A record per card, the index of the card in the list is stored under the 'index' key and its
+                  data-snapshot-id under the 'id' key, 'element' fields are set to the parsed element, missing values
+                  are set to None
+        :rtype: list[dict]
+        """
+        import lxml.html
+
+        document = lxml.html.document_fromstring(snapshot)
+        base = document.find('head/base')
+        base_url = base.get('href', '') if base is not None else ''
+
+        body = document.find('body')
+        if body is None or not len(body):
+            return []
+
+        records = []
+
+        for index, card in enumerate(body[0].xpath('descendant::li')[start:], start):
+            record = {'index': index, 'id': card.get('data-snapshot-id')}
+            for key, field in fields.items():
+                record[key] = SnapshotHandler.__resolve(card, field, base_url)
+            records.append(record)
+
+        return records
+
+    @staticmethod
+    def parse_file(path: str, fields: dict[str, dict]) -> list[dict]:
+        """
+        Extracts the cards of a saved snapshot into plain records, without any WebDriver call.
+
+        :param str path: Specify the snapshot's path
+        :param dict[str, dict] fields: Specify the fields to extract, e.g. SourceHandler.get_fields(endpoint)
+        :returns: A record per card, as returned by parse()
+        :rtype: list[dict]
+        """
+        with open(path, encoding='utf-8') as file:
+            return SnapshotHandler.parse(file.read(), fields)
@@ -0,0 +1,309 @@
+from typing import Iterator, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from enums.extraction_modes import ExtractionModes
+from enums.source_strategies import SourceStrategies
+from providers.checkpoint_handler import CheckpointHandler
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.extraction_handler import ExtractionHandler
+from providers.metrics_handler import MetricsHandler
+from providers.resilience_handler import ResilienceHandler
+from providers.wait_handler import WaitHandler
+
+
+class SourceHandler:
+    """
+    Static methods which traverses a profile source, as declared by its endpoint in config.json, and yields its
+    profile cards as records.
+
+    Attributes
+    ----------
+        __SCROLL_SCRIPT  JavaScript which scrolls to the bottom of the page, and notifies the page even if a shortened
+                         list leaves nothing to scroll
+
+    Methods
+    -------
+        get_fields(endpoint: str, connect: bool = False) -> dict[str, dict]:
+            Provides the fields of an endpoint's profile cards.
+        __find_list(endpoint: str):
+            Locates the list element which contains the profile cards of an infinite scroll source.
+        __paginate(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+            Yields the profile cards of every page, one page at a time.
+        __scroll(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+            Yields the profile cards of a list which loads more cards when scrolled to the bottom.
+        relocate(endpoint: str, link: str, fields: dict[str, dict]) -> Optional[dict]:
+            Extracts the card of a profile again from the current page, using its link as a stable key.
+        iterate(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+            Yields the profile cards of a source, using the strategy value of the endpoint in config.json.
+    """
+
+    __SCROLL_SCRIPT = 'window.scrollTo(0, document.body.scrollHeight); window.dispatchEvent(new Event("scroll"));'
+
+    @staticmethod
+    def get_fields(endpoint: str, connect: bool = False) -> dict[str, dict]:
+        """
+        Provides the fields of an endpoint's profile cards.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param bool connect: Specify whether to extract the fields required to connect to the profiles
+        :returns: The field specifications, keyed by the record key
+        :rtype: dict[str, dict]
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+
+        fields = {
+            'name': ExtractionHandler.field('.' + configuration['nameClass'], depth=configuration['nameDepth']),
+            'headline': ExtractionHandler.field('.' + configuration['headlineClass']),
+            'link': ExtractionHandler.field('.' + configuration['linkClass'], depth=configuration['linkDepth'],
+                                            attribute='href'),
+        }
+
+        if connect:
+            fields['button'] = ExtractionHandler.field('button', attribute='element', last=configuration['lastButton'])
+            fields['buttonText'] = ExtractionHandler.field('button span', last=configuration['lastButton'])
+
+            if 'degreeClass' in configuration:
+                fields['degree'] = ExtractionHandler.field('.' + configuration['degreeClass'])
+
+        return fields
+
+    @staticmethod
+    def __find_list(endpoint: str):
+        """
+        Locates the list element which contains the profile cards of an infinite scroll source, scoped to the section
+        titled headerInnerHTML if the endpoint declares one.
+
+        :param str endpoint: Specify the endpoint name, e.g. suggestions
+        :returns: The list element
+        :rtype: WebElement
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+
+        driver = DriverHandler.get_driver()
+
+        if 'headerInnerHTML' not in configuration:
+            return driver.find_element(By.CLASS_NAME, configuration['listClass'])
+
+        section = driver.find_element(
+            By.XPATH,
+            ConfigurationHandler.get_locators(endpoint)['headerInnerHTML']
+        ).find_element(By.XPATH, '..').find_element(By.XPATH, '..')
+
+        return section.find_element(By.CLASS_NAME, configuration['listClass'])
+
+    @staticmethod
+    def __paginate(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+        """
+        Yields the profile cards of every page, one page at a time. The checkpoint is saved once every card of a page
+        was consumed.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str url: Specify the URL of the first page, without the pagination query string
+        :param str target: Specify the checkpoint target, e.g. the profile name
+        :param dict[str, dict] fields: Specify the fields to extract
+        :param dict checkpoint: Specify the checkpoint to continue from, updated in place
+        :returns: The profile cards
+        :rtype: Iterator[dict]
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+
+        driver = DriverHandler.get_driver()
+
+        separator = '&' if '?' in url else '?'
+        pagination = checkpoint.get('page', 0) + 1
+        checkpoint.setdefault('paginationThreshold', 100)
+
+        def load(page: int) -> list[dict]:
+            driver.get(f'{url}{separator}{configuration["paginationURL"]}={page}')
+            ResilienceHandler.check()
+
+            WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']).until(
+                EC.presence_of_element_located(
+                    (By.CLASS_NAME, configuration['buttonClass'])
+                ))
+
+            people_list = driver.find_element(By.CLASS_NAME, configuration['listClass'])
+
+            driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+            WaitHandler.every_child_has(people_list, 'li', 'button', configuration['buttonRenderDelay'])
+            WaitHandler.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, '.' + configuration['paginationInnerHTML'] + ' li')
+                ),
+                configuration['paginationDelay']
+            )
+
+            # A single page of results has no pagination control
+            pages = driver.find_elements(By.CLASS_NAME, configuration['paginationInnerHTML'])
+            checkpoint['paginationThreshold'] = \
+                int(pages[0]
+                    .find_elements(By.TAG_NAME, 'li')[-1]
+                    .find_elements(By.CSS_SELECTOR, '*')[0]
+                    .find_elements(By.CSS_SELECTOR, '*')[0]
+                    .get_attribute('innerText')) if pages else page
+
+            driver.execute_script('window.scrollTo(0, 0);')
+            return ExtractionHandler.extract_cards(people_list, fields, name=endpoint)
+
+        while pagination <= checkpoint['paginationThreshold']:
+            with MetricsHandler.span(f'page.{endpoint}'):
+                people = ResilienceHandler.retry(lambda: load(pagination), name=f'page.{endpoint}')
+
+            yield from people
+
+            checkpoint['page'] = pagination
+            CheckpointHandler.save(endpoint, target, checkpoint)
+
+            pagination += 1
+
+    @staticmethod
+    def __scroll(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+        """
+        Yields the profile cards of a list which loads more cards when scrolled to the bottom. The checkpoint is saved
+        once every card of a batch was consumed. A consumer which removes a card from the list sets its 'removed' key,
+        so that the remaining cards are not skipped, and more cards are requested even if the shortened list reached
+        the bottom of the page.
+
+        :param str endpoint: Specify the endpoint name, e.g. companyPeople
+        :param str url: Specify the URL of the page
+        :param str target: Specify the checkpoint target, e.g. the company name
+        :param dict[str, dict] fields: Specify the fields to extract
+        :param dict checkpoint: Specify the checkpoint to continue from, updated in place
+        :returns: The profile cards
+        :rtype: Iterator[dict]
+        """
+        configuration = ConfigurationHandler.get_configuration()['endpoints'][endpoint]
+
+        driver = DriverHandler.get_driver()
+
+        def load():
+            driver.get(url)
+            ResilienceHandler.check()
+
+            WebDriverWait(driver, ConfigurationHandler.get_configuration()['webLoadDelay']) \
+                .until(EC.presence_of_element_located((By.CLASS_NAME, configuration['nameClass'])))
+
+        with MetricsHandler.span(f'page.{endpoint}'):
+            ResilienceHandler.retry(load, name=f'page.{endpoint}')
+
+        # The legacy extraction mode has no in-page observer, it re-queries the list from the checkpoint index
+        drain = ConfigurationHandler.get_configuration()['extractionMode'] == ExtractionModes.BATCH.value
+
+        counter = checkpoint.setdefault('index', 0)
+        collected = 0
+        prev_len = counter
+        removed = 0
+        checkpoint.setdefault('completed', False)
+
+        def extract() -> tuple:
+            found_list = SourceHandler.__find_list(endpoint)
+
+            if drain:
+                return found_list, ExtractionHandler.drain_cards(found_list, fields, endpoint)
+
+            return found_list, ExtractionHandler.extract_cards(found_list, fields, start=counter, name=endpoint)
+
+        while not checkpoint['completed']:
+            with MetricsHandler.span(f'scroll.{endpoint}'):
+                # The list is located again if it was re-rendered meanwhile
+                people_list, people = ResilienceHandler.retry(extract, name=f'scroll.{endpoint}')
+
+                if drain:
+                    collected += len(people)
+                    # Cards before the checkpoint index were consumed by a previous run
+                    people = people[len(people) - max(collected - counter, 0):]
+                    people_count = max(collected, counter)
+                else:
+                    people_count = counter + len(people)
+
+            yield from people
+
+            exhausted = prev_len == people_count
+
+            # Cards removed by the consumer, e.g. withdrawn invitations, shorten the list, and shift the index of the
+            # remaining ones
+            batch_removed = sum(1 for person in people if person.get('removed'))
+            removed += batch_removed
+            if not drain:
+                people_count -= batch_removed
+
+            counter = people_count
+
+            with MetricsHandler.span(f'scroll.{endpoint}'):
+                if exhausted:
+                    if not removed and driver.execute_script(
+                            'return (window.innerHeight + window.scrollY) >= document.body.scrollHeight;'):
+                        checkpoint['completed'] = True
+                    elif drain:
+                        driver.execute_script(SourceHandler.__SCROLL_SCRIPT)
+                        WaitHandler.until(lambda _: ExtractionHandler.count_pending(endpoint) > 0,
+                                          configuration['scrollDelay'])
+                    else:
+                        loaded = driver.execute_script('return arguments[0].getElementsByTagName("li").length;',
+                                                       people_list)
+                        driver.execute_script(SourceHandler.__SCROLL_SCRIPT)
+                        WaitHandler.children_exceed(people_list, 'li', loaded, configuration['scrollDelay'])
+
+                    removed = 0
+
+            checkpoint['index'] = counter
+            CheckpointHandler.save(endpoint, target, checkpoint)
+
+            prev_len = people_count
+
+    @staticmethod
+    def relocate(endpoint: str, link: str, fields: dict[str, dict]) -> Optional[dict]:
+        """
+        Extracts the card of a profile again from the current page, using its link as a stable key, e.g. once the
+        list was re-rendered and the elements of the card went stale. Uses a single script call regardless of the
+        extractionMode value in config.json.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str link: Specify the profile link, without the query string
+        :param dict[str, dict] fields: Specify the fields to extract
+        :returns: The card's record, None if the card is no longer rendered
+        :rtype: Optional[dict]
+        """
+        people = ExtractionHandler.extract_cards(SourceHandler.__find_list(endpoint), fields,
+                                                 mode=ExtractionModes.BATCH.value)
+
+        for person in people:
+            if person['link'] and person['link'].split('?')[0] == link:
+                return person
+
+        return None
+
+    @staticmethod
+    def iterate(endpoint: str, url: str, target: str, fields: dict[str, dict], checkpoint: dict) -> Iterator[dict]:
+        """
+        Yields the profile cards of a source, using the strategy value of the endpoint in config.json. The query
+        string of every link is dropped. Stopping the iteration midway leaves the checkpoint at the last completed
+        page or batch.
+
+        :param str endpoint: Specify the endpoint name, e.g. peopleSearch
+        :param str url: Specify the URL of the source
+        :param str target: Specify the checkpoint target, e.g. the company name, the profile name or the URL
+        :param dict[str, dict] fields: Specify the fields to extract
+        :param dict checkpoint: Specify the checkpoint to continue from, updated in place, keys added by the consumer
+                                (e.g. the number of written profiles) are saved along
+        :returns: The profile cards, a consumer which removes a card from the list sets its 'removed' key to True
+        :rtype: Iterator[dict]
+        :raises ValueError: if the endpoint's strategy is not supported
+        """
+        strategy = ConfigurationHandler.get_configuration()['endpoints'][endpoint]['strategy']
+
+        if strategy == SourceStrategies.PAGINATION.value:
+            records = SourceHandler.__paginate(endpoint, url, target, fields, checkpoint)
+        elif strategy == SourceStrategies.INFINITE_SCROLL.value:
+            records = SourceHandler.__scroll(endpoint, url, target, fields, checkpoint)
+        else:
+            raise ValueError(f'unsupported source strategy: {strategy}')
+
+        for record in records:
+            if record['link']:
+                record['link'] = record['link'].split('?')[0]
+            yield record
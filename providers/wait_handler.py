@@ -0,0 +1,155 @@
+from typing import Callable
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+from providers.configuration_handler import ConfigurationHandler
+from providers.driver_handler import DriverHandler
+from providers.metrics_handler import MetricsHandler
+
+
+class WaitHandler:
+    """
+    Static methods which waits for DOM conditions, where the configured delays only act as upper bounds.
+
+    Methods
+    -------
+        until(condition: Callable, timeout: float) -> bool:
+            Waits until a condition is met or the timeout elapses.
+        element(locator: tuple[str, str], timeout: float, condition: Callable = EC.element_to_be_clickable)
+        -> WebElement:
+            Waits until an element satisfies a condition, throws an exception when times out.
+        element_gone(element: WebElement, timeout: float) -> bool:
+            Waits until an element is hidden or detached from the document.
+        text_changed(element: WebElement, text: str, timeout: float) -> bool:
+            Waits until an element's text differs from the specified text, or it is detached from the document.
+        children_exceed(container: WebElement, tag_name: str, count: int, timeout: float) -> bool:
+            Waits until the number of descendants of a container with the specified tag exceeds a count.
+        every_child_has(container: WebElement, tag_name: str, selector: str, timeout: float) -> bool:
+            Waits until every descendant of a container with the specified tag contains an element matching a
+            selector.
+    """
+
+    @staticmethod
+    def until(condition: Callable, timeout: float) -> bool:
+        """
+        Waits until a condition is met or the timeout elapses.
+
+        :param Callable condition: Specify the condition, receives the web driver and returns a truthful value when met
+        :param float timeout: Specify the maximum number of seconds to wait
+        :returns: Whether the condition was met before the timeout elapsed
+        :rtype: bool
+        """
+        if timeout <= 0:
+            return False
+
+        try:
+            with MetricsHandler.span('wait'):
+                WebDriverWait(
+                    DriverHandler.get_driver(),
+                    timeout,
+                    poll_frequency=ConfigurationHandler.get_configuration()['waitPollFrequency'],
+                    ignored_exceptions=(StaleElementReferenceException,)
+                ).until(condition)
+            return True
+        except TimeoutException:
+            return False
+
+    @staticmethod
+    def element(locator: tuple[str, str], timeout: float,
+                condition: Callable = EC.element_to_be_clickable) -> WebElement:
+        """
+        Waits until an element satisfies a condition, throws an exception when times out.
+
+        :param tuple[str, str] locator: Specify the element's locator, e.g. (By.XPATH, '//button')
+        :param float timeout: Specify the maximum number of seconds to wait
+        :param Callable condition: Specify the expected condition which receives the locator
+        :returns: The located element
+        :rtype: WebElement
+        :raises TimeoutException: if the element did not satisfy the condition in time
+        """
+        with MetricsHandler.span('wait'):
+            return WebDriverWait(
+                DriverHandler.get_driver(),
+                timeout,
+                poll_frequency=ConfigurationHandler.get_configuration()['waitPollFrequency']
+            ).until(condition(locator))
+
+    @staticmethod
+    def element_gone(element: WebElement, timeout: float) -> bool:
+        """
+        Waits until an element is hidden or detached from the document.
+
+        :param WebElement element: Specify the element
+        :param float timeout: Specify the maximum number of seconds to wait
+        :returns: Whether the element was gone before the timeout elapsed
+        :rtype: bool
+        """
+        return WaitHandler.until(EC.invisibility_of_element(element), timeout)
+
+    @staticmethod
+    def text_changed(element: WebElement, text: str, timeout: float) -> bool:
+        """
+        Waits until an element's text differs from the specified text, or it is detached from the document.
+
+        :param WebElement element: Specify the element
+        :param str text: Specify the element's current text
+        :param float timeout: Specify the maximum number of seconds to wait
+        :returns: Whether the text changed before the timeout elapsed
+        :rtype: bool
+        """
+        return WaitHandler.until(
+            lambda driver: driver.execute_script(
+                'return !arguments[0].isConnected || arguments[0].innerText.trim() !== arguments[1];',
+                element,
+                text
+            ),
+            timeout
+        )
+
+    @staticmethod
+    def children_exceed(container: WebElement, tag_name: str, count: int, timeout: float) -> bool:
+        """
+        Waits until the number of descendants of a container with the specified tag exceeds a count.
+
+        :param WebElement container: Specify the container element
+        :param str tag_name: Specify the descendants' tag name
+        :param int count: Specify the count to exceed
+        :param float timeout: Specify the maximum number of seconds to wait
+        :returns: Whether the count was exceeded before the timeout elapsed
+        :rtype: bool
+        """
+        return WaitHandler.until(
+            lambda driver: driver.execute_script(
+                'return arguments[0].getElementsByTagName(arguments[1]).length > arguments[2];',
+                container,
+                tag_name,
+                count
+            ),
+            timeout
+        )
+
+    @staticmethod
+    def every_child_has(container: WebElement, tag_name: str, selector: str, timeout: float) -> bool:
+        """
+        Waits until every descendant of a container with the specified tag contains an element matching a selector.
+
+        :param WebElement container: Specify the container element
+        :param str tag_name: Specify the descendants' tag name
+        :param str selector: Specify the CSS selector which should be matched inside every descendant
+        :param float timeout: Specify the maximum number of seconds to wait
+        :returns: Whether every descendant matched before the timeout elapsed
+        :rtype: bool
+        """
+        return WaitHandler.until(
+            lambda driver: driver.execute_script(
+                'return Array.from(arguments[0].getElementsByTagName(arguments[1]))'
+                '.every(child => child.querySelector(arguments[2]) !== null);',
+                container,
+                tag_name,
+                selector
+            ),
+            timeout
+        )